@@ -0,0 +1,101 @@
+"""
+Measures the time it takes to import the scraper in a fresh interpreter
+(the cold start of short-lived jobs) and checks it against a budget.
+
+Usage (from the repository root):
+
+    python -m benchmarks.import_time [--runs 10] [--output PATH]
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+from typing import Any, Dict, List
+
+
+# the maximum median time (in seconds) to import the scraper
+IMPORT_TIME_BUDGET = 0.25
+
+# the heavy dependencies that must only be imported when they're first used
+LAZY_MODULES = ["aiohttp", "bs4", "numpy", "pandas", "pyarrow", "requests", "yaml"]
+
+RESULTS_PATH = Path(__file__).resolve().parent / "results" / "import_time.json"
+
+MEASURE_CODE = f"""
+import json, sys, time
+start = time.perf_counter()
+import src.core.scraper
+elapsed = time.perf_counter() - start
+loaded = [name for name in {LAZY_MODULES!r} if name in sys.modules]
+print(json.dumps({{"seconds": elapsed, "loaded": loaded}}))
+"""
+
+
+def measure_import(root: Path) -> Dict[str, Any]:
+    """
+    Imports the scraper in a fresh interpreter.
+
+    Args:
+        root (Path): the repository root.
+
+    Returns:
+        Dict[str, Any]: the import time (in seconds) and the heavy
+            dependencies that were imported.
+    """
+    output = subprocess.run(
+        [sys.executable, "-c", MEASURE_CODE],
+        cwd=root,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def run_benchmark(runs: int) -> Dict[str, Any]:
+    """
+    Measures the import time several times (the first run warms up
+    the bytecode cache and isn't counted).
+
+    Args:
+        runs (int): the number of measured runs.
+
+    Returns:
+        Dict[str, Any]: the benchmark results.
+    """
+    root = Path(__file__).resolve().parents[1]
+    measure_import(root)
+    measurements = [measure_import(root) for _ in range(runs)]
+    seconds: List[float] = [measurement["seconds"] for measurement in measurements]
+    loaded = sorted(
+        set().union(*[measurement["loaded"] for measurement in measurements])
+    )
+    median = statistics.median(seconds)
+
+    return {
+        "runs": runs,
+        "median_seconds": round(median, 4),
+        "min_seconds": round(min(seconds), 4),
+        "max_seconds": round(max(seconds), 4),
+        "budget_seconds": IMPORT_TIME_BUDGET,
+        "eagerly_loaded": loaded,
+        "passed": median <= IMPORT_TIME_BUDGET and len(loaded) == 0,
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--output", type=Path, default=RESULTS_PATH)
+    args = parser.parse_args()
+
+    results = run_benchmark(args.runs)
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(json.dumps(results, indent=4) + "\n", encoding="utf-8")
+    print(json.dumps(results, indent=4))
+
+    if not results["passed"]:
+        sys.exit(1)
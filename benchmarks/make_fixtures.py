@@ -0,0 +1,503 @@
+"""
+Creates the offline page corpus used by the benchmarks and the local server.
+
+The pages are synthetic: they follow the HTML structure of Numbeo's pages
+(the tables, classes and styles read by the extractors), filled with
+deterministic values, so the corpus is always the same and the benchmarks
+never request numbeo.com.
+
+Usage (from the repository root):
+
+    python -m benchmarks.make_fixtures
+"""
+
+import json
+import random
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+from src.core.utils import ITENS_MAPPING, REGIONS_COUNTRIES
+
+
+FIXTURES_PATH = Path(__file__).resolve().parent / "fixtures"
+
+COUNTRY_YEARS = [2023, 2024]
+CITY_RANKINGS_YEARS = [2024]
+CURRENCY = "EUR"
+CURRENCY_SYMBOL = "&#8364;"
+
+CITIES = [
+    ("Amsterdam", "Netherlands"),
+    ("Berlin", "Germany"),
+    ("Lisbon", "Portugal"),
+    ("Rome", "Italy"),
+    ("Sao Paulo", "Brazil"),
+    ("Tokyo", "Japan"),
+    ("Toronto", "Canada"),
+    ("Sydney", "Australia"),
+]
+
+# the other ranked cities (only in the rankings pages)
+RANKED_CITIES = CITIES + [
+    (f"{city} {number}", country)
+    for number in range(1, 41)
+    for city, country in [("Springfield", "United States"), ("Newport", "Wales")]
+]
+
+HISTORICAL_COUNTRIES = ["Brazil", "Italy", "Japan"]
+HISTORICAL_ITEMS = [
+    "Banana (1kg)",
+    "Meal, Inexpensive Restaurant",
+    "Apartment (1 bedroom) in City Centre",
+]
+HISTORICAL_YEARS = range(2012, 2025)
+
+INDICES_COLUMNS = {
+    "cost-of-living": [
+        "Cost of Living Index",
+        "Rent Index",
+        "Cost of Living Plus Rent Index",
+        "Groceries Index",
+        "Restaurant Price Index",
+        "Local Purchasing Power Index",
+    ],
+    "quality-of-life": [
+        "Quality of Life Index",
+        "Purchasing Power Index",
+        "Safety Index",
+        "Health Care Index",
+        "Cost of Living Index",
+        "Property Price to Income Ratio",
+        "Traffic Commute Time Index",
+        "Pollution Index",
+        "Climate Index",
+    ],
+    "crime": ["Crime Index", "Safety Index"],
+    "health-care": ["Health Care Index", "Health Care Exp. Index"],
+    "pollution": ["Pollution Index", "Exp Pollution Index"],
+    "traffic": [
+        "Traffic Index",
+        "Time Index(in minutes)",
+        "Time Exp. Index",
+        "Inefficiency Index",
+        "CO2 Emission Index",
+    ],
+    "property-investment": [
+        "Price To Income Ratio",
+        "Gross Rental Yield City Centre",
+        "Gross Rental Yield Outside of Centre",
+        "Price To Rent Ratio City Centre",
+        "Price To Rent Ratio Outside Of Centre",
+        "Mortgage As A Percentage Of Income",
+        "Affordability Index",
+    ],
+}
+
+COST_OF_LIVING_SECTIONS = {
+    "Restaurants": 8,
+    "Markets": 19,
+    "Transportation": 8,
+    "Utilities (Monthly)": 3,
+    "Sports And Leisure": 3,
+    "Childcare": 2,
+    "Clothing And Shoes": 4,
+    "Rent Per Month": 4,
+    "Buy Apartment Price": 2,
+    "Salaries And Financing": 2,
+}
+
+PROPERTY_INVESTMENT_SECTIONS = {
+    "Buy Apartment Price": 2,
+    "Rent Per Month": 4,
+    "Salaries And Financing": 2,
+}
+
+
+def get_random(*key: object) -> random.Random:
+    """
+    Creates a random generator that always gives the same values for a key.
+
+    Returns:
+        random.Random: the random generator.
+    """
+    return random.Random("|".join(str(value) for value in key))
+
+
+def city_slug(city: str) -> str:
+    """
+    Formats the city's name the same way the scraper does in the URLs.
+
+    Args:
+        city (str): the city's name.
+
+    Returns:
+        str: the formatted city's name.
+    """
+    return "-".join(word.capitalize() for word in city.split())
+
+
+def ranking_page(
+    category: str,
+    year: int,
+    rows: List[Tuple[str, str]],
+    label: str,
+) -> str:
+    """
+    Creates a rankings page (by country or by city).
+
+    Args:
+        category (str): the category.
+        year (int): the year.
+        rows (List[Tuple[str, str]]): the name shown in each row and
+            the name used to draw its values.
+        label (str): the name column ('Country' or 'City').
+
+    Returns:
+        str: the page HTML code.
+    """
+    columns = INDICES_COLUMNS[category]
+    values = {
+        key: [
+            get_random(category, year, key, column).uniform(5, 150)
+            for column in columns
+        ]
+        for _, key in rows
+    }
+    rows = sorted(rows, key=lambda row: -values[row[1]][0])
+    header = "".join(f"<th>{column}</th>" for column in ["Rank", label] + columns)
+    body = "".join(
+        '<tr><td></td><td class="cityOrCountryInIndicesTable">'
+        + f'<a href="#">{name}</a></td>'
+        + "".join(
+            f'<td style="text-align: right">{value:.2f}</td>' for value in values[key]
+        )
+        + "</tr>\n"
+        for name, key in rows
+    )
+    return (
+        f"<html><head><title>{category} {year}</title></head><body>"
+        + '<div class="header"><table><tr><td>Menu</td></tr></table></div>'
+        + '<table id="t2" class="stripe row-border order-column compact">'
+        + f"<thead><tr>{header}</tr></thead><tbody>\n{body}</tbody></table>"
+        + "</body></html>"
+    )
+
+
+def historical_page(
+    item: str,
+    country: str,
+) -> str:
+    """
+    Creates a historical data page of an item.
+
+    Args:
+        item (str): the item.
+        country (str): the country.
+
+    Returns:
+        str: the page HTML code.
+    """
+    generator = get_random(item, country)
+    price = generator.uniform(1, 900)
+    body = ""
+
+    for year in HISTORICAL_YEARS:
+        price = price * generator.uniform(0.95, 1.12)
+        body += (
+            f'<tr><td>{year}</td><td style="text-align: right">{price:.2f}</td></tr>'
+        )
+
+    return (
+        "<html><body>"
+        + f'<table id="t2"><thead><tr><th>Year</th><th>{item}</th></tr></thead>'
+        + f"<tbody>{body}</tbody></table></body></html>"
+    )
+
+
+def prices_page(
+    category: str,
+    city: str,
+) -> str:
+    """
+    Creates a cost of living (or property investment) city page.
+
+    Args:
+        category (str): the category.
+        city (str): the city's name.
+
+    Returns:
+        str: the page HTML code.
+    """
+    generator = get_random(category, city)
+    sections = COST_OF_LIVING_SECTIONS
+
+    if category == "property-investment":
+        sections = PROPERTY_INVESTMENT_SECTIONS
+
+    items = iter(list(ITENS_MAPPING.keys()) * 2)
+    table = '<table class="data_wide_table new_bar_table">'
+
+    for section, length in sections.items():
+        table += (
+            f'<tr><th><div class="category_title">{section}</div>\n</th>'
+            + "<th>Edit</th><th>Range</th></tr>"
+        )
+
+        for index in range(length):
+            mean = generator.uniform(0.5, 5000)
+            table += (
+                f"<tr><td>{next(items)}</td>"
+                + f'<td class="priceValue">{mean:,.2f}&nbsp;{CURRENCY_SYMBOL}</td>'
+            )
+
+            # a few items don't have a range
+            if index < length - 1:
+                table += (
+                    f'<td class="priceBarTd">\n{mean * 0.8:,.2f}'
+                    + f"-{mean * 1.3:,.2f}\n</td>"
+                )
+
+            table += "</tr>"
+
+    return f"<html><body><h1>{city}</h1>{table}</table></body></html>"
+
+
+def quality_of_life_page(city: str) -> str:
+    """
+    Creates a quality of life city page.
+
+    Args:
+        city (str): the city's name.
+
+    Returns:
+        str: the page HTML code.
+    """
+    generator = get_random("quality-of-life", city)
+    rows = ""
+
+    for label in INDICES_COLUMNS["quality-of-life"][1:]:
+        rows += (
+            f'<tr><td><a class="discreet_link" href="#">{label}</a>:</td>'
+            + f'<td style="text-align: right">{generator.uniform(5, 150):.2f}</td>'
+            + '<td style="text-align: center; font-weight: 600">Moderate</td></tr>'
+        )
+
+    return (
+        '<html><body><a class="discreet_link" href="/">Numbeo</a><table>'
+        + '<tr><td style="text-align: right">Index</td></tr>'
+        + rows
+        + "<tr><td>Quality of Life Index:</td>"
+        + f'<td style="text-align: right">{generator.uniform(50, 200):.2f}</td>'
+        + '<td style="text-align: center">High</td></tr></table>'
+        + '<a class="discreet_link" href="/about">About</a></body></html>'
+    )
+
+
+def indices_table(
+    category: str,
+    city: str,
+) -> str:
+    """
+    Creates the indices table of a city page.
+
+    Args:
+        category (str): the category.
+        city (str): the city's name.
+
+    Returns:
+        str: the table HTML code.
+    """
+    generator = get_random("indices", category, city)
+    rows = "".join(
+        f"<tr><td>{index}:</td>"
+        + f'<td style="text-align: right">{generator.uniform(5, 95):.2f}</td></tr>'
+        for index in INDICES_COLUMNS[category]
+    )
+    return f'<table class="table_indices">{rows}</table>'
+
+
+def traffic_page(city: str) -> str:
+    """
+    Creates a traffic city page.
+
+    Args:
+        city (str): the city's name.
+
+    Returns:
+        str: the page HTML code.
+    """
+    generator = get_random("traffic", city)
+    page = "<html><body>"
+
+    for header in [
+        "Main Means of Transportation to Work or School",
+        "Average when primarily using Car",
+        "Average when primarily using Bus/Trolleybus",
+    ]:
+        page += f"<h3>{header}</h3><table>"
+
+        for means in ["Walking", "Car", "Bicycle", "Bus/Trolleybus", "Train/Metro"]:
+            page += (
+                f'<tr><td class="trafficCaptionTd">{means}</td>'
+                + f'<td class="trafficTd">{generator.uniform(1, 60):.2f}</td></tr>'
+            )
+
+        page += "</table>"
+
+    page += "<table><tr><td>Footer</td></tr></table>"
+    return page + indices_table("traffic", city) + "</body></html>"
+
+
+def indices_page(
+    category: str,
+    city: str,
+) -> str:
+    """
+    Creates a crime, health care or pollution city page.
+
+    Args:
+        category (str): the category.
+        city (str): the city's name.
+
+    Returns:
+        str: the page HTML code.
+    """
+    generator = get_random(category, city)
+    page = "<html><body>"
+
+    for header in [f"{category.title()} in {city}", f"Perception in {city}"]:
+        page += (
+            f"<h2>{header}</h2><table "
+            + 'class="table_builder_with_value_explanation data_wide_table">'
+        )
+
+        for index in range(12):
+            value = generator.uniform(5, 95)
+            page += (
+                f'<tr><td class="columnWithName">{header} question {index}</td>'
+                + f'<td class="indexValueTd">{value:.2f}</td>'
+                + '<td class="hidden_on_small_mobile">Moderate</td></tr>'
+            )
+
+        page += "</table>"
+
+    page += indices_table(category, city)
+
+    if category == "pollution":
+        page += (
+            '<table class="who_pollution_data_widget">'
+            + '<tr><td>PM10:</td><td style="text-align: right">20.00</td></tr>'
+            + '<tr><td>PM2.5:</td><td style="text-align: right">10.00</td></tr>'
+            + '<tr><td>Level:</td><td style="text-align: right">Yellow</td></tr>'
+            + "</table>"
+        )
+
+    return page + "</body></html>"
+
+
+def city_page(
+    category: str,
+    city: str,
+) -> str:
+    """
+    Creates a 'city' mode page.
+
+    Args:
+        category (str): the category.
+        city (str): the city's name.
+
+    Returns:
+        str: the page HTML code.
+    """
+    if category in ["cost-of-living", "property-investment"]:
+        return prices_page(category, city)
+
+    if category == "quality-of-life":
+        return quality_of_life_page(city)
+
+    if category == "traffic":
+        return traffic_page(city)
+
+    return indices_page(category, city)
+
+
+def make_pages() -> Dict[str, Tuple[str, str]]:
+    """
+    Creates all the pages of the corpus.
+
+    Returns:
+        Dict[str, Tuple[str, str]]: the file path (relative to the fixtures
+            folder) and the HTML code of each page URL (without the domain).
+    """
+    pages = {}
+    countries = [
+        (country, country)
+        for region in REGIONS_COUNTRIES.values()
+        for country in region
+    ]
+
+    for category in INDICES_COLUMNS:
+        for year in COUNTRY_YEARS:
+            url = f"/{category}/rankings_by_country.jsp?title={year}"
+            pages[url] = (
+                f"country/{category}/{year}.html",
+                ranking_page(category, year, countries, "Country"),
+            )
+
+        for year in CITY_RANKINGS_YEARS:
+            url = f"/{category}/rankings.jsp?title={year}"
+            rows = [(f"{city}, {country}", city) for city, country in RANKED_CITIES]
+            pages[url] = (
+                f"city-rankings/{category}/{year}.html",
+                ranking_page(category, year, rows, "City"),
+            )
+
+        for city, _ in CITIES:
+            url = f"/{category}/in/{city_slug(city)}"
+
+            if category in ["cost-of-living", "property-investment"]:
+                url = url + f"?displayCurrency={CURRENCY}"
+
+            pages[url] = (
+                f"city/{category}/{city_slug(city)}.html",
+                city_page(category, city),
+            )
+
+    for country in HISTORICAL_COUNTRIES:
+        for item in HISTORICAL_ITEMS:
+            url = (
+                "/cost-of-living/historical-data-country"
+                + f"?itemId={ITENS_MAPPING[item]}&country={country}"
+                + f"&currency={CURRENCY}"
+            )
+            pages[url] = (
+                f"historical-data/{country}/{ITENS_MAPPING[item]}.html",
+                historical_page(item, country),
+            )
+
+    return pages
+
+
+def write_fixtures(path: Path = FIXTURES_PATH) -> None:
+    """
+    Writes the corpus pages and its index (the file of each page URL).
+
+    Args:
+        path (Path, optional): the fixtures folder. Defaults to FIXTURES_PATH.
+    """
+    index = {}
+
+    for url, (file_name, page) in make_pages().items():
+        file_path = path / file_name
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        file_path.write_text(page, encoding="utf-8")
+        index[url] = file_name
+
+    (path / "index.json").write_text(
+        json.dumps(index, indent=4, sort_keys=True) + "\n",
+        encoding="utf-8",
+    )
+
+
+if __name__ == "__main__":
+    write_fixtures()
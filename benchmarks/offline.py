@@ -0,0 +1,489 @@
+"""
+Measures the throughput (pages and rows per second) and the peak memory of
+the extractors and of the scraper methods, using the offline page corpus
+(see `benchmarks/make_fixtures.py`), so numbeo.com is never requested.
+
+Usage (from the repository root):
+
+    python -m benchmarks.offline [--repeat 5] [--backend lxml] [--output PATH]
+
+The results are saved as JSON (by default in `benchmarks/results/offline.json`)
+and compared with the previous results, so the regressions show up as diffs.
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit, urlunsplit
+
+from src.core import extractors
+from src.core.frames import columns_length
+from src.core.log import configure_logging
+from src.core.parser import parse_page
+from src.core.scraper import NumbeoScraper
+from src.schema.input import Input
+from src.schema.log import LoggingSettings
+from src.schema.parser import ParserSettings
+
+from .make_fixtures import (
+    CITIES,
+    CITY_RANKINGS_YEARS,
+    COUNTRY_YEARS,
+    CURRENCY,
+    FIXTURES_PATH,
+    HISTORICAL_COUNTRIES,
+    HISTORICAL_ITEMS,
+    INDICES_COLUMNS,
+)
+
+
+RESULTS_PATH = Path(__file__).resolve().parent / "results" / "offline.json"
+
+CATEGORIES = list(INDICES_COLUMNS.keys())
+
+# a benchmark runs once and returns the number of pages and rows it processed
+Benchmark = Callable[[], Tuple[int, int]]
+
+
+def load_fixtures(path: Path = FIXTURES_PATH) -> Dict[str, str]:
+    """
+    Reads all the pages of the corpus.
+
+    Args:
+        path (Path, optional): the fixtures folder. Defaults to FIXTURES_PATH.
+
+    Returns:
+        Dict[str, str]: the HTML code of each page URL (without the domain).
+    """
+    index = json.loads((path / "index.json").read_text(encoding="utf-8"))
+    return {
+        url: (path / file_name).read_text(encoding="utf-8")
+        for url, file_name in index.items()
+    }
+
+
+class FixtureScraper(NumbeoScraper):
+    """
+    A scraper that reads the pages from the offline corpus instead of
+    requesting them, so only the extraction and the dataframes are measured.
+    """
+
+    def __init__(
+        self,
+        config: Input,
+        pages: Dict[str, str],
+        **kwargs: Any,
+    ) -> None:
+        """
+        Args:
+            config (Input): the scraper config.
+            pages (Dict[str, str]): the HTML code of each page URL
+                (without the domain).
+        """
+        super().__init__(config=config, **kwargs)
+        self.pages = pages
+
+    def _fetch_page(
+        self,
+        full_url: str,
+    ) -> Optional[str]:
+        """
+        Gets a page from the corpus.
+
+        Args:
+            full_url (str): the page URL.
+
+        Returns:
+            Optional[str]: the page HTML code or None if it isn't in the corpus.
+        """
+        parts = urlsplit(full_url)
+        return self.pages.get(urlunsplit(("", "", parts.path, parts.query, "")))
+
+
+def extractor_benchmark(
+    pages: Dict[str, str],
+    prefix: str,
+    extractor: Callable[..., Dict[str, List[Any]]],
+    backend: str,
+) -> Benchmark:
+    """
+    Creates the benchmark of an extractor, which extracts all the corpus
+    pages whose URL starts with a prefix.
+
+    Args:
+        pages (Dict[str, str]): the corpus pages.
+        prefix (str): the URL prefix.
+        extractor (Callable[..., Dict[str, List[Any]]]): the extractor.
+        backend (str): the parser backend.
+
+    Returns:
+        Benchmark: the benchmark function.
+    """
+    selected_pages = [page for url, page in pages.items() if url.startswith(prefix)]
+
+    def run() -> Tuple[int, int]:
+        rows = 0
+
+        for page in selected_pages:
+            rows += columns_length(extractor(page=page, backend=backend))
+
+        return len(selected_pages), rows
+
+    return run
+
+
+def tables_benchmark(
+    pages: Dict[str, str],
+    backend: str,
+) -> Benchmark:
+    """
+    Creates the benchmark of the `get_tables_city_mode` function, using the
+    tables of the crime pages (which are parsed beforehand).
+
+    Args:
+        pages (Dict[str, str]): the corpus pages.
+        backend (str): the parser backend.
+
+    Returns:
+        Benchmark: the benchmark function.
+    """
+    parsed_pages = [
+        parse_page(page, backend=backend)
+        for url, page in pages.items()
+        if url.startswith("/crime/in/")
+    ]
+    tables = [
+        (
+            parsed_page.find_all("h2"),
+            parsed_page.find_all(
+                "table",
+                attrs={"class": "table_builder_with_value_explanation data_wide_table"},
+            ),
+        )
+        for parsed_page in parsed_pages
+    ]
+
+    def run() -> Tuple[int, int]:
+        rows = 0
+
+        for tables_headers, page_tables in tables:
+            rows += columns_length(
+                extractors.get_tables_city_mode(
+                    tables_headers=tables_headers,
+                    tables=page_tables,
+                    attributes_class_name="columnWithName",
+                    attributes_values_class_name="indexValueTd",
+                    levels_class_name="hidden_on_small_mobile",
+                )
+            )
+
+        return len(tables), rows
+
+    return run
+
+
+def scraper_benchmark(
+    pages: Dict[str, str],
+    config: Dict[str, Any],
+    method: str,
+    backend: str,
+    **kwargs: Any,
+) -> Benchmark:
+    """
+    Creates the benchmark of a scraper method.
+
+    Args:
+        pages (Dict[str, str]): the corpus pages.
+        config (Dict[str, Any]): the scraper config values.
+        method (str): the scraper method name.
+        backend (str): the parser backend.
+
+    Returns:
+        Benchmark: the benchmark function.
+    """
+    requested_pages = set()
+
+    class CountingScraper(FixtureScraper):
+        def _fetch_page(self, full_url: str) -> Optional[str]:
+            requested_pages.add(full_url)
+            return super()._fetch_page(full_url)
+
+    def run() -> Tuple[int, int]:
+        scraper = CountingScraper(
+            config=Input(**config),
+            pages=pages,
+            parser_settings=ParserSettings(backend=backend),
+        )
+        requested_pages.clear()
+        result = getattr(scraper, method)(**kwargs)
+
+        if method in ["scrap", "_iter_city_rankings_mode"]:
+            rows = sum(dataframe.shape[0] for _, dataframe in result)
+        else:
+            rows = result.shape[0]
+
+        return len(requested_pages), rows
+
+    return run
+
+
+def corpus_configs() -> Dict[str, Dict[str, Any]]:
+    """
+    Gets the scraper config values that request all the corpus pages
+    of each mode.
+
+    Returns:
+        Dict[str, Dict[str, Any]]: the config values of each mode.
+    """
+    return {
+        "country": dict(categories=CATEGORIES, mode="country", years=COUNTRY_YEARS),
+        "historical-data": dict(
+            categories="historical-data",
+            mode="country",
+            years=COUNTRY_YEARS,
+            countries=HISTORICAL_COUNTRIES,
+            historical_items=HISTORICAL_ITEMS,
+            currency=CURRENCY,
+        ),
+        "city": dict(
+            categories=CATEGORIES,
+            mode="city",
+            years=COUNTRY_YEARS[-1],
+            cities=[city for city, _ in CITIES],
+            currency=CURRENCY,
+        ),
+        "city-rankings": dict(
+            categories=CATEGORIES,
+            mode="city-rankings",
+            years=CITY_RANKINGS_YEARS,
+        ),
+    }
+
+
+def get_benchmarks(
+    pages: Dict[str, str],
+    backend: str,
+) -> Dict[str, Benchmark]:
+    """
+    Creates all the benchmarks.
+
+    Args:
+        pages (Dict[str, str]): the corpus pages.
+        backend (str): the parser backend.
+
+    Returns:
+        Dict[str, Benchmark]: the benchmark function of each name.
+    """
+    configs = corpus_configs()
+    cities = configs["city"]["cities"]
+    benchmarks = {}
+
+    for name, prefix in [
+        ("extract_country_ranking", "/"),
+        ("extract_city_ranking", "/"),
+        ("extract_historical_data", "/cost-of-living/historical-data-country"),
+        ("extract_cost_of_living_city", "/cost-of-living/in/"),
+        ("extract_quality_of_life_city", "/quality-of-life/in/"),
+        ("extract_traffic_city", "/traffic/in/"),
+        ("extract_pollution_city", "/pollution/in/"),
+        ("extract_others_city", "/crime/in/"),
+    ]:
+        extractor = getattr(extractors, name)
+
+        if name == "extract_country_ranking":
+            prefix_pages = {
+                url: page
+                for url, page in pages.items()
+                if "rankings_by_country.jsp" in url
+            }
+        elif name == "extract_city_ranking":
+            prefix_pages = {
+                url: page for url, page in pages.items() if "rankings.jsp" in url
+            }
+        else:
+            prefix_pages = pages
+
+        benchmarks[name] = extractor_benchmark(prefix_pages, prefix, extractor, backend)
+
+    benchmarks["get_tables_city_mode"] = tables_benchmark(pages, backend)
+
+    for category in CATEGORIES:
+        benchmarks[f"_country_mode[{category}]"] = scraper_benchmark(
+            pages,
+            configs["country"],
+            "_country_mode",
+            backend,
+            category=category,
+            regions=[None],
+        )
+
+    benchmarks["_historical_data_country_mode"] = scraper_benchmark(
+        pages,
+        configs["historical-data"],
+        "_historical_data_country_mode",
+        backend,
+        itens=HISTORICAL_ITEMS,
+        countries=HISTORICAL_COUNTRIES,
+    )
+
+    for category in CATEGORIES:
+        benchmarks[f"_scrap_city_category[{category}]"] = scraper_benchmark(
+            pages,
+            configs["city"],
+            "_scrap_city_category",
+            backend,
+            category=category,
+            cities=cities,
+        )
+
+    benchmarks["_iter_city_rankings_mode[crime]"] = scraper_benchmark(
+        pages,
+        configs["city-rankings"],
+        "_iter_city_rankings_mode",
+        backend,
+        category="crime",
+    )
+
+    for mode, config in configs.items():
+        benchmarks[f"scrap[{mode}]"] = scraper_benchmark(
+            pages,
+            config,
+            "scrap",
+            backend,
+        )
+
+    return benchmarks
+
+
+def measure(
+    benchmark: Benchmark,
+    repeat: int,
+) -> Dict[str, Any]:
+    """
+    Runs a benchmark several times, measuring its time, and once more
+    measuring its peak memory (which slows it down, so it isn't timed).
+
+    Args:
+        benchmark (Benchmark): the benchmark function.
+        repeat (int): the number of timed runs.
+
+    Returns:
+        Dict[str, Any]: the benchmark results.
+    """
+    seconds = []
+
+    for _ in range(repeat):
+        start = time.perf_counter()
+        pages, rows = benchmark()
+        seconds.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    benchmark()
+    _, peak_memory = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    median = statistics.median(seconds)
+    return {
+        "pages": pages,
+        "rows": rows,
+        "median_seconds": round(median, 5),
+        "pages_per_second": round(pages / median, 1),
+        "rows_per_second": round(rows / median, 1),
+        "peak_memory_mib": round(peak_memory / 2**20, 3),
+    }
+
+
+def compare_results(
+    previous: Dict[str, Any],
+    current: Dict[str, Any],
+) -> List[str]:
+    """
+    Compares the throughput of each benchmark with the previous results.
+
+    Args:
+        previous (Dict[str, Any]): the previous results.
+        current (Dict[str, Any]): the current results.
+
+    Returns:
+        List[str]: one line per benchmark with the throughput change.
+    """
+    lines = []
+
+    for name, results in current["benchmarks"].items():
+        previous_results = previous.get("benchmarks", {}).get(name)
+
+        if previous_results is None:
+            continue
+
+        change = results["pages_per_second"] / previous_results["pages_per_second"]
+        lines.append(f"{name:<45} {100 * (change - 1):+7.1f}% pages/sec")
+
+    return lines
+
+
+def run_benchmarks(
+    repeat: int,
+    backend: str,
+    names: Optional[List[str]] = None,
+) -> Dict[str, Any]:
+    """
+    Runs all the benchmarks (or only the chosen ones).
+
+    Args:
+        repeat (int): the number of timed runs of each benchmark.
+        backend (str): the parser backend.
+        names (Optional[List[str]], optional): the benchmarks that are run.
+            Defaults to None (all the benchmarks).
+
+    Returns:
+        Dict[str, Any]: the results of each benchmark.
+    """
+    # the per-page records (and the repeated warnings) would be measured too
+    configure_logging(LoggingSettings(LOG_LEVEL="ERROR"))
+
+    pages = load_fixtures()
+    benchmarks = get_benchmarks(pages, backend)
+    results = {}
+
+    for name, benchmark in benchmarks.items():
+        if not names is None and not name in names:
+            continue
+
+        benchmark()  # warming up (e.g., the lazy imports)
+        results[name] = measure(benchmark, repeat)
+        print(
+            f"{name:<45} {results[name]['pages_per_second']:>9.1f} pages/sec "
+            + f"{results[name]['rows_per_second']:>11.1f} rows/sec "
+            + f"{results[name]['peak_memory_mib']:>8.3f} MiB"
+        )
+
+    return {
+        "python": platform.python_version(),
+        "backend": backend,
+        "repeat": repeat,
+        "benchmarks": results,
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--backend", default="html.parser")
+    parser.add_argument("--output", type=Path, default=RESULTS_PATH)
+    parser.add_argument("--only", nargs="*", default=None)
+    args = parser.parse_args()
+
+    results = run_benchmarks(args.repeat, args.backend, names=args.only)
+
+    if args.output.exists():
+        previous = json.loads(args.output.read_text(encoding="utf-8"))
+        print("\nChange from the previous results:")
+        print("\n".join(compare_results(previous, results)))
+
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(json.dumps(results, indent=4) + "\n", encoding="utf-8")
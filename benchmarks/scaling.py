@@ -0,0 +1,226 @@
+"""
+Measures how the scraper throughput scales with the number of concurrent
+requests (from 1 to 64 workers), scraping the offline page corpus from the
+local stand-in server (see `benchmarks/server.py`), so numbeo.com is never
+requested. The server latency and the injected failures are configurable.
+
+Usage (from the repository root):
+
+    python -m benchmarks.scaling [--workers 1 2 4 8] [--latency lognormal] ...
+
+The results are saved as JSON (by default in `benchmarks/results/scaling.json`).
+"""
+
+import argparse
+import asyncio
+import json
+import platform
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from src.core.log import configure_logging
+from src.core.scraper import NumbeoScraper
+from src.schema.input import Input
+from src.schema.log import LoggingSettings
+from src.schema.rate_limit import RateLimitSettings
+from src.schema.session import SessionSettings
+
+from .offline import corpus_configs, load_fixtures
+from .server import ServerSettings, StandInServer
+
+
+RESULTS_PATH = Path(__file__).resolve().parent / "results" / "scaling.json"
+
+WORKERS = [1, 2, 4, 8, 16, 32, 64]
+
+
+def get_rate_limit_settings(workers: int) -> RateLimitSettings:
+    """
+    Creates the rate limiter settings used to retry the failed requests,
+    with a rate high enough to not be the bottleneck of the benchmark.
+
+    Args:
+        workers (int): the number of concurrent requests.
+
+    Returns:
+        RateLimitSettings: the rate limiter settings.
+    """
+    return RateLimitSettings(
+        rate=1000.0,
+        max_rate=1000.0,
+        burst=workers,
+        backoff_factor=0.05,
+        max_backoff=1.0,
+    )
+
+
+async def scrap_async(scraper: NumbeoScraper) -> None:
+    """
+    Scrapes the pages asynchronously, closing the asynchronous session.
+
+    Args:
+        scraper (NumbeoScraper): the scraper instance.
+    """
+    async with scraper:
+        await scraper.scrap_async()
+
+
+def scrap_corpus(
+    base_url: str,
+    workers: int,
+    retry: bool,
+    use_async: bool,
+    modes: Optional[List[str]] = None,
+) -> None:
+    """
+    Scrapes all the corpus pages (of the chosen modes) from the server.
+
+    Args:
+        base_url (str): the server URL.
+        workers (int): the number of concurrent requests.
+        retry (bool): whether the failed requests are retried.
+        use_async (bool): whether the pages are requested asynchronously.
+        modes (Optional[List[str]], optional): the scraped modes.
+            Defaults to None (all the modes).
+    """
+    for mode, config in corpus_configs().items():
+        if not modes is None and not mode in modes:
+            continue
+
+        scraper = NumbeoScraper(
+            config=Input(**config),
+            session_settings=SessionSettings(
+                pool_maxsize=workers,
+                max_concurrency=workers,
+            ),
+            rate_limit_settings=get_rate_limit_settings(workers) if retry else None,
+            base_url=base_url,
+        )
+
+        if use_async:
+            asyncio.run(scrap_async(scraper))
+            continue
+
+        with scraper:
+            scraper.scrap()
+
+
+def measure_scaling(
+    settings: ServerSettings,
+    workers: int,
+    retry: bool,
+    use_async: bool,
+    modes: Optional[List[str]] = None,
+) -> Dict[str, Any]:
+    """
+    Scrapes the corpus from a new stand-in server, measuring the throughput
+    and counting the failed requests.
+
+    Args:
+        settings (ServerSettings): the server settings.
+        workers (int): the number of concurrent requests.
+        retry (bool): whether the failed requests are retried.
+        use_async (bool): whether the pages are requested asynchronously.
+        modes (Optional[List[str]], optional): the scraped modes.
+            Defaults to None (all the modes).
+
+    Returns:
+        Dict[str, Any]: the benchmark results.
+    """
+    with StandInServer(settings=settings, pages=load_fixtures()) as server:
+        start = time.perf_counter()
+        scrap_corpus(server.url, workers, retry, use_async, modes=modes)
+        seconds = time.perf_counter() - start
+
+    stats = server.stats
+    pages = stats.get("200", 0)
+    return {
+        "workers": workers,
+        "seconds": round(seconds, 3),
+        "pages": pages,
+        "requests": sum(value for key, value in stats.items() if key.isdigit()),
+        "throttled": stats.get("429", 0),
+        "server_errors": sum(
+            value for key, value in stats.items() if key.startswith("5")
+        ),
+        "lost_pages": len(server.requested_paths - server.served_paths),
+        "pages_per_second": round(pages / seconds, 1),
+    }
+
+
+def run_scaling(
+    settings: ServerSettings,
+    workers: List[int],
+    retry: bool,
+    use_async: bool,
+    modes: Optional[List[str]] = None,
+) -> Dict[str, Any]:
+    """
+    Runs the scaling benchmark for each number of concurrent requests.
+
+    Args:
+        settings (ServerSettings): the server settings.
+        workers (List[int]): the numbers of concurrent requests.
+        retry (bool): whether the failed requests are retried.
+        use_async (bool): whether the pages are requested asynchronously.
+        modes (Optional[List[str]], optional): the scraped modes.
+            Defaults to None (all the modes).
+
+    Returns:
+        Dict[str, Any]: the results of each number of concurrent requests.
+    """
+    # the retries (and the errors of the lost pages) would be measured too
+    configure_logging(LoggingSettings(LOG_LEVEL="CRITICAL"))
+
+    results = []
+
+    for count in workers:
+        result = measure_scaling(settings, count, retry, use_async, modes=modes)
+        first = results[0] if len(results) > 0 else result
+        speedup = result["pages_per_second"] / first["pages_per_second"]
+        result["speedup"] = round(speedup, 2)
+        results.append(result)
+        print(
+            f"{count:>3} workers {result['pages_per_second']:>9.1f} pages/sec "
+            + f"{result['speedup']:>6.2f}x {result['throttled']:>5} throttled "
+            + f"{result['server_errors']:>5} server errors "
+            + f"{result['lost_pages']:>5} lost pages"
+        )
+
+    return {
+        "python": platform.python_version(),
+        "server": settings.model_dump(),
+        "retry": retry,
+        "async": use_async,
+        "results": results,
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--workers", type=int, nargs="*", default=WORKERS)
+    parser.add_argument("--modes", nargs="*", default=None)
+    parser.add_argument("--retry", action="store_true")
+    parser.add_argument("--async", dest="use_async", action="store_true")
+    parser.add_argument("--output", type=Path, default=RESULTS_PATH)
+
+    for name, field in ServerSettings.model_fields.items():
+        default = "lognormal" if name == "latency" else field.default
+        parser.add_argument(f"--{name.replace('_', '-')}", default=default)
+
+    args = vars(parser.parse_args())
+    workers, modes = args.pop("workers"), args.pop("modes")
+    retry, use_async = args.pop("retry"), args.pop("use_async")
+    output = args.pop("output")
+
+    results = run_scaling(
+        ServerSettings(**args),
+        workers,
+        retry,
+        use_async,
+        modes=modes,
+    )
+
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(results, indent=4) + "\n", encoding="utf-8")
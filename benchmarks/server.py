@@ -0,0 +1,319 @@
+"""
+A local stand-in for numbeo.com, used to load test the scraper (e.g., tune the
+concurrency and the rate limiting) without requesting the real website. The
+offline page corpus (see `benchmarks/make_fixtures.py`) is served under the
+same paths the scraper builds, with configurable latency, throttling (429),
+server errors (5xx) and bandwidth.
+
+Usage (from the repository root):
+
+    python -m benchmarks.server [--port 8000] [--latency lognormal] ...
+
+The scraper uses the server when it's created with its URL:
+
+    NumbeoScraper(config=config, base_url="http://127.0.0.1:8000")
+"""
+
+import argparse
+import hashlib
+import math
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Literal, Optional
+
+from pydantic import BaseModel, Field, NonNegativeFloat, PositiveInt
+
+from .offline import load_fixtures
+
+
+VALID_LATENCY_DISTRIBUTIONS = Literal[
+    "none", "constant", "uniform", "exponential", "lognormal"
+]
+
+SERVER_ERRORS = [500, 502, 503, 504]
+
+
+class ServerSettings(BaseModel):
+    """
+    Local stand-in server settings schema.
+
+    Args:
+        BaseModel (pydantic.BaseModel): Pydantic base model instance.
+    """
+
+    latency: VALID_LATENCY_DISTRIBUTIONS = "none"
+    latency_mean: NonNegativeFloat = 0.05  # in seconds
+    latency_sigma: NonNegativeFloat = 0.5  # the spread (uniform and lognormal)
+    throttle_rate: float = Field(default=0.0, ge=0.0, le=1.0)  # 429 responses
+    retry_after: NonNegativeFloat = 0.0  # in seconds
+    error_rate: float = Field(default=0.0, ge=0.0, le=1.0)  # 5xx responses
+    bandwidth: Optional[PositiveInt] = None  # in bytes per second per response
+    seed: Optional[int] = None
+
+
+class StandInServer:
+    """
+    Serves the offline page corpus over HTTP in a background thread.
+    """
+
+    def __init__(
+        self,
+        settings: Optional[ServerSettings] = None,
+        pages: Optional[Dict[str, str]] = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ) -> None:
+        """
+        Args:
+            settings (Optional[ServerSettings], optional): the latency and the
+                failures injected. Defaults to None (uses the default settings,
+                which serves the pages right away).
+            pages (Optional[Dict[str, str]], optional): the HTML code of each
+                page URL (without the domain). Defaults to None (the corpus).
+            host (str, optional): the server host. Defaults to "127.0.0.1".
+            port (int, optional): the server port. Defaults to 0 (any free port).
+        """
+        if settings is None:
+            settings = ServerSettings()
+
+        if pages is None:
+            pages = load_fixtures()
+
+        self.settings = settings
+        self.pages = {url: page.encode("utf-8") for url, page in pages.items()}
+        self.stats = {}
+        self.requested_paths = set()
+        self.served_paths = set()
+        self._random = random.Random(settings.seed)
+        self._lock = threading.Lock()
+        self._thread = None
+        self._server = ThreadingHTTPServer((host, port), self._handler_class())
+        self._server.daemon_threads = True
+
+    @property
+    def url(self) -> str:
+        """
+        Gets the server URL (used as the scraper `base_url`).
+
+        Returns:
+            str: the server URL.
+        """
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def __enter__(self) -> "StandInServer":
+        return self.start()
+
+    def __exit__(self, *args) -> None:
+        self.stop()
+
+    def start(self) -> "StandInServer":
+        """
+        Starts serving the pages in a background thread.
+
+        Returns:
+            StandInServer: the server itself.
+        """
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def serve_forever(self) -> None:
+        """
+        Serves the pages in the current thread, until it's interrupted.
+        """
+        self._server.serve_forever()
+
+    def stop(self) -> None:
+        """
+        Stops the server.
+        """
+        self._server.shutdown()
+        self._server.server_close()
+
+        if not self._thread is None:
+            self._thread.join()
+
+    def count(
+        self,
+        key: str,
+        value: int = 1,
+    ) -> None:
+        """
+        Adds a value to one of the server statistics.
+
+        Args:
+            key (str): the statistic name (e.g., the status code).
+            value (int, optional): the value added. Defaults to 1.
+        """
+        with self._lock:
+            self.stats[key] = self.stats.get(key, 0) + value
+
+    def track(
+        self,
+        path: str,
+        served: bool = False,
+    ) -> None:
+        """
+        Tracks the pages that were requested and the ones that were served
+        (a page that was requested but never served was lost).
+
+        Args:
+            path (str): the page URL (without the domain).
+            served (bool, optional): whether the page was served.
+                Defaults to False.
+        """
+        with self._lock:
+            if served:
+                self.served_paths.add(path)
+            else:
+                self.requested_paths.add(path)
+
+    def draw_latency(self) -> float:
+        """
+        Draws the latency of a response, following the latency distribution.
+
+        Returns:
+            float: the latency (in seconds).
+        """
+        settings = self.settings
+
+        with self._lock:
+            if settings.latency == "constant":
+                return settings.latency_mean
+
+            if settings.latency == "uniform":
+                spread = settings.latency_mean * min(settings.latency_sigma, 1.0)
+                return self._random.uniform(
+                    settings.latency_mean - spread,
+                    settings.latency_mean + spread,
+                )
+
+            if settings.latency == "exponential" and settings.latency_mean > 0:
+                return self._random.expovariate(1 / settings.latency_mean)
+
+            if settings.latency == "lognormal" and settings.latency_mean > 0:
+                # the distribution mean is the latency mean
+                sigma = settings.latency_sigma
+                mu = math.log(settings.latency_mean) - sigma**2 / 2
+                return self._random.lognormvariate(mu, sigma)
+
+            return 0.0
+
+    def draw_failure(self) -> Optional[int]:
+        """
+        Draws whether a response fails, following the throttling
+        and the server errors rates.
+
+        Returns:
+            Optional[int]: the status code of the failure or None.
+        """
+        with self._lock:
+            draw = self._random.random()
+
+            if draw < self.settings.throttle_rate:
+                return 429
+
+            if draw < self.settings.throttle_rate + self.settings.error_rate:
+                return self._random.choice(SERVER_ERRORS)
+
+            return None
+
+    def _handler_class(self) -> type:
+        """
+        Creates the request handler class bound to this server.
+
+        Returns:
+            type: the request handler class.
+        """
+        server = self
+
+        class RequestHandler(BaseHTTPRequestHandler):
+            # keeps the connections alive, like numbeo.com
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self) -> None:
+                server.track(self.path)
+                time.sleep(server.draw_latency())
+                status_code = server.draw_failure()
+
+                if not status_code is None:
+                    server.count(str(status_code))
+                    self.send_empty_response(status_code)
+                    return
+
+                page = server.pages.get(self.path)
+
+                if page is None:
+                    server.count("404")
+                    self.send_empty_response(404)
+                    return
+
+                etag = f'"{hashlib.md5(page).hexdigest()}"'
+
+                if self.headers.get("If-None-Match") == etag:
+                    server.count("304")
+                    self.send_empty_response(304)
+                    return
+
+                server.count("200")
+                server.track(self.path, served=True)
+                server.count("bytes", len(page))
+                self.send_response(200)
+                self.send_header("Content-Type", "text/html; charset=utf-8")
+                self.send_header("Content-Length", str(len(page)))
+                self.send_header("ETag", etag)
+                self.end_headers()
+                self.send_page(page)
+
+            def send_empty_response(self, status_code: int) -> None:
+                self.send_response(status_code)
+
+                if status_code == 429:
+                    retry_after = f"{server.settings.retry_after:g}"
+                    self.send_header("Retry-After", retry_after)
+
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+
+            def send_page(self, page: bytes) -> None:
+                bandwidth = server.settings.bandwidth
+
+                if bandwidth is None:
+                    self.wfile.write(page)
+                    return
+
+                # the page is sent in chunks of 1/10 second
+                chunk_size = max(bandwidth // 10, 1)
+
+                for start in range(0, len(page), chunk_size):
+                    chunk = page[start : start + chunk_size]
+                    self.wfile.write(chunk)
+                    self.wfile.flush()
+                    time.sleep(len(chunk) / bandwidth)
+
+            def log_message(self, *args) -> None:
+                pass
+
+        return RequestHandler
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+
+    for name, field in ServerSettings.model_fields.items():
+        parser.add_argument(f"--{name.replace('_', '-')}", default=field.default)
+
+    args = vars(parser.parse_args())
+    host, port = args.pop("host"), args.pop("port")
+    server = StandInServer(settings=ServerSettings(**args), host=host, port=port)
+    print(f"Serving {len(server.pages)} pages at {server.url}.")
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.stop()
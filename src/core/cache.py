@@ -0,0 +1,482 @@
+import datetime
+import hashlib
+import sqlite3
+import threading
+import time
+import zlib
+from typing import NamedTuple, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from loguru import logger
+
+from ..schema.cache import CacheSettings
+
+
+# Numbeo publishes the rankings twice a year (at the start and in the middle
+# of the year) and only the most recent period can still change, so the
+# ranking pages of all the other periods never change once they are published
+RANKING_PAGES = ("rankings_by_country.jsp", "rankings.jsp")
+
+# the months when each period is considered open, one month after it's
+# usually published, so a late publication doesn't close the previous period
+PERIOD_START_MONTHS = (2, 8)
+
+
+def _parse_period(title: str) -> Optional[Tuple[int, int]]:
+    """
+    Parses a ranking period (e.g., '2024' or '2024-mid').
+
+    Args:
+        title (str): the ranking period.
+
+    Returns:
+        Optional[Tuple[int, int]]: the year and the half of the year
+            (0 or 1) of the period, or None if it isn't a valid period.
+    """
+    year, _, half = title.partition("-")
+
+    if not year.isdigit() or not half in ("", "mid"):
+        return None
+
+    return int(year), int(half == "mid")
+
+
+def period_close_date(title: str) -> Optional[datetime.date]:
+    """
+    Gets the date when a ranking period is closed, which is when the next
+    period is considered open.
+
+    Args:
+        title (str): the ranking period (e.g., '2024' or '2024-mid').
+
+    Returns:
+        Optional[datetime.date]: the date when the period is closed, or None
+            if it isn't a valid period.
+    """
+    period = _parse_period(title)
+
+    if period is None:
+        return None
+
+    year, half = period
+
+    if half == 0:
+        return datetime.date(year, PERIOD_START_MONTHS[1], 1)
+
+    return datetime.date(year + 1, PERIOD_START_MONTHS[0], 1)
+
+
+def is_closed_period(
+    title: str,
+    today: Optional[datetime.date] = None,
+) -> bool:
+    """
+    Checks if a ranking period is closed, which means that a more recent
+    period was already published. The open period is derived from the
+    current date, so it doesn't depend on the years supported by the input.
+
+    Args:
+        title (str): the ranking period (e.g., '2024' or '2024-mid').
+        today (Optional[datetime.date], optional): the current date.
+            Defaults to None (today).
+
+    Returns:
+        bool: whether the ranking period is closed.
+    """
+    close_date = period_close_date(title)
+
+    if close_date is None:
+        return False
+
+    if today is None:
+        today = datetime.date.today()
+
+    return today >= close_date
+
+
+def period_closed_at(url: str) -> Optional[float]:
+    """
+    Gets the time when the period of a ranking page is closed.
+
+    Args:
+        url (str): the page URL.
+
+    Returns:
+        Optional[float]: the time (in seconds since the epoch) when the
+            period is closed, or None if the page isn't a ranking page.
+    """
+    parts = urlsplit(url)
+
+    if not parts.path.endswith(RANKING_PAGES):
+        return None
+
+    close_date = period_close_date(dict(parse_qsl(parts.query)).get("title", ""))
+
+    if close_date is None:
+        return None
+
+    return datetime.datetime.combine(close_date, datetime.time()).timestamp()
+
+
+def is_closed_period_url(url: str) -> bool:
+    """
+    Checks if the page URL is a ranking page of a closed period,
+    which means that the page will never change again.
+
+    Args:
+        url (str): the page URL.
+
+    Returns:
+        bool: whether the page is a ranking page of a closed period.
+    """
+    closed_at = period_closed_at(url)
+    return not closed_at is None and time.time() >= closed_at
+
+
+def is_immutable(
+    url: str,
+    fetched_at: float,
+) -> bool:
+    """
+    Checks if a cached page will never change again, which means that it's
+    a ranking page fetched after its period was closed.
+
+    Args:
+        url (str): the page URL.
+        fetched_at (float): the time when the page was fetched.
+
+    Returns:
+        bool: whether the cached page will never change again.
+    """
+    closed_at = period_closed_at(url)
+    return not closed_at is None and fetched_at >= closed_at
+
+
+class CachedResponse(NamedTuple):
+    """
+    A response stored in the cache.
+    """
+
+    url: str
+    text: str
+    fetched_at: float
+    etag: Optional[str]
+    last_modified: Optional[str]
+
+
+class ResponseCache:
+    """
+    Persistent on-disk cache of the raw pages HTML code. The entries are
+    keyed by the hash of the normalized page URL, the HTML code is stored
+    compressed, and the least recently used entries are evicted when the
+    cache grows bigger than its maximum size. The ranking pages of closed
+    periods never expire and are only evicted after all the other pages.
+    """
+
+    def __init__(
+        self,
+        settings: CacheSettings,
+    ) -> None:
+        """
+        Creates (or opens) a response cache.
+
+        Args:
+            settings (CacheSettings): the cache settings.
+        """
+        self.settings = settings
+        self.settings.path.mkdir(parents=True, exist_ok=True)
+
+        # the same connection is shared between the threads used
+        # by the concurrent mode, so the access is serialized
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(
+            self.settings.path / "responses.sqlite",
+            check_same_thread=False,
+        )
+
+        with self._lock, self._connection:
+            self._connection.execute(
+                """
+                CREATE TABLE IF NOT EXISTS responses (
+                    key TEXT PRIMARY KEY,
+                    url TEXT NOT NULL,
+                    fetched_at REAL NOT NULL,
+                    accessed_at REAL NOT NULL,
+                    size INTEGER NOT NULL,
+                    immutable INTEGER NOT NULL DEFAULT 0,
+                    etag TEXT,
+                    last_modified TEXT,
+                    body BLOB NOT NULL
+                )
+                """
+            )
+            self._connection.execute(
+                "CREATE INDEX IF NOT EXISTS responses_accessed_at "
+                + "ON responses (accessed_at)"
+            )
+
+    @staticmethod
+    def normalize_url(url: str) -> str:
+        """
+        Normalizes the page URL, so the same page always has the same key
+        (e.g., the scheme and host are lowercased, the fragment is removed
+        and the query parameters are sorted).
+
+        Args:
+            url (str): the page URL.
+
+        Returns:
+            str: the normalized page URL.
+        """
+        parts = urlsplit(url)
+        query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+
+        return urlunsplit(
+            (
+                parts.scheme.lower(),
+                parts.netloc.lower(),
+                parts.path or "/",
+                query,
+                "",
+            )
+        )
+
+    @staticmethod
+    def make_key(url: str) -> str:
+        """
+        Creates the cache key for a page URL.
+
+        Args:
+            url (str): the page URL.
+
+        Returns:
+            str: the cache key (SHA-256 hash of the normalized URL).
+        """
+        normalized_url = ResponseCache.normalize_url(url)
+        return hashlib.sha256(normalized_url.encode("utf-8")).hexdigest()
+
+    def get(
+        self,
+        url: str,
+    ) -> Optional[CachedResponse]:
+        """
+        Gets a cached response, even if it's already expired.
+
+        Args:
+            url (str): the page URL.
+
+        Returns:
+            Optional[CachedResponse]: the cached response or None if the page
+                isn't cached.
+        """
+        key = self.make_key(url)
+
+        with self._lock, self._connection:
+            row = self._connection.execute(
+                "SELECT url, fetched_at, etag, last_modified, body "
+                + "FROM responses WHERE key = ?",
+                (key,),
+            ).fetchone()
+
+            if row is None:
+                return None
+
+            self._connection.execute(
+                "UPDATE responses SET accessed_at = ? WHERE key = ?",
+                (time.time(), key),
+            )
+
+        cached_url, fetched_at, etag, last_modified, body = row
+        return CachedResponse(
+            url=cached_url,
+            text=zlib.decompress(body).decode("utf-8"),
+            fetched_at=fetched_at,
+            etag=etag,
+            last_modified=last_modified,
+        )
+
+    def _is_fresh(
+        self,
+        url: str,
+        fetched_at: float,
+        now: float,
+    ) -> bool:
+        """
+        Checks if a cached page is still fresh. The ranking pages fetched
+        after their period was closed are always fresh, while the ones
+        fetched before it was closed are revalidated once it's closed
+        (to get the final values).
+
+        Args:
+            url (str): the page URL.
+            fetched_at (float): the time when the page was fetched.
+            now (float): the current time.
+
+        Returns:
+            bool: whether the cached page is still fresh.
+        """
+        closed_at = period_closed_at(url)
+
+        if not closed_at is None:
+            if fetched_at >= closed_at:
+                return True
+
+            if now >= closed_at:
+                return False
+
+        return now - fetched_at < self.settings.ttl
+
+    def is_fresh(
+        self,
+        response: CachedResponse,
+        now: Optional[float] = None,
+    ) -> bool:
+        """
+        Checks if a cached response is still within its time to live.
+        The ranking pages of closed periods are always fresh (unless they
+        were fetched before their period was closed).
+
+        Args:
+            response (CachedResponse): the cached response.
+            now (Optional[float], optional): the current time. Defaults
+                to None (the current time).
+
+        Returns:
+            bool: whether the cached response can be used without
+                requesting the page again.
+        """
+        if now is None:
+            now = time.time()
+
+        return self._is_fresh(response.url, response.fetched_at, now)
+
+    def is_cached(
+        self,
+        url: str,
+        now: Optional[float] = None,
+    ) -> bool:
+        """
+        Checks if a page is cached and still fresh, without reading it.
+
+        Args:
+            url (str): the page URL.
+            now (Optional[float], optional): the current time. Defaults
+                to None (the current time).
+
+        Returns:
+            bool: whether the page can be obtained from the cache.
+        """
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT url, fetched_at FROM responses WHERE key = ?",
+                (self.make_key(url),),
+            ).fetchone()
+
+        if row is None:
+            return False
+
+        if now is None:
+            now = time.time()
+
+        cached_url, fetched_at = row
+        return self._is_fresh(cached_url, fetched_at, now)
+
+    def touch(
+        self,
+        url: str,
+    ) -> None:
+        """
+        Marks a cached response as fresh again (e.g., after the server
+        confirmed that the page didn't change since it was cached).
+
+        Args:
+            url (str): the page URL.
+        """
+        now = time.time()
+
+        # a page revalidated after its period was closed will never change
+        with self._lock, self._connection:
+            self._connection.execute(
+                "UPDATE responses SET fetched_at = ?, accessed_at = ?, "
+                + "immutable = ? WHERE key = ?",
+                (now, now, int(is_immutable(url, now)), self.make_key(url)),
+            )
+
+    def put(
+        self,
+        url: str,
+        text: str,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ) -> None:
+        """
+        Stores (or replaces) a response in the cache.
+
+        Args:
+            url (str): the page URL.
+            text (str): the page HTML code.
+            etag (Optional[str], optional): the response 'ETag' header.
+                Defaults to None.
+            last_modified (Optional[str], optional): the response
+                'Last-Modified' header. Defaults to None.
+        """
+        body = zlib.compress(text.encode("utf-8"), self.settings.compression_level)
+        now = time.time()
+
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO responses (key, url, fetched_at, "
+                + "accessed_at, size, immutable, etag, last_modified, body) "
+                + "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    self.make_key(url),
+                    self.normalize_url(url),
+                    now,
+                    now,
+                    len(body),
+                    int(is_immutable(url, now)),
+                    etag,
+                    last_modified,
+                    body,
+                ),
+            )
+            self._evict()
+
+    def _evict(self) -> None:
+        """
+        Deletes the least recently used entries until the cache size
+        is smaller than its maximum size (the ranking pages of closed
+        periods are the last ones to be deleted). Must be called
+        holding the lock.
+        """
+        (total_size,) = self._connection.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()
+
+        if total_size <= self.settings.max_size:
+            return
+
+        rows = self._connection.execute(
+            "SELECT key, size FROM responses ORDER BY immutable ASC, accessed_at ASC"
+        ).fetchall()
+        evicted_keys = []
+
+        for key, size in rows:
+            if total_size <= self.settings.max_size:
+                break
+
+            evicted_keys.append((key,))
+            total_size -= size
+
+        self._connection.executemany(
+            "DELETE FROM responses WHERE key = ?",
+            evicted_keys,
+        )
+        logger.info(f"Evicted {len(evicted_keys)} pages from the cache.\n")
+
+    def close(self) -> None:
+        """
+        Closes the cache database connection.
+        """
+        with self._lock:
+            self._connection.close()
@@ -0,0 +1,299 @@
+import hashlib
+import pickle
+import sqlite3
+import threading
+import time
+import zlib
+from typing import Any, Dict, List, NamedTuple, Optional
+
+from ..schema.checkpoint import CheckpointSettings
+from ..schema.input import Input
+
+
+class JournalEntry(NamedTuple):
+    """
+    A page recorded in the checkpoint journal.
+    """
+
+    url: str
+    status: str  # 'done' or 'failed'
+    updated_at: float
+    data: Optional[Dict[str, List[Any]]]  # the extracted data (only when done)
+
+
+def make_run_id(
+    config: Input,
+    base_url: str = "",
+) -> str:
+    """
+    Creates the identifier of a run, so running the same config against
+    the same website again uses the same journal entries.
+
+    Args:
+        config (Input): the configuration values.
+        base_url (str, optional): the website URL used to build the pages
+            URL. Defaults to "".
+
+    Returns:
+        str: the run identifier (SHA-256 hash of the config and the URL).
+    """
+    key = config.model_dump_json() + "\n" + base_url
+    return hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+
+class CheckpointJournal:
+    """
+    Persistent on-disk journal of the pages of each run (identified by its
+    config). The data extracted from the completed pages is stored with them,
+    so a run that stopped can be resumed without requesting nor parsing the
+    completed pages again, and the failed pages can be requested again alone.
+    The runs that finished are marked, so running their config again starts
+    a new run instead of reusing the data of the previous one.
+    """
+
+    def __init__(
+        self,
+        settings: CheckpointSettings,
+    ) -> None:
+        """
+        Creates (or opens) a checkpoint journal.
+
+        Args:
+            settings (CheckpointSettings): the checkpoint journal settings.
+        """
+        self.settings = settings
+        self.settings.path.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(
+            self.settings.path / "checkpoints.sqlite",
+            check_same_thread=False,
+        )
+
+        with self._lock, self._connection:
+            self._connection.execute(
+                """
+                CREATE TABLE IF NOT EXISTS pages (
+                    run TEXT NOT NULL,
+                    url TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    updated_at REAL NOT NULL,
+                    data BLOB,
+                    PRIMARY KEY (run, url)
+                )
+                """
+            )
+            self._connection.execute(
+                """
+                CREATE TABLE IF NOT EXISTS finished_runs (
+                    run TEXT PRIMARY KEY,
+                    finished_at REAL NOT NULL
+                )
+                """
+            )
+
+    def status(
+        self,
+        run_id: str,
+        url: str,
+    ) -> Optional[str]:
+        """
+        Gets the status of a page, without reading its data.
+
+        Args:
+            run_id (str): the run identifier.
+            url (str): the page URL.
+
+        Returns:
+            Optional[str]: 'done', 'failed' or None if the page wasn't
+                recorded yet.
+        """
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT status FROM pages WHERE run = ? AND url = ?",
+                (run_id, url),
+            ).fetchone()
+
+        return None if row is None else row[0]
+
+    def get(
+        self,
+        run_id: str,
+        url: str,
+    ) -> Optional[JournalEntry]:
+        """
+        Gets a page recorded in the journal.
+
+        Args:
+            run_id (str): the run identifier.
+            url (str): the page URL.
+
+        Returns:
+            Optional[JournalEntry]: the journal entry or None if the page
+                wasn't recorded yet.
+        """
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT status, updated_at, data FROM pages WHERE run = ? AND url = ?",
+                (run_id, url),
+            ).fetchone()
+
+        if row is None:
+            return None
+
+        status, updated_at, data = row
+
+        # the journal is only written by the scraper itself
+        if not data is None:
+            data = pickle.loads(zlib.decompress(data))
+
+        return JournalEntry(url=url, status=status, updated_at=updated_at, data=data)
+
+    def record_done(
+        self,
+        run_id: str,
+        url: str,
+        data: Dict[str, List[Any]],
+    ) -> None:
+        """
+        Records a completed page with its extracted data.
+
+        Args:
+            run_id (str): the run identifier.
+            url (str): the page URL.
+            data (Dict[str, List[Any]]): the values of each column.
+        """
+        self._record(run_id, url, "done", zlib.compress(pickle.dumps(data)))
+
+    def record_failure(
+        self,
+        run_id: str,
+        url: str,
+    ) -> None:
+        """
+        Records a page that could not be requested.
+
+        Args:
+            run_id (str): the run identifier.
+            url (str): the page URL.
+        """
+        self._record(run_id, url, "failed", None)
+
+    def _record(
+        self,
+        run_id: str,
+        url: str,
+        status: str,
+        data: Optional[bytes],
+    ) -> None:
+        """
+        Stores (or replaces) a page in the journal.
+
+        Args:
+            run_id (str): the run identifier.
+            url (str): the page URL.
+            status (str): the page status ('done' or 'failed').
+            data (Optional[bytes]): the serialized extracted data.
+        """
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO pages (run, url, status, updated_at, data) "
+                + "VALUES (?, ?, ?, ?, ?)",
+                (run_id, url, status, time.time(), data),
+            )
+
+    def count(
+        self,
+        run_id: str,
+    ) -> Dict[str, int]:
+        """
+        Counts the pages of a run by status.
+
+        Args:
+            run_id (str): the run identifier.
+
+        Returns:
+            Dict[str, int]: the number of pages of each status.
+        """
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT status, COUNT(*) FROM pages WHERE run = ? GROUP BY status",
+                (run_id,),
+            ).fetchall()
+
+        return {status: count for status, count in rows}
+
+    def finish(
+        self,
+        run_id: str,
+    ) -> None:
+        """
+        Marks a run as finished (all of its pages were requested).
+
+        Args:
+            run_id (str): the run identifier.
+        """
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO finished_runs (run, finished_at) VALUES (?, ?)",
+                (run_id, time.time()),
+            )
+
+    def reopen(
+        self,
+        run_id: str,
+    ) -> None:
+        """
+        Removes the finished mark of a run (e.g., while its failed pages
+        are requested again), keeping its pages.
+
+        Args:
+            run_id (str): the run identifier.
+        """
+        with self._lock, self._connection:
+            self._connection.execute(
+                "DELETE FROM finished_runs WHERE run = ?", (run_id,)
+            )
+
+    def is_finished(
+        self,
+        run_id: str,
+    ) -> bool:
+        """
+        Checks if a run finished.
+
+        Args:
+            run_id (str): the run identifier.
+
+        Returns:
+            bool: whether the run finished.
+        """
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT 1 FROM finished_runs WHERE run = ?", (run_id,)
+            ).fetchone()
+
+        return not row is None
+
+    def clear(
+        self,
+        run_id: str,
+    ) -> None:
+        """
+        Deletes all the pages of a run (and its finished mark).
+
+        Args:
+            run_id (str): the run identifier.
+        """
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM pages WHERE run = ?", (run_id,))
+            self._connection.execute(
+                "DELETE FROM finished_runs WHERE run = ?", (run_id,)
+            )
+
+    def close(self) -> None:
+        """
+        Closes the journal database connection.
+        """
+        with self._lock:
+            self._connection.close()
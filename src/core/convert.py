@@ -0,0 +1,225 @@
+from __future__ import annotations
+
+from typing import Any, Dict, List
+
+from .utils import lazy_import
+from ..schema.output import VALID_FLOAT_DTYPES
+
+pd = lazy_import("pandas")
+
+# the columns that contain labels, which are never converted to numbers
+# (the year isn't converted either, since it can be a period like '2020-mid')
+LABEL_COLUMNS = frozenset(
+    [
+        "Country",
+        "Year",
+        "Region",
+        "City",
+        "Header",
+        "Category",
+        "Level",
+        "Currency Code",
+    ]
+)
+
+# a number as shown by Numbeo (e.g., '1,234.56' or '-3.5')
+NUMBER_PATTERN = r"-?\d[\d,]*(?:\.\d+)?"
+
+
+def to_float(
+    values: pd.Series,
+    float_dtype: VALID_FLOAT_DTYPES = "float64",
+) -> pd.Series:
+    """
+    Converts the text values to numbers, ignoring the thousands
+    separator and any other text (e.g., the currency symbol). The
+    values that don't contain a number are converted to NaN.
+
+    Args:
+        values (pd.Series): the text values.
+        float_dtype (VALID_FLOAT_DTYPES, optional): the float dtype.
+            Defaults to 'float64'.
+
+    Returns:
+        pd.Series: the numeric values.
+    """
+    numbers = values.astype("string").str.extract(f"({NUMBER_PATTERN})", expand=False)
+    numbers = numbers.str.replace(",", "", regex=False)
+    return pd.to_numeric(numbers, errors="coerce").astype(float_dtype)
+
+
+def to_currency(
+    values: pd.Series,
+) -> pd.Series:
+    """
+    Gets the currency symbol of the text values (e.g., '€' for '1,234.56 €').
+
+    Args:
+        values (pd.Series): the text values.
+
+    Returns:
+        pd.Series: the currency symbols (missing if the value has no
+            symbol or no number, e.g., '?').
+    """
+    values = values.astype("string")
+    currencies = values.str.replace(NUMBER_PATTERN, "", regex=True).str.strip()
+    missing = (currencies == "") | ~values.str.contains(NUMBER_PATTERN, regex=True)
+    return currencies.mask(missing).astype(object)
+
+
+def to_typed_frame(
+    dataframe: pd.DataFrame,
+    float_dtype: VALID_FLOAT_DTYPES = "float64",
+) -> pd.DataFrame:
+    """
+    Converts the text values of a dataframe to numbers, one column at a
+    time (vectorized): the rank is converted to an integer, the 'Mean'
+    column is split into the number and the 'Currency' column, the 'Range'
+    column is split into the 'Range Low' and 'Range High' columns, and all
+    the other values (indices, prices and the 'Value' column) are converted
+    to floats. The label columns are kept as they are.
+
+    Args:
+        dataframe (pd.DataFrame): the extracted data.
+        float_dtype (VALID_FLOAT_DTYPES, optional): the float dtype.
+            Defaults to 'float64'.
+
+    Returns:
+        pd.DataFrame: the typed data.
+    """
+    columns = {}
+
+    for column in dataframe.columns:
+        values = dataframe[column]
+
+        if column in LABEL_COLUMNS:
+            columns[column] = values
+        elif column == "Rank":
+            columns[column] = to_float(values).round().astype("Int64")
+        elif column == "Range":
+            bounds = values.astype("string").str.split("-", n=1, expand=True)
+            bounds = bounds.reindex(columns=[0, 1])
+            columns["Range Low"] = to_float(bounds[0], float_dtype)
+            columns["Range High"] = to_float(bounds[1], float_dtype)
+        elif column == "Mean":
+            columns[column] = to_float(values, float_dtype)
+            columns["Currency"] = to_currency(values)
+        else:
+            columns[column] = to_float(values, float_dtype)
+
+    return pd.DataFrame(columns, index=dataframe.index)
+
+
+class SharedCategories:
+    """
+    Converts the label columns to categoricals using a single dictionary
+    (the categories) per column, shared by all the pages and categories,
+    so the labels are stored only once and the dataframes can be
+    concatenated without losing the categorical dtype. The dictionaries
+    only grow (the new labels are added at the end), so the codes of the
+    dataframes already converted remain valid.
+    """
+
+    def __init__(self) -> None:
+        self._categories: Dict[str, List[Any]] = {}
+        self._dtypes: Dict[str, pd.CategoricalDtype] = {}
+
+    def dtype(
+        self,
+        column: str,
+    ) -> pd.CategoricalDtype:
+        """
+        Gets the current categorical dtype of a column.
+
+        Args:
+            column (str): the column name.
+
+        Returns:
+            pd.CategoricalDtype: the categorical dtype.
+        """
+        return self._dtypes.get(column, pd.CategoricalDtype([]))
+
+    def _update(
+        self,
+        column: str,
+        values: pd.Series,
+    ) -> pd.CategoricalDtype:
+        """
+        Adds the new labels of a column to its dictionary.
+
+        Args:
+            column (str): the column name.
+            values (pd.Series): the column values.
+
+        Returns:
+            pd.CategoricalDtype: the (updated) categorical dtype.
+        """
+        dtype = self.dtype(column)
+        labels = pd.Series(values.dropna().unique(), dtype=object)
+        new_labels = labels[~labels.isin(dtype.categories)].tolist()
+
+        # the same dtype object is reused while the dictionary doesn't
+        # change, so all the dataframes share the same categories
+        if len(new_labels) > 0:
+            self._categories[column] = self._categories.get(column, []) + new_labels
+            dtype = pd.CategoricalDtype(self._categories[column])
+            self._dtypes[column] = dtype
+
+        return dtype
+
+    def encode(
+        self,
+        dataframe: pd.DataFrame,
+    ) -> pd.DataFrame:
+        """
+        Converts the label columns of a dataframe to categoricals.
+
+        Args:
+            dataframe (pd.DataFrame): the data.
+
+        Returns:
+            pd.DataFrame: the data with the label columns as categoricals.
+        """
+        columns = {}
+
+        for column in dataframe.columns:
+            values = dataframe[column]
+
+            if column in LABEL_COLUMNS:
+                values = values.astype(object).astype(self._update(column, values))
+
+            columns[column] = values
+
+        return pd.DataFrame(columns, index=dataframe.index)
+
+    def align(
+        self,
+        dataframe: pd.DataFrame,
+    ) -> pd.DataFrame:
+        """
+        Sets the categories of a dataframe converted before the
+        dictionaries grew to the current ones (the codes don't change).
+
+        Args:
+            dataframe (pd.DataFrame): the data converted by `encode`.
+
+        Returns:
+            pd.DataFrame: the data with the current categories.
+        """
+        columns = {}
+
+        for column in dataframe.columns:
+            values = dataframe[column]
+
+            if column in self._dtypes and isinstance(values.dtype, pd.CategoricalDtype):
+                values = pd.Series(
+                    pd.Categorical.from_codes(
+                        values.cat.codes,
+                        dtype=self._dtypes[column],
+                    ),
+                    index=values.index,
+                )
+
+            columns[column] = values
+
+        return pd.DataFrame(columns, index=dataframe.index)
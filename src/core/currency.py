@@ -0,0 +1,224 @@
+from __future__ import annotations
+
+import re
+from typing import Any, Dict, List, Optional
+
+from .convert import NUMBER_PATTERN, to_currency, to_float
+from .utils import lazy_import
+
+np = lazy_import("numpy")
+pd = lazy_import("pandas")
+
+
+def is_monetary_item(item: str) -> bool:
+    """
+    Checks if the values of a historical data item are amounts of money
+    (e.g., the mortgage interest rate is a percentage).
+
+    Args:
+        item (str): the item name.
+
+    Returns:
+        bool: whether the item values are amounts of money.
+    """
+    return not "%" in item
+
+
+def exchange_rate(
+    base_values: pd.Series,
+    values: pd.Series,
+) -> Optional[float]:
+    """
+    Derives the exchange rate between two currencies from the same values
+    shown in both currencies (aligned by the index). The rate is the ratio
+    of the sums, so the rounding of the small values barely changes it.
+
+    Args:
+        base_values (pd.Series): the values in the base currency.
+        values (pd.Series): the values in the other currency.
+
+    Returns:
+        Optional[float]: the units of the other currency per unit of the base
+            currency or None if there isn't any value shown in both currencies.
+    """
+    base_values, values = to_float(base_values).align(to_float(values), join="inner")
+    both_values = base_values.notna() & values.notna() & (base_values > 0)
+
+    if not both_values.any():
+        return None
+
+    return float(values[both_values].sum() / base_values[both_values].sum())
+
+
+def currency_template(
+    values: pd.Series,
+) -> Optional[str]:
+    """
+    Gets how the amounts of money are shown in a currency (e.g., '{} €'),
+    given the values shown in the currency.
+
+    Args:
+        values (pd.Series): the values shown in the currency.
+
+    Returns:
+        Optional[str]: the template, where '{}' is replaced by the amount,
+            or None if none of the values has a currency symbol.
+    """
+    values = values[to_currency(values).notna()]
+
+    if values.shape[0] == 0:
+        return None
+
+    template = values.iloc[0].replace("{", "{{").replace("}", "}}")
+    return re.sub(NUMBER_PATTERN, "{}", template, count=1)
+
+
+def format_amounts(
+    amounts: np.ndarray,
+    template: str = "{}",
+) -> List[Optional[str]]:
+    """
+    Formats the amounts of money the same way Numbeo shows them
+    (e.g., '1,234.56 €').
+
+    Args:
+        amounts (np.ndarray): the amounts.
+        template (str, optional): how the amounts are shown in the currency
+            (see the `currency_template` function). Defaults to '{}'.
+
+    Returns:
+        List[Optional[str]]: the formatted amounts (None if it's missing).
+    """
+    return [
+        None if np.isnan(amount) else template.format(f"{amount:,.2f}")
+        for amount in amounts
+    ]
+
+
+def convert_city_data(
+    data: Dict[str, List[Any]],
+    rate: float,
+    template: str,
+) -> Dict[str, List[Any]]:
+    """
+    Converts the amounts of money of a 'city' mode page (the 'Mean' and
+    'Range' columns) to another currency, multiplying all of them by the
+    exchange rate at once. Only the rows whose mean has a currency symbol
+    are converted (e.g., the percentages are kept as they are).
+
+    Args:
+        data (Dict[str, List[Any]]): the values of each column in the
+            base currency.
+        rate (float): the units of the other currency per unit of the
+            base currency.
+        template (str): how the amounts are shown in the other currency
+            (see the `currency_template` function).
+
+    Returns:
+        Dict[str, List[Any]]: the values of each column in the other currency.
+    """
+    means = pd.Series(data["Mean"], dtype=object)
+    monetary = to_currency(means).notna().to_numpy()
+
+    converted_data = dict(data)
+    converted_means = format_amounts(
+        to_float(means).to_numpy() * rate,
+        template=template,
+    )
+    converted_data["Mean"] = [
+        converted if is_monetary else mean
+        for converted, is_monetary, mean in zip(converted_means, monetary, data["Mean"])
+    ]
+
+    if "Range" in data:
+        bounds = pd.Series(data["Range"], dtype=object).astype("string")
+        bounds = bounds.str.split("-", n=1, expand=True).reindex(columns=[0, 1])
+        lows = format_amounts(to_float(bounds[0]).to_numpy() * rate)
+        highs = format_amounts(to_float(bounds[1]).to_numpy() * rate)
+        converted_data["Range"] = [
+            f"{low}-{high}" if is_monetary and not None in [low, high] else value
+            for low, high, is_monetary, value in zip(
+                lows, highs, monetary, data["Range"]
+            )
+        ]
+
+    return converted_data
+
+
+def yearly_exchange_rates(
+    base_data: Dict[str, List[Any]],
+    data: Dict[str, List[Any]],
+) -> Dict[int, float]:
+    """
+    Derives the exchange rate of each year from the same historical data
+    page shown in both currencies (the rate can change from year to year).
+
+    Args:
+        base_data (Dict[str, List[Any]]): the values of each column
+            in the base currency.
+        data (Dict[str, List[Any]]): the values of each column
+            in the other currency.
+
+    Returns:
+        Dict[int, float]: the units of the other currency per unit
+            of the base currency, for each year.
+    """
+    rates = {}
+    items = [item for item in base_data.keys() if item != "Year"]
+
+    for item in filter(is_monetary_item, items):
+        if not item in data:
+            continue
+
+        base_values = pd.Series(base_data[item], index=base_data["Year"], dtype=object)
+        values = pd.Series(data[item], index=data["Year"], dtype=object)
+
+        for year in base_values.index.intersection(values.index).unique():
+            rate = exchange_rate(base_values.loc[[year]], values.loc[[year]])
+
+            if not rate is None:
+                rates.setdefault(int(year), rate)
+
+    return rates
+
+
+def convert_historical_records(
+    records: Dict[str, List[Any]],
+    rates: Dict[int, float],
+) -> Dict[str, List[Any]]:
+    """
+    Converts the values of the historical data long-format records to
+    another currency, multiplying all of them by the exchange rate of their
+    year at once. The values of the items that aren't amounts of money are
+    kept as they are, and the values of the years without an exchange rate
+    use the average rate.
+
+    Args:
+        records (Dict[str, List[Any]]): the values of each column of the
+            records, in the base currency.
+        rates (Dict[int, float]): the units of the other currency per unit
+            of the base currency, for each year.
+
+    Returns:
+        Dict[str, List[Any]]: the values of each column of the records,
+            in the other currency.
+    """
+    average_rate = np.nan
+
+    if len(rates) > 0:
+        average_rate = float(np.mean(list(rates.values())))
+
+    years_rates = pd.Series(records["Year"], dtype=object).map(rates)
+    years_rates = years_rates.astype(float).fillna(average_rate).to_numpy()
+
+    values = pd.Series(records["Value"], dtype=object)
+    converted_values = format_amounts(to_float(values).to_numpy() * years_rates)
+
+    converted_records = dict(records)
+    converted_records["Value"] = [
+        converted if is_monetary_item(item) else value
+        for converted, item, value in zip(
+            converted_values, records["Item"], records["Value"]
+        )
+    ]
+    return converted_records
@@ -0,0 +1,656 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Callable, Collection, Dict, List, Optional
+
+from loguru import logger
+
+from .frames import RowBuilder, columns_length
+from .parser import (
+    COST_OF_LIVING_TABLE,
+    INDICES_TABLES,
+    RANKING_TABLE,
+    TRAFFIC_TABLES,
+    parse_page,
+)
+from .utils import COUNTRIES_REGIONS_MAPPING, format_city, lazy_import
+
+if TYPE_CHECKING:
+    from bs4 import BeautifulSoup
+
+pd = lazy_import("pandas")
+
+# the extractors are module-level functions that receive the page HTML code
+# and return the values of each column, so they can run in another process
+Extractor = Callable[..., Dict[str, List[Any]]]
+
+
+def extract_country_ranking(
+    page: str,
+    backend: str = "html.parser",
+    parse_only: bool = True,
+    countries: Optional[Collection[str]] = None,
+    rank_by_region: bool = False,
+) -> Dict[str, List[Any]]:
+    """
+    Extracts the ranking table of a 'country' mode page. Only the country
+    of each row is read first, so the rows of the countries that aren't
+    kept are skipped without reading any other value.
+
+    Args:
+        page (str): the page HTML code.
+        backend (str, optional): the parser backend. Defaults to "html.parser".
+        parse_only (bool, optional): whether only the ranking table is parsed
+            or not. Defaults to True.
+        countries (Optional[Collection[str]], optional): the countries that
+            will be kept. Defaults to None (keeps all the countries).
+        rank_by_region (bool, optional): whether the rank is relative to the
+            countries of the same region (the same way it is shown in the
+            ranking page of the region) or not. Defaults to False.
+
+    Returns:
+        Dict[str, List[Any]]: the values of each column of the ranking table.
+    """
+    numbeo_html_data = parse_page(
+        page=page,
+        backend=backend,
+        parse_only=RANKING_TABLE if parse_only else None,
+    )
+    main_table = numbeo_html_data.find("table", attrs={"id": "t2"})
+
+    main_table_header = main_table.find("thead")
+    main_table_header_rows = main_table_header.find_all("th")
+    table_columns_name = [row.text for row in main_table_header_rows]
+    builder = RowBuilder(columns=table_columns_name)
+
+    main_table_body = main_table.find("tbody")
+    main_table_rows = main_table_body.find_all("tr")
+    country_index = table_columns_name.index("Country")
+    regions_ranks = {}
+
+    for rank, row in enumerate(main_table_rows, start=1):
+        data = row.find_all("td")
+        country = data[country_index].text
+
+        # the rank is counted before the country is skipped,
+        # so the rank of the kept countries doesn't change
+        if rank_by_region:
+            region = COUNTRIES_REGIONS_MAPPING.get(country)
+            regions_ranks[region] = regions_ranks.get(region, 0) + 1
+            rank = regions_ranks[region]
+
+        if not countries is None and not country in countries:
+            continue
+
+        data = [d.text for d in data[1:]]
+        builder.append([str(rank)] + data)  # appending the rank
+
+    return builder.to_dict()
+
+
+def extract_city_ranking(
+    page: str,
+    backend: str = "html.parser",
+    parse_only: bool = True,
+    cities: Optional[Collection[str]] = None,
+) -> Dict[str, List[Any]]:
+    """
+    Extracts the ranking table of a 'city-rankings' mode page, which has
+    the indices of all the ranked cities. The city cell (e.g., 'Rome, Italy')
+    is split into the 'City' and 'Country' columns, and only the city of
+    each row is read first, so the rows of the cities that aren't kept are
+    skipped without reading any other value.
+
+    Args:
+        page (str): the page HTML code.
+        backend (str, optional): the parser backend. Defaults to "html.parser".
+        parse_only (bool, optional): whether only the ranking table is parsed
+            or not. Defaults to True.
+        cities (Optional[Collection[str]], optional): the formatted name of
+            the cities that will be kept (either the city alone, e.g.,
+            'Rome', or with its country, e.g., 'Rome,-Italy'). Defaults to
+            None (keeps all the cities).
+
+    Returns:
+        Dict[str, List[Any]]: the values of each column of the ranking table.
+    """
+    numbeo_html_data = parse_page(
+        page=page,
+        backend=backend,
+        parse_only=RANKING_TABLE if parse_only else None,
+    )
+    main_table = numbeo_html_data.find("table", attrs={"id": "t2"})
+
+    main_table_header = main_table.find("thead")
+    main_table_header_rows = main_table_header.find_all("th")
+    table_columns_name = [row.text for row in main_table_header_rows]
+    city_index = table_columns_name.index("City")
+    builder = RowBuilder(
+        columns=["Rank", "City", "Country"]
+        + [
+            column
+            for index, column in enumerate(table_columns_name)
+            if not index in [0, city_index]
+        ]
+    )
+
+    main_table_body = main_table.find("tbody")
+    main_table_rows = main_table_body.find_all("tr")
+
+    for rank, row in enumerate(main_table_rows, start=1):
+        data = row.find_all("td")
+        city_text = data[city_index].text.strip()
+
+        # e.g., 'Rome, Italy' or 'New York, NY, United States'
+        city_parts = [part.strip() for part in city_text.split(",")]
+        city = city_parts[0]
+        country = city_parts[-1] if len(city_parts) > 1 else None
+
+        if not cities is None and not (
+            format_city(city) in cities or format_city(city_text) in cities
+        ):
+            continue
+
+        data = [d.text for index, d in enumerate(data) if not index in [0, city_index]]
+        builder.append([str(rank), city, country] + data)  # appending the rank
+
+    return builder.to_dict()
+
+
+def extract_historical_data(
+    page: str,
+    backend: str = "html.parser",
+    parse_only: bool = True,
+    years: Optional[Collection[Any]] = None,
+) -> Dict[str, List[Any]]:
+    """
+    Extracts the historical data table of an item in a country. Only the
+    year of each row is read first, so the rows of the years that aren't
+    kept are skipped without reading any other value.
+
+    Args:
+        page (str): the page HTML code.
+        backend (str, optional): the parser backend. Defaults to "html.parser".
+        parse_only (bool, optional): whether only the historical data table
+            is parsed or not. Defaults to True.
+        years (Optional[Collection[Any]], optional): the years that will be
+            kept. Defaults to None (keeps all the years).
+
+    Returns:
+        Dict[str, List[Any]]: the values of each column of the historical
+            data table.
+    """
+    numbeo_html_data = parse_page(
+        page=page,
+        backend=backend,
+        parse_only=RANKING_TABLE if parse_only else None,
+    )
+    main_table = numbeo_html_data.find("table", attrs={"id": "t2"})
+
+    main_table_header = main_table.find("thead")
+    main_table_header_rows = main_table_header.find_all("th")
+    table_columns_name = [row.text for row in main_table_header_rows]
+    builder = RowBuilder(columns=table_columns_name)
+
+    main_table_body = main_table.find("tbody")
+    main_table_rows = main_table_body.find_all("tr")
+
+    year_index = table_columns_name.index("Year")
+
+    for row in main_table_rows:
+        data = row.find_all("td")
+
+        if not years is None and not int(data[year_index].text) in years:
+            continue
+
+        builder.append([d.text for d in data])
+
+    return builder.to_dict()
+
+
+def extract_cost_of_living_city(
+    page: str,
+    backend: str = "html.parser",
+    parse_only: bool = True,
+) -> Dict[str, List[Any]]:
+    """
+    Extracts the cost of living (or property investment) table of a
+    'city' mode page.
+
+    Args:
+        page (str): the page HTML code.
+        backend (str, optional): the parser backend. Defaults to "html.parser".
+        parse_only (bool, optional): whether only the data table is parsed
+            or not. Defaults to True.
+
+    Returns:
+        Dict[str, List[Any]]: the values of each column of the data table.
+    """
+    numbeo_html_data = parse_page(
+        page=page,
+        backend=backend,
+        parse_only=COST_OF_LIVING_TABLE if parse_only else None,
+    )
+    main_table = numbeo_html_data.find(
+        "table", attrs={"class": "data_wide_table new_bar_table"}
+    )
+
+    main_table_rows = main_table.find_all("tr")
+    current_header = None
+    builder = RowBuilder(columns=["Header", "Category", "Mean", "Range"])
+
+    for row in main_table_rows:
+        data = row.find_all("td")
+        data = [d.text for d in data]
+
+        if len(data) == 0:
+            current_header = row.find_all("th")[0].text
+            current_header = current_header.replace("\n", "").strip()
+            continue
+
+        if len(data) == 2:
+            item, mean = data
+            builder.append([current_header, item, mean, pd.NA])
+
+        if len(data) == 3:
+            item, mean, data_range = data
+            data_range = data_range.replace("\n", "").strip()
+            builder.append([current_header, item, mean, data_range])
+
+    return builder.to_dict()
+
+
+def extract_quality_of_life_city(
+    page: str,
+    backend: str = "html.parser",
+    parse_only: bool = True,
+) -> Dict[str, List[Any]]:
+    """
+    Extracts the quality of life table of a 'city' mode page. The values
+    are spread across the whole page, so it's always fully parsed.
+
+    Args:
+        page (str): the page HTML code.
+        backend (str, optional): the parser backend. Defaults to "html.parser".
+        parse_only (bool, optional): not used (kept so all the extractors
+            have the same signature). Defaults to True.
+
+    Returns:
+        Dict[str, List[Any]]: the values of each column of the data table.
+    """
+    numbeo_html_data = parse_page(page=page, backend=backend)
+
+    # getting the table values and removing the index table value
+    main_table_rows = numbeo_html_data.find_all(
+        "td", attrs={"style": "text-align: right"}
+    )
+    rows_values = [row.text.strip() for row in main_table_rows][1:]
+
+    # getting the table levels
+    main_table_rows = numbeo_html_data.find_all(
+        "td", attrs={"style": "text-align: center; font-weight: 600"}
+    )
+    main_table_rows_cont = numbeo_html_data.find_all(
+        "td", attrs={"style": "text-align: center"}
+    )  # getting the table footer level individually
+    main_table_rows.extend(main_table_rows_cont)
+    rows_levels = [row.text.strip() for row in main_table_rows]
+
+    # getting the name of the categories
+    main_table_rows = numbeo_html_data.find_all("a", attrs={"class": "discreet_link"})
+    rows_labels = [row.text.strip() for row in main_table_rows][1:-1]
+    rows_labels.append("Quality of Life Index")  # fixing the footer label
+
+    quality_of_life_data = {
+        "Category": rows_labels,
+        "Value": rows_values,
+        "Level": rows_levels,
+    }
+    columns_length(quality_of_life_data)
+    return quality_of_life_data
+
+
+def extract_traffic_city(
+    page: str,
+    backend: str = "html.parser",
+    parse_only: bool = True,
+) -> Dict[str, List[Any]]:
+    """
+    Extracts the traffic tables of a 'city' mode page.
+
+    Args:
+        page (str): the page HTML code.
+        backend (str, optional): the parser backend. Defaults to "html.parser".
+        parse_only (bool, optional): whether only the headers and tables are
+            parsed or not. Defaults to True.
+
+    Returns:
+        Dict[str, List[Any]]: the values of each column of the data tables.
+    """
+    numbeo_html_data = parse_page(
+        page=page,
+        backend=backend,
+        parse_only=TRAFFIC_TABLES if parse_only else None,
+    )
+
+    # getting the tables headers
+    tables_headers = numbeo_html_data.find_all("h3")
+
+    # getting the tables
+    tables = [tbl for tbl in numbeo_html_data.find_all("table") if not tbl.attrs][:-1]
+
+    builder = RowBuilder(columns=["Header", "Category", "Value"])
+
+    # extracting the data from the tables
+    builder.extend(
+        get_tables_city_mode(
+            tables_headers=tables_headers,
+            tables=tables,
+            attributes_class_name="trafficCaptionTd",
+            attributes_values_class_name="trafficTd",
+        )
+    )
+
+    # getting the indices table
+    builder.extend(
+        get_index_table(
+            html_data=numbeo_html_data,
+            index_table_class_name="table_indices",
+            indices_values_style="text-align: right",
+            create_level_column=False,
+        )
+    )
+
+    return builder.to_dict()
+
+
+def extract_others_city(
+    page: str,
+    backend: str = "html.parser",
+    parse_only: bool = True,
+) -> Dict[str, List[Any]]:
+    """
+    Extracts others measurements (crime and health care) tables of a
+    'city' mode page.
+
+    Args:
+        page (str): the page HTML code.
+        backend (str, optional): the parser backend. Defaults to "html.parser".
+        parse_only (bool, optional): whether only the headers and tables are
+            parsed or not. Defaults to True.
+
+    Returns:
+        Dict[str, List[Any]]: the values of each column of the data tables.
+    """
+    numbeo_html_data = parse_page(
+        page=page,
+        backend=backend,
+        parse_only=INDICES_TABLES if parse_only else None,
+    )
+
+    # getting the tables headers
+    tables_headers = numbeo_html_data.find_all("h2")
+
+    # getting the tables
+    tables = numbeo_html_data.find_all(
+        "table",
+        attrs={"class": "table_builder_with_value_explanation data_wide_table"},
+    )
+
+    builder = RowBuilder(columns=["Header", "Category", "Value", "Level"])
+
+    # extracting the data from the tables
+    builder.extend(
+        get_tables_city_mode(
+            tables_headers=tables_headers,
+            tables=tables,
+            attributes_class_name="columnWithName",
+            attributes_values_class_name="indexValueTd",
+            levels_class_name="hidden_on_small_mobile",
+        )
+    )
+
+    # getting the indices table
+    builder.extend(
+        get_index_table(
+            html_data=numbeo_html_data,
+            index_table_class_name="table_indices",
+            indices_values_style="text-align: right",
+        )
+    )
+
+    return builder.to_dict()
+
+
+def extract_pollution_city(
+    page: str,
+    backend: str = "html.parser",
+    parse_only: bool = True,
+) -> Dict[str, List[Any]]:
+    """
+    Extracts the pollution tables of a 'city' mode page.
+
+    Args:
+        page (str): the page HTML code.
+        backend (str, optional): the parser backend. Defaults to "html.parser".
+        parse_only (bool, optional): whether only the headers and tables are
+            parsed or not. Defaults to True.
+
+    Returns:
+        Dict[str, List[Any]]: the values of each column of the data tables.
+    """
+    numbeo_html_data = parse_page(
+        page=page,
+        backend=backend,
+        parse_only=INDICES_TABLES if parse_only else None,
+    )
+
+    # getting the tables headers
+    tables_headers = numbeo_html_data.find_all("h2")
+
+    # getting the tables
+    tables = numbeo_html_data.find_all(
+        "table",
+        attrs={"class": "table_builder_with_value_explanation data_wide_table"},
+    )
+
+    builder = RowBuilder(columns=["Header", "Category", "Value", "Level"])
+
+    # extracting the data from the tables
+    builder.extend(
+        get_tables_city_mode(
+            tables_headers=tables_headers,
+            tables=tables,
+            attributes_class_name="columnWithName",
+            attributes_values_class_name="indexValueTd",
+            levels_class_name="hidden_on_small_mobile",
+        )
+    )
+
+    # getting the pollution indices table
+    try:
+        pol_indices_data = get_index_table(
+            html_data=numbeo_html_data,
+            index_table_class_name="who_pollution_data_widget",
+            indices_values_style="text-align: right",
+            pollution_index_table=True,
+        )
+    except AttributeError:
+        # some cities doesn't have the pollution index table,
+        # so we'll just ignore it
+        logger.warning("Could not find the pollution index table.\n")
+        pol_indices_data = None
+
+    # getting the indices table
+    builder.extend(
+        get_index_table(
+            html_data=numbeo_html_data,
+            index_table_class_name="table_indices",
+            indices_values_style="text-align: right",
+        )
+    )
+    builder.extend(pol_indices_data)
+
+    return builder.to_dict()
+
+
+@logger.catch
+def get_index_table(
+    html_data: BeautifulSoup,
+    index_table_class_name: str,
+    indices_values_style: str,
+    pollution_index_table: bool = False,
+    create_level_column: bool = True,
+) -> Dict[str, List[Any]]:
+    """
+    Extracts the index table within the page. This necessary only
+    when we are getting the data using the 'city' mode (and only
+    for the 'crime', 'health care', 'traffic', and 'pollution'
+    measurements).
+
+    Args:
+        html_data (BeautifulSoup): the page HTML code.
+        index_table_class_name (str): the index table class string.
+            It's used to identify the index table.
+        indices_values_style (str): the indices values style string.
+            It's used to extract the table values.
+        pollution_index_table (bool, optional): Whether it's a special
+            case of the individual pollution index table or not. Defaults to False.
+        create_level_column (bool, optional): Whether to create
+            a 'Level' column or not. Defaults to True.
+
+    Returns:
+        Dict[str, List[Any]]: the values of each column of the index table.
+    """
+    logger.debug(
+        "Getting the index table using values: "
+        + f"index_table_class_name: {index_table_class_name}, "
+        + f"indices_values_style: {indices_values_style}, "
+        + f"pollution_index_table: {pollution_index_table}, "
+        + f"create_level_column: {create_level_column}\n"
+    )
+
+    # getting the indices table
+    indices_table = html_data.find("table", attrs={"class": index_table_class_name})
+
+    # extracting the indices name
+    indices = [ind for ind in indices_table.find_all("td") if not ind.attrs]
+    indices = [indice.text.strip().replace(":", "") for indice in indices]
+
+    # extracting the indices values
+    indices_values = indices_table.find_all(
+        "td",
+        attrs={"style": indices_values_style},
+    )
+    indices_values = [value.text.strip().replace(":", "") for value in indices_values]
+
+    # creating the index table columns
+    if not pollution_index_table:
+        indices_data = {
+            "Header": ["Index"] * len(indices),
+            "Category": indices,
+            "Value": indices_values,
+            "Level": [pd.NA] * len(indices),
+        }
+    else:
+        indices_data = {
+            "Header": ["Index"] * len(indices),
+            "Category": indices,
+            "Value": indices_values[:-1] + [pd.NA],
+            "Level": [pd.NA, pd.NA, indices_values[-1]],
+        }
+
+    # deleting the 'level' column
+    if not create_level_column:
+        logger.debug("Deleting the 'level' column.\n")
+        del indices_data["Level"]
+
+    columns_length(indices_data)
+    return indices_data
+
+
+@logger.catch
+def get_tables_city_mode(
+    tables_headers: List,
+    tables: List,
+    attributes_class_name: str,
+    attributes_values_class_name: str,
+    levels_class_name: str = None,
+) -> Dict[str, List[Any]]:
+    """
+    Extracts the tables for the majority of the measurements for the 'city'
+    mode. With the exception of 'cost of living', the page for the other
+    measures isn't organized in just only table, but rather multiple ones.
+
+    Args:
+        tables_headers (List): a list containing the tables headears.
+        tables (List): a list containing the tables HTML.
+        attributes_class_name (str): the table attributes class string.
+            It's used to identify the table attributes.
+        attributes_values_class_name (str): the table attributes values
+            class string. It's used to identify the table data.
+        levels_class_name (str, optional): the levels class string.
+            It's used to identify the table measures levels. Defaults to None.
+
+    Returns:
+        Dict[str, List[Any]]: the values of each column of the collected data.
+    """
+    logger.debug(
+        "Getting the data table for city mode using values: "
+        + f"attributes_class_name: {attributes_class_name}, "
+        + f"attributes_values_class_name: {attributes_values_class_name}, "
+        + f"levels_class_name: {levels_class_name}\n"
+    )
+    columns = ["Header", "Category", "Value"]
+
+    if not levels_class_name is None:
+        columns.append("Level")
+
+    builder = RowBuilder(columns=columns)
+
+    for header, table in zip(
+        tables_headers,
+        tables,
+    ):
+        # getting only the header text
+        header_text = header.text
+
+        # getting the attributes name
+        attributes_name = table.find_all(
+            "td",
+            attrs={"class": attributes_class_name},
+        )
+        attributes_name = [att.text.strip() for att in attributes_name]
+
+        # getting the attributes value
+        values = table.find_all(
+            "td",
+            attrs={"class": attributes_values_class_name},
+        )
+        values = [value.text.strip() for value in values]
+
+        # getting the levels value
+        if not levels_class_name is None:
+            levels = table.find_all(
+                "td",
+                attrs={"class": levels_class_name},
+            )
+            levels = [level.text.strip() for level in levels]
+
+            builder.extend(
+                {
+                    "Header": [header_text] * len(values),
+                    "Category": attributes_name,
+                    "Value": values,
+                    "Level": levels,
+                }
+            )
+        else:
+            builder.extend(
+                {
+                    "Header": [header_text] * len(values),
+                    "Category": attributes_name,
+                    "Value": values,
+                }
+            )
+
+    return builder.to_dict()
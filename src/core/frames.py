@@ -0,0 +1,192 @@
+from __future__ import annotations
+
+from typing import Any, Dict, List, Optional
+
+from .utils import lazy_import
+
+pd = lazy_import("pandas")
+
+
+def columns_length(
+    data: Dict[str, List[Any]],
+) -> int:
+    """
+    Gets the number of rows of a table given the values of each column.
+
+    Args:
+        data (Dict[str, List[Any]]): the values of each column.
+
+    Raises:
+        ValueError: if the columns don't have the same number of values.
+
+    Returns:
+        int: the number of rows.
+    """
+    lengths = set(len(values) for values in data.values())
+
+    if len(lengths) > 1:
+        raise ValueError("All the columns must have the same number of values.")
+
+    return lengths.pop() if len(lengths) > 0 else 0
+
+
+class RowBuilder:
+    """
+    Accumulates the rows of a table column by column (as Python lists),
+    so the dataframe is created only once instead of concatenating
+    a new dataframe for every row.
+    """
+
+    def __init__(
+        self,
+        columns: List[str],
+    ) -> None:
+        """
+        Args:
+            columns (List[str]): the table columns name, in order.
+        """
+        self.columns = list(columns)
+        self._data = {column: [] for column in self.columns}
+
+    def __len__(self) -> int:
+        """
+        Gets the number of rows accumulated so far.
+
+        Returns:
+            int: the number of rows.
+        """
+        return len(self._data[self.columns[0]]) if len(self.columns) > 0 else 0
+
+    def append(
+        self,
+        row: List[Any],
+    ) -> None:
+        """
+        Adds a single row, with one value for each column (in order).
+
+        Args:
+            row (List[Any]): the row values.
+        """
+        if len(row) != len(self.columns):
+            raise ValueError(
+                f"Expected {len(self.columns)} values, but got {len(row)}: {row}."
+            )
+
+        for column, value in zip(self.columns, row):
+            self._data[column].append(value)
+
+    def extend(
+        self,
+        data: Optional[Dict[str, List[Any]]],
+    ) -> None:
+        """
+        Adds several rows at once, given the values of each column.
+
+        Args:
+            data (Optional[Dict[str, List[Any]]]): the values of each column
+                (None is ignored, which is what the extractors return when
+                they fail).
+        """
+        if data is None:
+            return
+
+        if sorted(data.keys()) != sorted(self.columns):
+            raise ValueError(
+                f"Expected columns {self.columns}, but got {list(data.keys())}."
+            )
+
+        columns_length(data)
+
+        for column in self.columns:
+            self._data[column].extend(data[column])
+
+    def to_dict(self) -> Dict[str, List[Any]]:
+        """
+        Gets the values of each column accumulated so far.
+
+        Returns:
+            Dict[str, List[Any]]: the values of each column.
+        """
+        return self._data
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """
+        Creates the dataframe with all the rows accumulated.
+
+        Returns:
+            pd.DataFrame: the table in a dataframe format.
+        """
+        return to_dataframe(self._data)
+
+
+def to_dataframe(
+    data: Dict[str, List[Any]],
+) -> pd.DataFrame:
+    """
+    Creates a dataframe given the values of each column.
+
+    Args:
+        data (Dict[str, List[Any]]): the values of each column.
+
+    Returns:
+        pd.DataFrame: the table in a dataframe format.
+    """
+    if columns_length(data) == 0:
+        return pd.DataFrame(columns=list(data.keys()))
+
+    return pd.DataFrame(data)
+
+
+def concat_frames(
+    dataframes: List[pd.DataFrame],
+) -> pd.DataFrame:
+    """
+    Concatenates all the dataframes of a category at once.
+
+    Args:
+        dataframes (List[pd.DataFrame]): the dataframes (one per page).
+
+    Returns:
+        pd.DataFrame: the concatenated dataframe (an empty dataframe
+            if there is nothing to concatenate).
+    """
+    if len(dataframes) == 0:
+        return pd.DataFrame()
+
+    return pd.concat(dataframes, axis=0, ignore_index=True)
+
+
+def pivot_records(
+    data: Dict[str, List[Any]],
+    index: List[str],
+    column: str,
+    value: str,
+) -> pd.DataFrame:
+    """
+    Pivots long-format records (one row per index and column) into a wide
+    table at once, where each distinct value of the `column` column
+    becomes a column (in the order they first appear) and the rows are
+    sorted by the index columns. The missing values are set to NaN.
+
+    Args:
+        data (Dict[str, List[Any]]): the values of each column of the records.
+        index (List[str]): the columns that identify each row.
+        column (str): the column whose values become the new columns.
+        value (str): the column with the values.
+
+    Returns:
+        pd.DataFrame: the wide table, with the index columns first.
+    """
+    records = to_dataframe(data)
+    columns = pd.unique(records[column]).tolist()
+
+    if records.empty:
+        return pd.DataFrame(columns=index)
+
+    # the first record is kept when the same index and column are duplicated
+    records = records.drop_duplicates(subset=index + [column], keep="first")
+
+    wide = records.pivot(index=index, columns=column, values=value)
+    wide = wide.reindex(columns=columns).reset_index()
+    wide.columns.name = None
+    return wide
@@ -0,0 +1,77 @@
+import sys
+from itertools import count
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+from loguru import logger
+
+from ..schema.log import LoggingSettings
+
+
+def sampling_filter(
+    sampling: int,
+) -> Callable[[Dict[str, Any]], bool]:
+    """
+    Creates a loguru filter that keeps one in every `sampling` records below
+    the WARNING level (e.g., the per-page summaries of a large run), while
+    the warnings and errors are always kept.
+
+    Args:
+        sampling (int): keeps one in every `sampling` records.
+
+    Returns:
+        Callable[[Dict[str, Any]], bool]: the filter function.
+    """
+    counter = count()
+    warning_level = logger.level("WARNING").no
+
+    def keep_record(record: Dict[str, Any]) -> bool:
+        if record["level"].no >= warning_level:
+            return True
+
+        return next(counter) % sampling == 0
+
+    return keep_record
+
+
+def configure_logging(
+    settings: Optional[LoggingSettings] = None,
+) -> int:
+    """
+    Sets up the scraper logging, replacing all the loguru sinks (including
+    the default one) by a single sink. Nothing is set up when the package
+    is imported, so the logging is only changed by calling this function.
+
+    Args:
+        settings (Optional[LoggingSettings], optional): the logging settings
+            (level, sink and sampling). Defaults to None (uses the default
+            settings, which logs to the standard error).
+
+    Returns:
+        int: the sink identifier (see `logger.remove`).
+    """
+    if settings is None:
+        settings = LoggingSettings()
+
+    sink_filter = None
+
+    if settings.LOG_SAMPLING > 1:
+        sink_filter = sampling_filter(settings.LOG_SAMPLING)
+
+    logger.remove()
+
+    if settings.LOG_PATH is None:
+        return logger.add(
+            sys.stderr,
+            level=settings.LOG_LEVEL,
+            filter=sink_filter,
+        )
+
+    return logger.add(
+        Path.joinpath(settings.LOG_PATH, "loguru.log"),
+        level=settings.LOG_LEVEL,
+        filter=sink_filter,
+        rotation="1 day",
+        retention="7 days",
+        compression="zip",
+    )
@@ -0,0 +1,539 @@
+from __future__ import annotations
+
+import bisect
+import json
+import threading
+import time
+from contextlib import contextmanager
+from functools import lru_cache
+from itertools import accumulate
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from loguru import logger
+
+from .utils import lazy_import
+from ..schema.metrics import MetricsSettings, VALID_METRICS_FORMATS
+
+aiohttp = lazy_import("aiohttp")
+requests = lazy_import("requests")
+urllib3 = lazy_import("urllib3")
+
+
+METRICS_PREFIX = "numbeo_scraper"
+
+# the name (in the Prometheus format) and the description of each metric
+METRICS = {
+    "dns": ("dns_seconds", "Time to resolve the host name of the requests."),
+    "connect": ("connect_seconds", "Time to open the connections (TCP and TLS)."),
+    "ttfb": ("ttfb_seconds", "Time from sending the requests to the first byte."),
+    "download": ("download_seconds", "Time to download the response bodies."),
+    "bytes": ("response_bytes", "Size of the response bodies."),
+    "parse": ("parse_seconds", "Time to parse the pages."),
+    "extract": ("extract_seconds", "Time to extract the data of the parsed pages."),
+    "frame": ("frame_seconds", "Time to build the dataframes of the extracted data."),
+}
+
+# a hook receives the metric, the value, the category, the mode and the page
+# URL (None when the value isn't related to a single page) of each value
+MetricsHook = Callable[[str, float, str, str, Optional[str]], None]
+
+# the timing of the request (or of the parsing) running in the current thread
+_active = threading.local()
+
+
+class Histogram:
+    """
+    Counts the values observed in each bucket (the buckets are cumulative
+    when exported, following the Prometheus histograms).
+    """
+
+    def __init__(
+        self,
+        buckets: List[float],
+    ) -> None:
+        """
+        Args:
+            buckets (List[float]): the upper bounds of the buckets.
+        """
+        self.buckets = sorted(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(
+        self,
+        value: float,
+    ) -> None:
+        """
+        Adds a value to the histogram.
+
+        Args:
+            value (float): the observed value.
+        """
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative_counts(self) -> Dict[str, int]:
+        """
+        Gets the number of values lower than or equal to each upper bound.
+
+        Returns:
+            Dict[str, int]: the cumulative count of each upper bound
+                (the last one is '+Inf').
+        """
+        bounds = [repr(float(bound)) for bound in self.buckets] + ["+Inf"]
+        return dict(zip(bounds, accumulate(self.counts)))
+
+
+class RequestTiming:
+    """
+    The time of each phase of a request. The time spent resolving the host
+    name and opening the connection is only known when a new connection is
+    opened (it's None when a pooled connection is reused).
+    """
+
+    def __init__(self) -> None:
+        self.start = time.perf_counter()
+        self.dns = None
+        self.connect = None  # includes the DNS resolution
+        self.headers = None
+        self.end = None
+
+    def __enter__(self) -> "RequestTiming":
+        _active.timing = self
+        return self
+
+    def __exit__(self, *args) -> None:
+        _active.timing = None
+
+    def add(
+        self,
+        phase: str,
+        seconds: float,
+    ) -> None:
+        """
+        Adds the time spent in a phase (e.g., a request can open more than
+        one connection when it's redirected).
+
+        Args:
+            phase (str): the phase ('dns' or 'connect').
+            seconds (float): the time spent.
+        """
+        setattr(self, phase, (getattr(self, phase) or 0.0) + seconds)
+
+    def received_headers(self) -> None:
+        """
+        Marks the time the response headers were received.
+        """
+        self.headers = time.perf_counter()
+
+    def received_body(self) -> None:
+        """
+        Marks the time the response body was received.
+        """
+        self.end = time.perf_counter()
+
+    def stages(self) -> Dict[str, float]:
+        """
+        Gets the time spent in each stage of the request.
+
+        Returns:
+            Dict[str, float]: the time (in seconds) of each stage.
+        """
+        stages = {}
+        connect = self.connect or 0.0
+
+        if not self.dns is None:
+            stages["dns"] = self.dns
+
+        if not self.connect is None:
+            stages["connect"] = max(self.connect - (self.dns or 0.0), 0.0)
+
+        if not self.headers is None:
+            stages["ttfb"] = max(self.headers - self.start - connect, 0.0)
+
+            if not self.end is None:
+                stages["download"] = self.end - self.headers
+
+        return stages
+
+
+def record_parse_time(
+    seconds: float,
+) -> None:
+    """
+    Adds the time spent parsing a page to the extraction running in the
+    current thread (see the `timed_extraction` function), if any.
+
+    Args:
+        seconds (float): the time spent parsing the page.
+    """
+    if not getattr(_active, "parse", None) is None:
+        _active.parse += seconds
+
+
+def timed_extraction(
+    extractor: Callable[..., Optional[Dict[str, List[Any]]]],
+    **kwargs,
+) -> Tuple[Optional[Dict[str, List[Any]]], float, float]:
+    """
+    Extracts the data of a page, measuring the time spent parsing it and
+    the time spent extracting the data of the parsed page. It can run in
+    another process (e.g., the pipelined mode).
+
+    Args:
+        extractor (Callable[..., Optional[Dict[str, List[Any]]]]): the
+            function that extracts the page data.
+        **kwargs: the extractor arguments.
+
+    Returns:
+        Tuple[Optional[Dict[str, List[Any]]], float, float]: the extracted
+            data, the parsing time and the extraction time (in seconds).
+    """
+    _active.parse = 0.0
+    start = time.perf_counter()
+
+    try:
+        data = extractor(**kwargs)
+        seconds = time.perf_counter() - start
+        parse_seconds = _active.parse
+    finally:
+        _active.parse = None
+
+    return data, parse_seconds, max(seconds - parse_seconds, 0.0)
+
+
+def _record_connect_time(
+    seconds: float,
+) -> None:
+    """
+    Adds the time spent opening a connection to the request running in the
+    current thread (see the `RequestTiming` class), if any.
+
+    Args:
+        seconds (float): the time spent opening the connection.
+    """
+    timing = getattr(_active, "timing", None)
+
+    if not timing is None:
+        timing.add("connect", seconds)
+
+
+@lru_cache(maxsize=None)
+def timed_adapter_class() -> type:
+    """
+    Creates (only once, so requests and urllib3 are only imported when
+    it's used) the HTTP adapter that measures the time spent opening the
+    connections. urllib3 resolves the host name while it's connecting,
+    so the DNS resolution is part of the connection time.
+
+    Returns:
+        type: the HTTP adapter class.
+    """
+
+    class TimedConnectionMixin:
+        def connect(self) -> None:
+            start = time.perf_counter()
+
+            try:
+                super().connect()
+            finally:
+                _record_connect_time(time.perf_counter() - start)
+
+    class TimedHTTPConnection(TimedConnectionMixin, urllib3.connection.HTTPConnection):
+        pass
+
+    class TimedHTTPSConnection(
+        TimedConnectionMixin, urllib3.connection.HTTPSConnection
+    ):
+        pass
+
+    class TimedHTTPConnectionPool(urllib3.HTTPConnectionPool):
+        ConnectionCls = TimedHTTPConnection
+
+    class TimedHTTPSConnectionPool(urllib3.HTTPSConnectionPool):
+        ConnectionCls = TimedHTTPSConnection
+
+    class TimedHTTPAdapter(requests.adapters.HTTPAdapter):
+        def init_poolmanager(self, *args, **kwargs) -> None:
+            super().init_poolmanager(*args, **kwargs)
+            self.poolmanager.pool_classes_by_scheme = {
+                "http": TimedHTTPConnectionPool,
+                "https": TimedHTTPSConnectionPool,
+            }
+
+    return TimedHTTPAdapter
+
+
+def trace_config() -> aiohttp.TraceConfig:
+    """
+    Creates the aiohttp trace config that measures the time spent resolving
+    the host names and opening the connections of the requests sent with
+    a `RequestTiming` instance as their `trace_request_ctx`.
+
+    Returns:
+        aiohttp.TraceConfig: the trace config.
+    """
+    config = aiohttp.TraceConfig()
+
+    def phase_callbacks(phase: str) -> Tuple[Callable, Callable]:
+        async def on_start(session, context, params) -> None:
+            setattr(context, f"{phase}_start", time.perf_counter())
+
+        async def on_end(session, context, params) -> None:
+            timing = context.trace_request_ctx
+
+            if isinstance(timing, RequestTiming):
+                start = getattr(context, f"{phase}_start")
+                timing.add(phase, time.perf_counter() - start)
+
+        return on_start, on_end
+
+    on_start, on_end = phase_callbacks("dns")
+    config.on_dns_resolvehost_start.append(on_start)
+    config.on_dns_resolvehost_end.append(on_end)
+
+    on_start, on_end = phase_callbacks("connect")
+    config.on_connection_create_start.append(on_start)
+    config.on_connection_create_end.append(on_end)
+    return config
+
+
+def _escape_label(value: str) -> str:
+    """
+    Escapes a label value of the Prometheus text format.
+
+    Args:
+        value (str): the label value.
+
+    Returns:
+        str: the escaped label value.
+    """
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class MetricsRegistry:
+    """
+    Aggregates the time spent in each stage of the scraper (requesting,
+    parsing and extracting each page and building the dataframes) into
+    histograms per category and mode, keeping the metrics of each URL too.
+    The values are also passed to the hooks as soon as they're observed.
+    """
+
+    def __init__(
+        self,
+        settings: Optional[MetricsSettings] = None,
+    ) -> None:
+        """
+        Args:
+            settings (Optional[MetricsSettings], optional): the metrics
+                settings. Defaults to None (uses the default settings).
+        """
+        if settings is None:
+            settings = MetricsSettings()
+
+        self.settings = settings
+        self.histograms: Dict[Tuple[str, str, str], Histogram] = {}
+        self.pages: Dict[str, Dict[str, Any]] = {}
+        self.hooks: List[MetricsHook] = []
+        self._lock = threading.Lock()
+
+    def add_hook(
+        self,
+        hook: MetricsHook,
+    ) -> None:
+        """
+        Adds a function that is called with each observed value.
+
+        Args:
+            hook (MetricsHook): the function, which receives the metric,
+                the value, the category, the mode and the page URL.
+        """
+        self.hooks.append(hook)
+
+    def observe(
+        self,
+        metric: str,
+        value: float,
+        category: str,
+        mode: str,
+        url: Optional[str] = None,
+    ) -> None:
+        """
+        Adds a value to the histogram of the metric, category and mode.
+
+        Args:
+            metric (str): the metric (see `METRICS`).
+            value (float): the observed value.
+            category (str): the category.
+            mode (str): the mode.
+            url (Optional[str], optional): the page URL. Defaults to None
+                (the value isn't related to a single page).
+        """
+        with self._lock:
+            key = (metric, category, mode)
+
+            if not key in self.histograms:
+                buckets = self.settings.buckets
+
+                if metric == "bytes":
+                    buckets = self.settings.size_buckets
+
+                self.histograms[key] = Histogram(buckets)
+
+            self.histograms[key].observe(value)
+
+            if not url is None and self.settings.keep_pages:
+                page = self.pages.setdefault(url, {"category": category, "mode": mode})
+                page[metric] = page.get(metric, 0) + value
+
+        for hook in self.hooks:
+            hook(metric, value, category, mode, url)
+
+    def observe_request(
+        self,
+        timing: RequestTiming,
+        size: Optional[int],
+        category: str,
+        mode: str,
+        url: str,
+    ) -> None:
+        """
+        Adds the time spent in each stage of a request and the size of its
+        response body.
+
+        Args:
+            timing (RequestTiming): the request timing.
+            size (Optional[int]): the response body size (in bytes) or None
+                if the body wasn't downloaded.
+            category (str): the category.
+            mode (str): the mode.
+            url (str): the page URL.
+        """
+        for stage, seconds in timing.stages().items():
+            self.observe(stage, seconds, category, mode, url=url)
+
+        if not size is None:
+            self.observe("bytes", size, category, mode, url=url)
+
+    @contextmanager
+    def timer(
+        self,
+        metric: str,
+        category: str,
+        mode: str,
+        url: Optional[str] = None,
+    ) -> Iterator[None]:
+        """
+        Measures the time spent in a block of code (if it doesn't fail).
+
+        Args:
+            metric (str): the metric (see `METRICS`).
+            category (str): the category.
+            mode (str): the mode.
+            url (Optional[str], optional): the page URL. Defaults to None.
+        """
+        start = time.perf_counter()
+        yield
+        self.observe(metric, time.perf_counter() - start, category, mode, url=url)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Gets the histograms and the metrics of each URL.
+
+        Returns:
+            Dict[str, Any]: the histograms and the metrics of each URL.
+        """
+        with self._lock:
+            histograms = [
+                {
+                    "metric": metric,
+                    "category": category,
+                    "mode": mode,
+                    "buckets": histogram.cumulative_counts(),
+                    "sum": histogram.sum,
+                    "count": histogram.count,
+                }
+                for (metric, category, mode), histogram in self.histograms.items()
+            ]
+            pages = {url: dict(page) for url, page in self.pages.items()}
+
+        return {"histograms": histograms, "pages": pages}
+
+    def to_prometheus(self) -> str:
+        """
+        Gets the histograms in the Prometheus text format.
+
+        Returns:
+            str: the histograms in the Prometheus text format.
+        """
+        lines = []
+
+        with self._lock:
+            for metric, (name, description) in METRICS.items():
+                histograms = [
+                    (category, mode, histogram)
+                    for (key, category, mode), histogram in self.histograms.items()
+                    if key == metric
+                ]
+
+                if len(histograms) == 0:
+                    continue
+
+                name = f"{METRICS_PREFIX}_{name}"
+                lines.append(f"# HELP {name} {description}")
+                lines.append(f"# TYPE {name} histogram")
+
+                for category, mode, histogram in histograms:
+                    labels = (
+                        f'category="{_escape_label(category)}",'
+                        + f'mode="{_escape_label(mode)}"'
+                    )
+
+                    for bound, count in histogram.cumulative_counts().items():
+                        lines.append(f'{name}_bucket{{{labels},le="{bound}"}} {count}')
+
+                    lines.append(f"{name}_sum{{{labels}}} {histogram.sum!r}")
+                    lines.append(f"{name}_count{{{labels}}} {histogram.count}")
+
+        return "\n".join(lines) + "\n"
+
+    def export(
+        self,
+        path: Optional[Path] = None,
+        format: Optional[VALID_METRICS_FORMATS] = None,
+    ) -> Path:
+        """
+        Writes the metrics to a file, as a Prometheus text file (e.g., for
+        the node exporter textfile collector) or as JSON.
+
+        Args:
+            path (Optional[Path], optional): the file path. Defaults to None
+                (uses the path of the settings).
+            format (Optional[VALID_METRICS_FORMATS], optional): the file
+                format. Defaults to None (uses the format of the settings).
+
+        Returns:
+            Path: the file path.
+        """
+        path = path or self.settings.path
+        format = format or self.settings.format
+
+        try:
+            assert not path is None
+        except AssertionError as error:
+            logger.error("The metrics path can not be empty.\n")
+            raise AssertionError("The metrics path can not be empty.\n") from error
+
+        path = Path(path)
+
+        if format == "json":
+            text = json.dumps(self.to_dict(), indent=4) + "\n"
+        else:
+            text = self.to_prometheus()
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(text, encoding="utf-8")
+        return path
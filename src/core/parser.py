@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import time
+from functools import lru_cache
+from typing import NamedTuple, Optional, Tuple, Union
+
+from .metrics import record_parse_time
+from .utils import lazy_import
+
+bs4 = lazy_import("bs4")
+
+
+class PageParts(NamedTuple):
+    """
+    The only parts of a page that are built when it's parsed (the tags
+    and attributes of a `SoupStrainer`), described without importing
+    BeautifulSoup until the first page is parsed.
+    """
+
+    tags: Union[str, Tuple[str, ...]]
+    attributes: Tuple[Tuple[str, str], ...] = ()
+
+
+# the only parts of each page that are used to extract the data, so the
+# rest of the document isn't built (the quality of life page in 'city'
+# mode uses elements spread across the whole page, so it's fully parsed)
+RANKING_TABLE = PageParts("table", (("id", "t2"),))
+COST_OF_LIVING_TABLE = PageParts("table", (("class", "data_wide_table new_bar_table"),))
+TRAFFIC_TABLES = PageParts(("h3", "table"))
+INDICES_TABLES = PageParts(("h2", "table"))
+
+
+@lru_cache(maxsize=None)
+def get_strainer(parts: PageParts) -> bs4.SoupStrainer:
+    """
+    Creates the strainer of the parts of a page (only once for each parts).
+
+    Args:
+        parts (PageParts): the parts of the page.
+
+    Returns:
+        bs4.SoupStrainer: the strainer.
+    """
+    tags = parts.tags if isinstance(parts.tags, str) else list(parts.tags)
+    return bs4.SoupStrainer(tags, attrs=dict(parts.attributes))
+
+
+def is_backend_available(backend: str) -> bool:
+    """
+    Checks if a parser backend is installed.
+
+    Args:
+        backend (str): the parser backend name (e.g., 'lxml').
+
+    Returns:
+        bool: whether the parser backend can be used or not.
+    """
+    return not bs4.builder.builder_registry.lookup(backend) is None
+
+
+def parse_page(
+    page: str,
+    backend: str = "html.parser",
+    parse_only: Optional[Union[PageParts, bs4.SoupStrainer]] = None,
+) -> bs4.BeautifulSoup:
+    """
+    Parses a page HTML code.
+
+    Args:
+        page (str): the page HTML code.
+        backend (str, optional): the parser backend. Defaults to "html.parser".
+        parse_only (Optional[Union[PageParts, bs4.SoupStrainer]], optional): the
+            only parts of the page that are built. Defaults to None (the whole page).
+
+    Returns:
+        bs4.BeautifulSoup: the parsed page.
+    """
+    if isinstance(parse_only, PageParts):
+        parse_only = get_strainer(parse_only)
+
+    start = time.perf_counter()
+    soup = bs4.BeautifulSoup(page, backend, parse_only=parse_only)
+    record_parse_time(time.perf_counter() - start)
+    return soup
@@ -0,0 +1,83 @@
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+
+class FetchUnit(NamedTuple):
+    """
+    A page that must be fetched to extract the data of a category.
+    """
+
+    category: str
+    mode: str
+    key: Tuple[Any, ...]  # identifies the page within the category
+    url: str
+
+
+class RequestPlan(NamedTuple):
+    """
+    The pages that a config implies and the filters applied locally
+    after the data is extracted, computed before anything is requested.
+    """
+
+    units: List[FetchUnit]
+    urls: List[str]  # the unique pages URL, in the order they are requested
+    cached_urls: List[str]  # the pages that will be obtained from the cache
+    filters: Dict[str, Dict[str, List[Any]]]  # category -> column -> values
+    estimated_time: float  # in seconds
+
+    @property
+    def request_count(self) -> int:
+        """
+        Gets the number of pages that will be requested.
+
+        Returns:
+            int: the number of requests.
+        """
+        return len(self.urls) - len(self.cached_urls)
+
+    def summary(self) -> str:
+        """
+        Creates a human readable summary of the plan.
+
+        Returns:
+            str: the plan summary.
+        """
+        lines = [
+            f"{len(self.units)} pages needed, {len(self.urls)} unique pages, "
+            + f"{len(self.cached_urls)} cached and {self.request_count} requests.",
+            f"Estimated time: {self.estimated_time:.1f} seconds.",
+        ]
+
+        for category, filters in self.filters.items():
+            for column, values in filters.items():
+                lines.append(
+                    f"Filter '{category}' data locally by '{column}': {values}."
+                )
+
+        return "\n".join(lines)
+
+
+def estimate_time(
+    request_count: int,
+    latency: float,
+    max_concurrency: int,
+    rate: Optional[float] = None,
+) -> float:
+    """
+    Estimates how long it takes to request the pages.
+
+    Args:
+        request_count (int): the number of requests.
+        latency (float): the average time of a request (in seconds).
+        max_concurrency (int): the maximum number of concurrent requests.
+        rate (Optional[float], optional): the maximum number of requests per
+            second (if the requests are rate limited). Defaults to None.
+
+    Returns:
+        float: the estimated time (in seconds).
+    """
+    estimated_time = request_count * latency / max_concurrency
+
+    if not rate is None:
+        estimated_time = max(estimated_time, request_count / rate)
+
+    return estimated_time
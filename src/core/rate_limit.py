@@ -0,0 +1,208 @@
+import asyncio
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Optional
+
+from loguru import logger
+
+from ..schema.rate_limit import RateLimitSettings
+
+
+# status codes which mean that the request can succeed if it's sent again later
+RETRY_STATUS_CODES = frozenset([429, 500, 502, 503, 504])
+# status codes which mean that Numbeo is throttling the requests
+THROTTLE_STATUS_CODES = frozenset([429, 503])
+
+
+def parse_retry_after(retry_after: Optional[str]) -> Optional[float]:
+    """
+    Parses the 'Retry-After' header, which can be either a number
+    of seconds or a HTTP date.
+
+    Args:
+        retry_after (Optional[str]): the 'Retry-After' header value.
+
+    Returns:
+        Optional[float]: the number of seconds to wait or None if the
+            header is empty or invalid.
+    """
+    if retry_after is None:
+        return None
+
+    try:
+        return max(0.0, float(retry_after))
+    except ValueError:
+        pass
+
+    try:
+        retry_date = parsedate_to_datetime(retry_after)
+    except (TypeError, ValueError):
+        return None
+
+    # dates with the '-0000' zone are parsed without a timezone
+    if retry_date.tzinfo is None:
+        retry_date = retry_date.replace(tzinfo=timezone.utc)
+
+    return max(0.0, (retry_date - datetime.now(timezone.utc)).total_seconds())
+
+
+class RateLimiter:
+    """
+    Token bucket rate limiter with AIMD (additive increase, multiplicative
+    decrease) control of both the request rate and the number of concurrent
+    requests. The rate and the concurrency are cut when Numbeo throttles
+    the requests (429/503 status codes, respecting the 'Retry-After' header)
+    and slowly ramped up again while the requests succeed.
+
+    The same limiter can be used by threads and by asyncio tasks.
+    """
+
+    def __init__(
+        self,
+        settings: RateLimitSettings,
+        max_concurrency: int,
+    ) -> None:
+        """
+        Creates a rate limiter instance.
+
+        Args:
+            settings (RateLimitSettings): the rate limiter settings.
+            max_concurrency (int): the maximum number of concurrent requests.
+        """
+        self.settings = settings
+        self.max_concurrency = max_concurrency
+
+        self.rate = min(max(settings.rate, settings.min_rate), settings.max_rate)
+        self.concurrency = max_concurrency
+        self.in_flight = 0
+
+        self._tokens = float(settings.burst)
+        self._updated_at = time.monotonic()
+        self._paused_until = 0.0
+        self._successes = 0
+        self._lock = threading.Lock()
+
+    def _try_acquire(self) -> float:
+        """
+        Tries to take a token and a concurrency slot.
+
+        Returns:
+            float: 0 if the request can be sent, otherwise the number
+                of seconds to wait before trying again.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                float(self.settings.burst),
+                self._tokens + (now - self._updated_at) * self.rate,
+            )
+            self._updated_at = now
+
+            if now < self._paused_until:
+                return self._paused_until - now
+
+            if self.in_flight >= self.concurrency:
+                return min(0.05, 1 / self.rate)
+
+            if self._tokens < 1:
+                return (1 - self._tokens) / self.rate
+
+            self._tokens -= 1
+            self.in_flight += 1
+            return 0.0
+
+    def acquire(self) -> None:
+        """
+        Blocks until a request can be sent.
+        """
+        delay = self._try_acquire()
+
+        while delay > 0:
+            time.sleep(delay)
+            delay = self._try_acquire()
+
+    async def acquire_async(self) -> None:
+        """
+        Waits (without blocking the event loop) until a request can be sent.
+        """
+        delay = self._try_acquire()
+
+        while delay > 0:
+            await asyncio.sleep(delay)
+            delay = self._try_acquire()
+
+    def release(
+        self,
+        status_code: Optional[int],
+        retry_after: Optional[str] = None,
+    ) -> None:
+        """
+        Releases the concurrency slot and adapts the rate and concurrency
+        based on the request result.
+
+        Args:
+            status_code (Optional[int]): the response status code (None if
+                the request failed without a response).
+            retry_after (Optional[str], optional): the 'Retry-After' header
+                value. Defaults to None.
+        """
+        with self._lock:
+            self.in_flight -= 1
+
+            if status_code in THROTTLE_STATUS_CODES:
+                self.rate = max(
+                    self.settings.min_rate,
+                    self.rate * self.settings.rate_decrease,
+                )
+                self.concurrency = max(
+                    1,
+                    int(self.concurrency * self.settings.rate_decrease),
+                )
+                self._successes = 0
+
+                delay = parse_retry_after(retry_after)
+
+                if not delay is None:
+                    self._paused_until = max(
+                        self._paused_until,
+                        time.monotonic() + delay,
+                    )
+
+                logger.warning(
+                    f"Requests are being throttled (status code {status_code}), "
+                    + f"reducing the rate to {self.rate:.2f} requests per second "
+                    + f"and the concurrency to {self.concurrency}.\n"
+                )
+            elif not status_code is None and status_code < 500:
+                self.rate = min(
+                    self.settings.max_rate,
+                    self.rate + self.settings.rate_increase,
+                )
+                self._successes += 1
+
+                # the concurrency grows by one after a full "window" of
+                # successful requests
+                if self._successes >= self.concurrency:
+                    self.concurrency = min(self.max_concurrency, self.concurrency + 1)
+                    self._successes = 0
+
+    def backoff(
+        self,
+        attempt: int,
+    ) -> float:
+        """
+        Gets the exponential backoff delay (with jitter) before retrying
+        the failed requests.
+
+        Args:
+            attempt (int): the retry attempt number (starting at 1).
+
+        Returns:
+            float: the number of seconds to wait.
+        """
+        delay = self.settings.backoff_factor * 2 ** (attempt - 1)
+        delay = delay + random.uniform(0, self.settings.backoff_factor)
+        return min(self.settings.max_backoff, delay)
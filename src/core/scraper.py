@@ -1,18 +1,92 @@
-import requests
-from typing import List, Tuple, Union
-from functools import reduce
+from __future__ import annotations
+
+import asyncio
+import multiprocessing
+import threading
+import time
+from typing import (
+    Any,
+    ContextManager,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+    get_args,
+)
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import nullcontext
+from functools import partial
 
-import numpy as np
-import pandas as pd
-from bs4 import BeautifulSoup
 from loguru import logger
 
-from .utils import REGIONS_MAPPING, ITENS_MAPPING
+from .cache import CachedResponse, ResponseCache
+from .checkpoint import CheckpointJournal, make_run_id
+from .convert import SharedCategories, to_typed_frame
+from .currency import (
+    convert_city_data,
+    convert_historical_records,
+    currency_template,
+    exchange_rate,
+    is_monetary_item,
+    yearly_exchange_rates,
+)
+from .extractors import (
+    Extractor,
+    extract_city_ranking,
+    extract_cost_of_living_city,
+    extract_country_ranking,
+    extract_historical_data,
+    extract_others_city,
+    extract_pollution_city,
+    extract_quality_of_life_city,
+    extract_traffic_city,
+)
+from .frames import RowBuilder, concat_frames, pivot_records, to_dataframe
+from .metrics import (
+    MetricsRegistry,
+    RequestTiming,
+    timed_adapter_class,
+    timed_extraction,
+    trace_config,
+)
+from .parser import is_backend_available
+from .planner import FetchUnit, RequestPlan, estimate_time
+from .rate_limit import RETRY_STATUS_CODES, RateLimiter
+from .utils import (
+    COUNTRIES_REGIONS_MAPPING,
+    ITENS_MAPPING,
+    REGIONS_COUNTRIES,
+    format_city,
+    lazy_import,
+    remove_duplicates,
+)
+from ..schema.cache import CacheSettings, VALID_CACHE_POLICIES
+from ..schema.checkpoint import CheckpointSettings, VALID_CHECKPOINT_POLICIES
 from ..schema.input import Input
+from ..schema.metrics import MetricsSettings
+from ..schema.output import OutputSettings
+from ..schema.parser import ParserSettings
+from ..schema.rate_limit import RateLimitSettings
+from ..schema.session import SessionSettings
 
+# the heavy dependencies are only imported when they're first used
+aiohttp = lazy_import("aiohttp")
+pd = lazy_import("pandas")
+requests = lazy_import("requests")
 
 BASE_URL = "https://www.numbeo.com"
 
+# the columns of the historical data long-format records
+# (the country is identified by its position in the countries list)
+HISTORICAL_RECORDS_COLUMNS = ["Position", "Year", "Item", "Value"]
+
+# the 'city' mode categories whose values are amounts of money
+MONETARY_CATEGORIES = ["cost-of-living", "property-investment"]
+
 
 class NumbeoScraper:
     """
@@ -22,12 +96,44 @@ class NumbeoScraper:
     def __init__(
         self,
         config: Input,
+        session_settings: Optional[SessionSettings] = None,
+        cache_settings: Optional[CacheSettings] = None,
+        rate_limit_settings: Optional[RateLimitSettings] = None,
+        parser_settings: Optional[ParserSettings] = None,
+        checkpoint_settings: Optional[CheckpointSettings] = None,
+        output_settings: Optional[OutputSettings] = None,
+        metrics_settings: Optional[MetricsSettings] = None,
+        base_url: Optional[str] = None,
     ) -> None:
         """
         Creates a Numbeo's scraper instance.
 
         Args:
             config (Input): the configuration values obtained from the YAML file.
+            session_settings (Optional[SessionSettings], optional): the HTTP
+                session settings (pool size, keep-alive, default headers and
+                compression). Defaults to None (uses the default settings).
+            cache_settings (Optional[CacheSettings], optional): the on-disk
+                response cache settings. Defaults to None (the responses
+                aren't cached).
+            rate_limit_settings (Optional[RateLimitSettings], optional): the
+                adaptive rate limiter and retry settings. Defaults to None (the
+                requests aren't rate limited nor retried).
+            parser_settings (Optional[ParserSettings], optional): the HTML
+                parser backend and whether only the relevant parts of each page
+                are parsed. Defaults to None (uses the default settings).
+            checkpoint_settings (Optional[CheckpointSettings], optional): the
+                checkpoint journal settings, used to resume the runs that
+                stopped. Defaults to None (the runs aren't journaled).
+            output_settings (Optional[OutputSettings], optional): the output
+                dataframes settings (e.g., whether the values are converted
+                to numbers). Defaults to None (uses the default settings).
+            metrics_settings (Optional[MetricsSettings], optional): the per-stage
+                timing metrics settings (histogram buckets and export file).
+                Defaults to None (the metrics aren't recorded).
+            base_url (Optional[str], optional): the website URL used to build
+                the pages URL (e.g., a local server used for load testing).
+                Defaults to None (uses Numbeo's URL).
         """
         # initializing important variables
         if not config.regions is None:
@@ -69,7 +175,37 @@ class NumbeoScraper:
             self.categories = config.categories
 
         if not config.currency is None:
-            self.currency = config.currency
+            if isinstance(config.currency, str):
+                self.currencies = [config.currency]
+            else:
+                self.currencies = config.currency
+        else:
+            self.currencies = None
+
+        if isinstance(config.years, int):
+            self.years = [config.years]
+        else:
+            self.years = config.years
+
+        # removing the duplicated values, so the same page isn't requested twice
+        self.categories = remove_duplicates(self.categories)
+        self.years = remove_duplicates(self.years)
+        self.regions = remove_duplicates(self.regions)
+
+        if not self.historical_items is None:
+            self.historical_items = remove_duplicates(self.historical_items)
+
+        if not self.countries is None:
+            self.countries = remove_duplicates(self.countries)
+
+        if not self.cities is None:
+            self.cities = remove_duplicates(self.cities, key=self._format_city)
+
+        # the pages are only requested in the first currency (the base one)
+        # and the values are converted locally to the other currencies
+        if not self.currencies is None:
+            self.currencies = remove_duplicates(self.currencies)
+            self.currency = self.currencies[0]
         else:
             self.currency = None
 
@@ -83,11 +219,6 @@ class NumbeoScraper:
                         "Historical items can not be empty!\n"
                     ) from error
 
-        if isinstance(config.years, int):
-            self.years = [config.years]
-        else:
-            self.years = config.years
-
         self.mode = config.mode
 
         # validating if cities is None when the mode is 'city'
@@ -98,6 +229,20 @@ class NumbeoScraper:
                 logger.error("Cities can not be empty when 'city' mode is chosen!\n")
                 raise AssertionError("Cities can not be empty!\n") from error
 
+        # validating if historical-data is chosen for the 'city-rankings' mode,
+        # which only has the rankings of the indices
+        if self.mode == "city-rankings":
+            try:
+                assert not "historical-data" in self.categories
+            except AssertionError as error:
+                logger.error(
+                    "The 'historical-data' category can not be chosen "
+                    + "when 'city-rankings' mode is chosen!\n"
+                )
+                raise AssertionError(
+                    "Invalid category for 'city-rankings' mode!\n"
+                ) from error
+
         # validating if the currency value is None for a few specific cases
         if self.mode == "country":
             if "historical-data" in self.categories:
@@ -108,10 +253,8 @@ class NumbeoScraper:
                         "Currency can not be empty when 'historical-data' category is chosen!\n"
                     )
                     raise AssertionError("Currency can not be empty!\n") from error
-        else:
-            if any(
-                c in self.categories for c in ["cost-of-living", "property-investment"]
-            ):
+        elif self.mode == "city":
+            if any(c in self.categories for c in MONETARY_CATEGORIES):
                 try:
                     assert not self.currency is None
                 except AssertionError as error:
@@ -121,603 +264,2024 @@ class NumbeoScraper:
                     )
                     raise AssertionError("Currency can not be empty!\n") from error
 
-    @logger.catch
-    def scrap(
-        self,
-    ) -> List[Tuple[str, pd.DataFrame]]:
-        """
-        Main function responsible for scraping the data.
+        # the module-level URL is read here (and not as a default value),
+        # so it can still be changed before the scraper is created
+        if base_url is None:
+            base_url = BASE_URL
+
+        self.base_url = base_url.rstrip("/")
+
+        # the HTTP session is only created when the first page is requested
+        # and it's reused across multiple `scrap` calls
+        if session_settings is None:
+            session_settings = SessionSettings()
+
+        self.session_settings = session_settings
+        self.session = None
+
+        # the session, the cache and the journal are created lazily by
+        # the first thread that needs them (e.g., in the concurrent mode)
+        self._resources_lock = threading.Lock()
+        self.async_session = None
+        self._async_session_loop = None
+        self._async_context = False  # whether it's used with `async with`
+        self._pages = {}  # the pages requested beforehand (concurrent mode)
+        self._extracted = {}  # the data extracted beforehand (pipelined mode)
+
+        self.cache_settings = cache_settings
+        self.cache = None
+        self._cache_policy = "use"
+
+        self.rate_limit_settings = rate_limit_settings
+        self.rate_limiter = None
+
+        if not rate_limit_settings is None:
+            self.rate_limiter = RateLimiter(
+                settings=rate_limit_settings,
+                max_concurrency=session_settings.max_concurrency,
+            )
 
-        Returns:
-            dataframes (List[Tuple[str, pd.DataFrame]]): a list containing
-                the extracted data (saved in a dataframe format) with it
-                respective name used to identify it.
-        """
-        dataframes = []
+        if parser_settings is None:
+            parser_settings = ParserSettings()
 
-        # iterating over the categories
-        for category in self.categories:
-            data = pd.DataFrame()
-            logger.info(f"Collecting '{category}' data using mode '{self.mode}'.\n")
+        # validating if the parser backend is installed
+        try:
+            assert is_backend_available(parser_settings.backend)
+        except AssertionError as error:
+            logger.error(
+                f"Parser backend '{parser_settings.backend}' is not installed!\n"
+            )
+            raise AssertionError(
+                f"Parser backend '{parser_settings.backend}' is not installed!\n"
+            ) from error
 
-            if self.mode == "country":
-                if category == "historical-data":
-                    data = self._historical_data_country_mode(
-                        itens=self.historical_items,
-                        countries=self.countries,
-                    )
-                else:
-                    data = self._country_mode(
-                        category=category,
-                        regions=self.regions,
-                    )
-            else:
-                if category in ["cost-of-living", "property-investment"]:
-                    data = self._city_mode(
-                        category=category,
-                        cities=self.cities,
-                    )
-                elif category == "quality-of-life":
-                    data = self._quality_of_life_city_mode(
-                        category=category,
-                        cities=self.cities,
-                    )
-                elif category == "traffic":
-                    data = self._traffic_city_mode(
-                        category=category,
-                        cities=self.cities,
-                    )
-                elif category == "pollution":
-                    data = self._pollution_city_mode(
-                        category=category,
-                        cities=self.cities,
-                    )
-                else:
-                    data = self._others_city_mode(
-                        category=category,
-                        cities=self.cities,
-                    )
+        self.parser_settings = parser_settings
+        self._parsers = None  # the pool of processes used by the pipelined mode
 
-            data_name = f"{category}_{self.mode}"
-            dataframes.append((data_name, data))
+        # the same config (against the same website) always has the same run
+        # identifier, so running it again resumes from the journal until
+        # the run finishes
+        self.checkpoint_settings = checkpoint_settings
+        self.journal = None
+        self._checkpoint_policy = "resume"
+        self._run_id = make_run_id(config, self.base_url)
 
-        return dataframes
+        if output_settings is None:
+            output_settings = OutputSettings()
 
-    def _country_mode(
-        self,
-        category: str,
-        regions: Union[str, List[str]],
-    ) -> pd.DataFrame:
-        """
-        Extracts the data considering the 'country mode', which means that
-        the data extracted will be for the country as a whole.
+        self.output_settings = output_settings
 
-        Args:
-            category (str): the current category.
-            region (str): the current region.
+        # the time spent in each stage of each page (see the `MetricsRegistry`
+        # class), which is kept across multiple `scrap` calls
+        self.metrics = None
 
-        Returns:
-            dataframes (List[Tuple[str, pd.DataFrame]]): a list containing
-                the extracted data (saved in a dataframe format) with it
-                respective name used to identify it.
-        """
-        dataframes = pd.DataFrame()
+        if not metrics_settings is None:
+            self.metrics = MetricsRegistry(metrics_settings)
 
-        for region in regions:
-            for year in self.years:
-                country_page = "rankings_by_country.jsp"
+        # the categories are shared by all the pages, categories and runs
+        self.shared_categories = SharedCategories()
 
-                if region is None:
-                    full_url = f"{BASE_URL}/{category}/{country_page}?title={year}"
-                    logger.info(
-                        f"Collecting '{category}' data in 'country' mode for year '{year}'.\n"
-                    )
-                else:
-                    region_code = REGIONS_MAPPING[region]
-                    full_url = f"{BASE_URL}/{category}/{country_page}"
-                    full_url = full_url + f"?title={year}&region={region_code}"
-                    logger.info(
-                        f"Collecting '{category}' data in 'country' mode "
-                        + f"for year '{year}' and region '{region}'.\n"
-                    )
+        # the exchange rates (units of each currency per unit of the base
+        # currency) are derived once and reused by all the pages and runs
+        self.exchange_rates = {}
+        self.currency_templates = {}
+        self.historical_exchange_rates = {}
+        self._calibrated_years = {}  # the years of the pages already compared
 
-                request = requests.get(full_url, timeout=300)
+    def __enter__(self) -> "NumbeoScraper":
+        return self
 
-                if request.status_code == 200:
-                    numbeo_html_data = BeautifulSoup(request.text, "html.parser")
-                    main_table = numbeo_html_data.find("table", attrs={"id": "t2"})
+    def __exit__(self, *args) -> None:
+        self.close()
 
-                    main_table_header = main_table.find("thead")
-                    main_table_header_rows = main_table_header.find_all("th")
-                    table_columns_name = [row.text for row in main_table_header_rows]
-                    dataframe = pd.DataFrame(columns=table_columns_name)
+    async def __aenter__(self) -> "NumbeoScraper":
+        self._async_context = True
+        return self
 
-                    main_table_body = main_table.find("tbody")
-                    main_table_rows = main_table_body.find_all("tr")
+    async def __aexit__(self, *args) -> None:
+        self._async_context = False
+        await self.aclose()
 
-                    for rank, row in enumerate(main_table_rows, start=1):
-                        data = row.find_all("td")[1:]
-                        data = [d.text for d in data]
-                        data = [rank] + data  # appeding rank to the list
-                        data = (
-                            np.asarray(data).reshape(1, -1).tolist()
-                        )  # reshaping so we can concatenate it
+    def close(self) -> None:
+        """
+        Closes the HTTP session (and all its pooled connections),
+        the response cache, the checkpoint journal and the pool of
+        processes used by the pipelined mode.
+        """
+        self._shutdown_parsers()
 
-                        new_row = pd.DataFrame(data, columns=table_columns_name)
-                        dataframe = pd.concat(
-                            [dataframe, new_row], axis=0, ignore_index=True
-                        )
+        if not self.session is None:
+            self.session.close()
+            self.session = None
 
-                    dataframe["Year"] = [year] * dataframe.shape[0]
-                    dataframes = pd.concat(
-                        [dataframes, dataframe], axis=0, ignore_index=True
-                    )
-                    logger.info(
-                        f"Found {dataframe.shape[0]} data rows and "
-                        + f"{dataframe.shape[0]} features.\n"
-                    )
-                else:
-                    logger.error(f"Could not find data for URL {full_url}.\n")
+        if not self.cache is None:
+            self.cache.close()
+            self.cache = None
 
-        if not self.countries is None:
-            logger.info(f"Selecting only the data of countries {self.countries}.\n")
-            dataframes = dataframes[
-                dataframes["Country"].isin(self.countries)
-            ].reset_index(drop=True)
-            logger.info(
-                f"Found {dataframes.shape[0]} data rows and "
-                + f"{dataframes.shape[0]} features.\n"
-            )
+        if not self.journal is None:
+            self.journal.close()
+            self.journal = None
 
-        return dataframes
+    async def aclose(self) -> None:
+        """
+        Closes both the asynchronous and the blocking HTTP sessions.
+        """
+        await self._close_async_session()
+        self.close()
 
-    def _historical_data_country_mode(
-        self,
-        itens: Union[str, List[str]],
-        countries: Union[str, List[str]],
-    ) -> pd.DataFrame:
+    async def _close_async_session(self) -> None:
         """
-        Extracts the historical data considering the 'country mode',
-        which means that the data extracted will be for the country as a whole.
+        Closes the asynchronous HTTP session (and all its pooled connections).
+        """
+        session = self.async_session
+        self.async_session = None
+        self._async_session_loop = None
 
-        Args:
-            itens (Union[str, List[str]]): the itens that will be scraped.
-            countries (Union[str, List[str]]): the countries that will be scraped.
+        if not session is None and not session.closed:
+            await session.close()
+
+    def _get_headers(self) -> Dict[str, str]:
+        """
+        Gets the default headers sent with every request.
 
         Returns:
-            dataframes (List[Tuple[str, pd.DataFrame]]): a list containing
-                the historical data (saved in a dataframe format) for the given
-                countries and itens.
+            Dict[str, str]: the request headers.
         """
-        dataframes = pd.DataFrame()
-        country_page = "historical-data-country"
-        category = "cost-of-living"
+        settings = self.session_settings
+        headers = dict(settings.headers)
+        headers["Connection"] = "keep-alive" if settings.keep_alive else "close"
+        headers["Accept-Encoding"] = (
+            "gzip, deflate" if settings.compression else "identity"
+        )
+        return headers
 
-        for country in countries:
-            country_dataframe = pd.DataFrame()
-            items_dataframe = []
+    def _get_pool_size(self) -> int:
+        """
+        Gets the connection pool size, which must be large enough
+        to hold a connection for each concurrent request.
 
-            for item in itens:
-                item_id = ITENS_MAPPING[item]
-                full_url = f"{BASE_URL}/{category}/{country_page}?itemId={item_id}"
-                full_url = full_url + f"&country={country}&currency={self.currency}"
-                logger.info(
-                    f"Collecting '{category}' data for country '{country}', "
-                    + f"item '{item}', and currency '{self.currency}'.\n"
-                )
+        Returns:
+            int: the connection pool size.
+        """
+        settings = self.session_settings
+        return max(settings.pool_maxsize, settings.max_concurrency)
+
+    def _get_session(self) -> requests.Session:
+        """
+        Gets the pooled HTTP session, creating it if it doesn't exist yet.
+
+        Returns:
+            requests.Session: the HTTP session.
+        """
+        if self.session is None:
+            with self._resources_lock:
+                if self.session is None:
+                    self.session = self._create_session()
 
-                request = requests.get(full_url, timeout=300)
+        return self.session
 
-                if request.status_code == 200:
-                    numbeo_html_data = BeautifulSoup(request.text, "html.parser")
-                    main_table = numbeo_html_data.find("table", attrs={"id": "t2"})
+    def _create_session(self) -> requests.Session:
+        """
+        Creates the pooled HTTP session.
 
-                    main_table_header = main_table.find("thead")
-                    main_table_header_rows = main_table_header.find_all("th")
-                    table_columns_name = [row.text for row in main_table_header_rows]
-                    dataframe = pd.DataFrame(columns=table_columns_name)
+        Returns:
+            requests.Session: the HTTP session.
+        """
+        session = requests.Session()
 
-                    main_table_body = main_table.find("tbody")
-                    main_table_rows = main_table_body.find_all("tr")
+        # the timed adapter also measures the time spent connecting
+        adapter_class = requests.adapters.HTTPAdapter
 
-                    for row in main_table_rows:
-                        data = row.find_all("td")
-                        data = [d.text for d in data]
-                        data = (
-                            np.asarray(data).reshape(1, -1).tolist()
-                        )  # reshaping so we can concatenate it
-                        new_row = pd.DataFrame(data, columns=table_columns_name)
+        if not self.metrics is None:
+            adapter_class = timed_adapter_class()
 
-                        dataframe = pd.concat(
-                            [dataframe, new_row], axis=0, ignore_index=True
-                        )
-                else:
-                    logger.error(f"Could not find data for URL {full_url}.\n")
+        adapter = adapter_class(
+            pool_connections=self.session_settings.pool_connections,
+            pool_maxsize=self._get_pool_size(),
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        session.headers.update(self._get_headers())
+        return session
 
-                items_dataframe.append(dataframe)
+    async def _get_async_session(self) -> aiohttp.ClientSession:
+        """
+        Gets the pooled asynchronous HTTP session, creating it if it doesn't
+        exist yet. The session is bound to the running event loop, so it's
+        created again (closing the previous one) when it's used by another
+        event loop.
 
-            if len(items_dataframe) > 1:
-                country_dataframe = reduce(
-                    lambda x, y: pd.merge(x, y, how="outer", on="Year"), items_dataframe
-                )
-            else:
-                country_dataframe = items_dataframe[0].copy()
+        Returns:
+            aiohttp.ClientSession: the asynchronous HTTP session.
+        """
+        loop = asyncio.get_running_loop()
 
-            logger.info(
-                f"Found {country_dataframe.shape[0]} data rows "
-                + f"and {country_dataframe.shape[0]} features.\n"
+        if (
+            self.async_session is None
+            or self.async_session.closed
+            or self._async_session_loop is not loop
+        ):
+            connector = aiohttp.TCPConnector(
+                limit=self._get_pool_size(),
+                force_close=not self.session_settings.keep_alive,
             )
-
-            country_dataframe["Country"] = [country] * country_dataframe.shape[0]
-            dataframes = pd.concat(
-                [dataframes, country_dataframe], axis=0, ignore_index=True
+            previous_session = self.async_session
+            self.async_session = aiohttp.ClientSession(
+                connector=connector,
+                headers=self._get_headers(),
+                timeout=aiohttp.ClientTimeout(total=self.session_settings.timeout),
+                trace_configs=[] if self.metrics is None else [trace_config()],
             )
+            self._async_session_loop = loop
 
-        logger.info(f"Selecting only the data from years {self.years}.\n")
-        dataframes["Year"] = dataframes["Year"].astype(int)
-        dataframes = dataframes[dataframes["Year"].isin(self.years)].reset_index(
-            drop=True
-        )
-        logger.info(
-            f"Found {dataframes.shape[0]} data rows and {dataframes.shape[0]} features.\n"
-        )
-        return dataframes
+            # the new session is created first, so the concurrent requests
+            # waiting for the previous one to close don't create another one
+            if not previous_session is None and not previous_session.closed:
+                await previous_session.close()
 
-    def _city_mode(
-        self,
-        category: str,
-        cities: Union[str, List[str]],
-    ) -> pd.DataFrame:
-        """
-        Extracts the cost of living considering the 'city mode',
-        which means that the data extracted will be for the desired city.
+        return self.async_session
 
-        Args:
-            category (str): the current category.
-            cities (Union[str, List[str]]): the cities that will be scraped.
+    def _get_cache(self) -> ResponseCache:
+        """
+        Gets the response cache, opening it if it isn't opened yet.
 
         Returns:
-            dataframes (List[Tuple[str, pd.DataFrame]]): a list containing
-                the historical data (saved in a dataframe format) for the given
-                cities.
+            ResponseCache: the response cache.
         """
-        dataframes = pd.DataFrame()
-        logger.warning(
-            "Filter by year option can not be used for this category and mode.\n"
-        )
-
-        for city in cities:
-            city_dataframe = pd.DataFrame()
-            city = city.title().replace(" ", "-")  # formatting the city's name
+        if self.cache is None:
+            with self._resources_lock:
+                if self.cache is None:
+                    self.cache = ResponseCache(self.cache_settings)
 
-            full_url = f"{BASE_URL}/{category}/in/{city}"
-            full_url = full_url + f"?displayCurrency={self.currency}"
+        return self.cache
 
-            logger.info(
-                f"Collecting '{category}' data in 'city' mode "
-                + f"for city '{city}' and currency '{self.currency}'.\n"
-            )
+    def _set_cache_policy(
+        self,
+        cache_policy: VALID_CACHE_POLICIES,
+    ) -> None:
+        """
+        Validates and sets the cache policy used by the current run.
 
-            request = requests.get(full_url, timeout=300)
+        Args:
+            cache_policy (VALID_CACHE_POLICIES): the cache policy.
+        """
+        try:
+            assert cache_policy in get_args(VALID_CACHE_POLICIES)
+        except AssertionError as error:
+            logger.error(f"Invalid cache policy '{cache_policy}'!\n")
+            raise AssertionError("Invalid cache policy!\n") from error
 
-            if request.status_code == 200:
-                numbeo_html_data = BeautifulSoup(request.text, "html.parser")
-                main_table = numbeo_html_data.find(
-                    "table", attrs={"class": "data_wide_table new_bar_table"}
+        if cache_policy == "offline":
+            try:
+                assert not self.cache_settings is None
+            except AssertionError as error:
+                logger.error(
+                    "Cache settings can not be empty when 'offline' "
+                    + "cache policy is chosen!\n"
                 )
+                raise AssertionError("Cache settings can not be empty!\n") from error
 
-                main_table_rows = main_table.find_all("tr")
-                current_header = None
+        self._cache_policy = cache_policy
 
-                for row in main_table_rows:
-                    data = row.find_all("td")
-                    data = [d.text for d in data]
+    def _get_journal(self) -> CheckpointJournal:
+        """
+        Gets the checkpoint journal, opening it if it isn't opened yet.
 
-                    if len(data) == 0:
-                        current_header = row.find_all("th")[0].text
-                        current_header = current_header.replace("\n", "").strip()
-                        continue
+        Returns:
+            CheckpointJournal: the checkpoint journal.
+        """
+        if self.journal is None:
+            with self._resources_lock:
+                if self.journal is None:
+                    self.journal = CheckpointJournal(self.checkpoint_settings)
 
-                    row_df = None
+        return self.journal
 
-                    if len(data) == 2:
-                        item, mean = data
-                        row_df = pd.DataFrame(
-                            {
-                                "Header": [current_header],
-                                "Category": [item],
-                                "Mean": [mean],
-                                "Range": [pd.NA],
-                            }
-                        )
+    def _set_checkpoint_policy(
+        self,
+        checkpoint_policy: VALID_CHECKPOINT_POLICIES,
+    ) -> None:
+        """
+        Validates and sets the checkpoint policy used by the current run.
+        When the policy is 'restart' (or it's 'resume' and the previous run
+        finished), the journal of the run is cleared. When it's 'failed',
+        the previous run is reopened until its failed pages are requested.
 
-                    if len(data) == 3:
-                        item, mean, data_range = data
-                        data_range = data_range.replace("\n", "").strip()
-                        row_df = pd.DataFrame(
-                            {
-                                "Header": [current_header],
-                                "Category": [item],
-                                "Mean": [mean],
-                                "Range": [data_range],
-                            }
-                        )
+        Args:
+            checkpoint_policy (VALID_CHECKPOINT_POLICIES): the checkpoint policy.
+        """
+        try:
+            assert checkpoint_policy in get_args(VALID_CHECKPOINT_POLICIES)
+        except AssertionError as error:
+            logger.error(f"Invalid checkpoint policy '{checkpoint_policy}'!\n")
+            raise AssertionError("Invalid checkpoint policy!\n") from error
 
-                    logger.info(
-                        f"Found {row_df.shape[0]} data rows "
-                        + f"and {row_df.shape[0]} features.\n"
-                    )
+        if checkpoint_policy != "resume":
+            try:
+                assert not self.checkpoint_settings is None
+            except AssertionError as error:
+                logger.error(
+                    "Checkpoint settings can not be empty when "
+                    + f"'{checkpoint_policy}' checkpoint policy is chosen!\n"
+                )
+                raise AssertionError(
+                    "Checkpoint settings can not be empty!\n"
+                ) from error
 
-                    row_df["City"] = [city] * row_df.shape[0]
+        self._checkpoint_policy = checkpoint_policy
 
-                    city_dataframe = pd.concat(
-                        [city_dataframe, row_df], axis=0, ignore_index=True
-                    )
+        if self.checkpoint_settings is None:
+            return
 
-                dataframes = pd.concat(
-                    [dataframes, city_dataframe], axis=0, ignore_index=True
-                )
-            else:
-                logger.error(f"Could not find data for URL {full_url}.\n")
+        journal = self._get_journal()
 
-        return dataframes
+        if checkpoint_policy == "restart":
+            logger.info("Clearing the checkpoint journal of the current run.\n")
+            journal.clear(self._run_id)
+        elif checkpoint_policy == "resume" and journal.is_finished(self._run_id):
+            # the data of a finished run would be stale (e.g., a daily run)
+            logger.info(
+                "The previous run of the same config finished, "
+                + "so the checkpoint journal is cleared.\n"
+            )
+            journal.clear(self._run_id)
+        else:
+            journal.reopen(self._run_id)
+            logger.info(
+                "Resuming from the checkpoint journal of the current run "
+                + f"(pages by status: {journal.count(self._run_id)}).\n"
+            )
 
-    def _quality_of_life_city_mode(
+    def _pending_units(
         self,
-        category: str,
-        cities: Union[str, List[str]],
-    ) -> pd.DataFrame:
+        units: List[FetchUnit],
+    ) -> List[FetchUnit]:
         """
-        Extracts the cost of living considering the 'city mode',
-        which means that the data extracted will be for the desired city.
+        Gets the pages that still must be requested, following the
+        checkpoint policy: the completed pages are never requested again
+        and, when the policy is 'failed', only the failed pages are requested.
 
         Args:
-            category (str): the current category.
-            cities (Union[str, List[str]]): the cities that will be scraped.
+            units (List[FetchUnit]): the pages implied by the config.
 
         Returns:
-            dataframes (List[Tuple[str, pd.DataFrame]]): a list containing
-                the quality of life data (saved in a dataframe format)
-                for the given cities.
+            List[FetchUnit]: the pages that must be requested.
         """
-        dataframes = pd.DataFrame()
-        logger.warning(
-            "Filter by year option can not be used for this category and mode.\n"
-        )
+        if self.checkpoint_settings is None:
+            return units
 
-        for city in cities:
-            city_dataframe = pd.DataFrame()
-            city = city.title().replace(" ", "-")  # formatting the city's name
-            logger.info(
-                f"Collecting '{category}' data in 'city' mode for city '{city}'.\n"
-            )
+        journal = self._get_journal()
+        pending_units = []
 
-            full_url = f"{BASE_URL}/{category}/in/{city}"
+        for unit in units:
+            status = journal.status(self._run_id, unit.url)
 
-            request = requests.get(full_url, timeout=300)
+            if status == "done":
+                continue
 
-            if request.status_code == 200:
-                numbeo_html_data = BeautifulSoup(request.text, "html.parser")
+            if self._checkpoint_policy == "failed" and status is None:
+                continue
 
-                # getting the table values and removing the index table value
-                main_table_rows = numbeo_html_data.find_all(
-                    "td", attrs={"style": "text-align: right"}
-                )
-                rows_values = [row.text.strip() for row in main_table_rows][1:]
+            pending_units.append(unit)
 
-                # getting the table levels
-                main_table_rows = numbeo_html_data.find_all(
-                    "td", attrs={"style": "text-align: center; font-weight: 600"}
-                )
-                main_table_rows_cont = numbeo_html_data.find_all(
-                    "td", attrs={"style": "text-align: center"}
-                )  # getting the table footer level individually
-                main_table_rows.extend(main_table_rows_cont)
-                rows_levels = [row.text.strip() for row in main_table_rows]
+        return pending_units
 
-                # getting the name of the categories
-                main_table_rows = numbeo_html_data.find_all(
-                    "a", attrs={"class": "discreet_link"}
-                )
-                rows_labels = [row.text.strip() for row in main_table_rows][1:-1]
-                rows_labels.append("Quality of Life Index")  # fixing the footer label
+    def _finish_checkpoint(self) -> None:
+        """
+        Marks the current run as finished in the checkpoint journal (if it's
+        enabled), so running the same config again starts a new run.
+        """
+        if self.checkpoint_settings is None:
+            return
 
-                row_df = pd.DataFrame(
-                    {
-                        "Category": rows_labels,
-                        "Value": rows_values,
-                        "Level": rows_levels,
-                    }
-                )
+        self._get_journal().finish(self._run_id)
 
-                logger.info(
-                    f"Found {row_df.shape[0]} data rows "
-                    + f"and {row_df.shape[0]} features.\n"
-                )
+    def _log_checkpoint(self) -> None:
+        """
+        Logs how many pages of the current run are completed and failed
+        in the checkpoint journal (if it's enabled).
+        """
+        if self.checkpoint_settings is None:
+            return
 
-                row_df["City"] = [city] * row_df.shape[0]
+        logger.info(
+            "Checkpoint journal of the current run "
+            + f"(pages by status: {self._get_journal().count(self._run_id)}).\n"
+        )
 
-                city_dataframe = pd.concat(
-                    [city_dataframe, row_df], axis=0, ignore_index=True
-                )
+    def _checkpoint_page(
+        self,
+        full_url: str,
+        data: Optional[Dict[str, List[Any]]],
+    ) -> None:
+        """
+        Records a page in the checkpoint journal (if it's enabled).
 
-                dataframes = pd.concat(
-                    [dataframes, city_dataframe], axis=0, ignore_index=True
-                )
-            else:
-                logger.error(f"Could not find data for URL {full_url}.\n")
+        Args:
+            full_url (str): the page URL.
+            data (Optional[Dict[str, List[Any]]]): the extracted data or None
+                if the request failed.
+        """
+        if self.checkpoint_settings is None:
+            return
 
-        return dataframes
+        if data is None:
+            self._get_journal().record_failure(self._run_id, full_url)
+        else:
+            self._get_journal().record_done(self._run_id, full_url, data)
 
-    def _traffic_city_mode(
+    def _get_cached_response(
         self,
-        category: str,
-        cities: Union[str, List[str]],
-    ) -> pd.DataFrame:
+        full_url: str,
+    ) -> Optional[CachedResponse]:
         """
-        Extracts the traffic considering the 'city mode',
-        which means that the data extracted will be for the desired city.
+        Gets a page from the response cache, following the cache policy.
 
         Args:
-            category (str): the current category.
-            cities (Union[str, List[str]]): the cities that will be scraped.
+            full_url (str): the page URL.
 
         Returns:
-            dataframes (List[Tuple[str, pd.DataFrame]]): a list containing
-                the traffic data (saved in a dataframe format) for the given
-                cities.
+            Optional[CachedResponse]: the cached response (which might be
+                expired) or None if the page isn't cached or the cache
+                can't be used.
         """
-        dataframes = pd.DataFrame()
-        logger.warning(
-            "Filter by year option can not be used for this category and mode.\n"
-        )
-
-        for city in cities:
-            city_dataframe = pd.DataFrame()
-            city = city.title().replace(" ", "-")  # formatting the city's name
-            logger.info(
-                f"Collecting '{category}' data in 'city' mode for city '{city}'.\n"
-            )
+        if self.cache_settings is None or self._cache_policy == "refresh":
+            return None
 
-            full_url = f"{BASE_URL}/{category}/in/{city}"
+        cached_response = self._get_cache().get(full_url)
 
-            request = requests.get(full_url, timeout=300)
+        if cached_response is None and self._cache_policy == "offline":
+            logger.warning(f"Page {full_url} is not cached.\n")
 
-            if request.status_code == 200:
-                numbeo_html_data = BeautifulSoup(request.text, "html.parser")
+        return cached_response
 
-                # getting the tables headers
-                tables_headers = numbeo_html_data.find_all("h3")
+    def _can_use_cached_response(
+        self,
+        cached_response: Optional[CachedResponse],
+    ) -> bool:
+        """
+        Checks if the cached response can be used without requesting
+        the page again.
 
-                # getting the tables
-                tables = [
-                    tbl for tbl in numbeo_html_data.find_all("table") if not tbl.attrs
-                ][:-1]
+        Args:
+            cached_response (Optional[CachedResponse]): the cached response.
 
-                # extracting the data from the tables
-                city_dataframe = self._get_tables_city_mode(
-                    tables_headers=tables_headers,
-                    tables=tables,
-                    attributes_class_name="trafficCaptionTd",
-                    attributes_values_class_name="trafficTd",
-                )
+        Returns:
+            bool: whether the cached response can be used.
+        """
+        if cached_response is None:
+            return False
 
-                # getting the indices table
-                indices_df = self._get_index_table(
-                    html_data=numbeo_html_data,
-                    index_table_class_name="table_indices",
-                    indices_values_style="text-align: right",
-                    create_level_column=False,
-                )
+        if self._cache_policy == "offline":
+            return True
 
-                city_dataframe = pd.concat(
-                    [city_dataframe, indices_df], axis=0, ignore_index=True
-                )
+        return self._get_cache().is_fresh(cached_response)
 
-                logger.info(
-                    f"Found {city_dataframe.shape[0]} data rows "
-                    + f"and {city_dataframe.shape[0]} features.\n"
-                )
+    @staticmethod
+    def _get_revalidation_headers(
+        cached_response: Optional[CachedResponse],
+    ) -> Dict[str, str]:
+        """
+        Gets the headers used to revalidate an expired cached response,
+        so the server doesn't send the page again if it didn't change.
 
-                city_dataframe["City"] = [city] * city_dataframe.shape[0]
+        Args:
+            cached_response (Optional[CachedResponse]): the cached response.
 
-                dataframes = pd.concat(
-                    [dataframes, city_dataframe], axis=0, ignore_index=True
+        Returns:
+            Dict[str, str]: the conditional request headers.
+        """
+        headers = {}
+
+        if cached_response is None:
+            return headers
+
+        if not cached_response.etag is None:
+            headers["If-None-Match"] = cached_response.etag
+
+        if not cached_response.last_modified is None:
+            headers["If-Modified-Since"] = cached_response.last_modified
+
+        return headers
+
+    def _cache_page(
+        self,
+        full_url: str,
+        page: str,
+        headers: Dict[str, str],
+    ) -> None:
+        """
+        Stores a page in the response cache (if it's enabled).
+
+        Args:
+            full_url (str): the page URL.
+            page (str): the page HTML code.
+            headers (Dict[str, str]): the response headers.
+        """
+        if not self.cache_settings is None:
+            self._get_cache().put(
+                full_url,
+                page,
+                etag=headers.get("ETag"),
+                last_modified=headers.get("Last-Modified"),
+            )
+
+    def _send_request(
+        self,
+        full_url: str,
+    ) -> Tuple[Optional[str], bool]:
+        """
+        Requests a page once using the pooled HTTP session, unless the page
+        can be obtained from the response cache.
+
+        Args:
+            full_url (str): the page URL.
+
+        Returns:
+            Tuple[Optional[str], bool]: the page HTML code (or None if
+                the request failed) and whether the request can be retried.
+        """
+        cached_response = self._get_cached_response(full_url)
+
+        if self._can_use_cached_response(cached_response):
+            return cached_response.text, False
+
+        if self._cache_policy == "offline":
+            return None, False
+
+        if self.rate_limiter is None:
+            request = self._get_response(full_url, cached_response)
+        else:
+            self.rate_limiter.acquire()
+
+            try:
+                request = self._get_response(full_url, cached_response)
+            except requests.RequestException as error:
+                self.rate_limiter.release(None)
+                logger.warning(f"Request to URL {full_url} failed: {error}.\n")
+                return None, True
+
+            self.rate_limiter.release(
+                request.status_code,
+                request.headers.get("Retry-After"),
+            )
+
+        # the page didn't change since it was cached
+        if request.status_code == 304 and not cached_response is None:
+            self._get_cache().touch(full_url)
+            return cached_response.text, False
+
+        if request.status_code == 200:
+            self._cache_page(full_url, request.text, request.headers)
+            return request.text, False
+
+        return None, request.status_code in RETRY_STATUS_CODES
+
+    def _get_response(
+        self,
+        full_url: str,
+        cached_response: Optional[CachedResponse],
+    ) -> requests.Response:
+        """
+        Sends a GET request using the pooled HTTP session, measuring the time
+        spent in each stage of the request when the metrics are enabled.
+
+        Args:
+            full_url (str): the page URL.
+            cached_response (Optional[CachedResponse]): the cached response
+                of the page, which is revalidated if it exists.
+
+        Returns:
+            requests.Response: the response.
+        """
+        headers = self._get_revalidation_headers(cached_response)
+
+        if self.metrics is None:
+            return self._get_session().get(
+                full_url,
+                headers=headers,
+                timeout=self.session_settings.timeout,
+            )
+
+        # the body is streamed, so the headers and the body are timed apart
+        with RequestTiming() as timing:
+            request = self._get_session().get(
+                full_url,
+                headers=headers,
+                timeout=self.session_settings.timeout,
+                stream=True,
+            )
+            timing.received_headers()
+            size = len(request.content)
+            timing.received_body()
+
+        self._observe_request(
+            full_url,
+            timing,
+            size if request.status_code == 200 else None,
+        )
+        return request
+
+    def _observe_request(
+        self,
+        full_url: str,
+        timing: RequestTiming,
+        size: Optional[int],
+    ) -> None:
+        """
+        Adds the time spent in each stage of a request to the metrics.
+
+        Args:
+            full_url (str): the page URL.
+            timing (RequestTiming): the request timing.
+            size (Optional[int]): the page size (in bytes) or None if the
+                request failed.
+        """
+        self.metrics.observe_request(
+            timing,
+            size,
+            category=self._url_category(full_url),
+            mode=self.mode,
+            url=full_url,
+        )
+
+    def _get_max_retries(self) -> int:
+        """
+        Gets the maximum number of times a failed request is retried
+        (requests are only retried when the rate limiter is enabled).
+
+        Returns:
+            int: the maximum number of retries.
+        """
+        if self.rate_limiter is None:
+            return 0
+
+        return self.rate_limit_settings.max_retries
+
+    def _request_page(
+        self,
+        full_url: str,
+    ) -> Optional[str]:
+        """
+        Requests a page, retrying it with exponential backoff if it fails.
+
+        Args:
+            full_url (str): the page URL.
+
+        Returns:
+            Optional[str]: the page HTML code or None if the request failed.
+        """
+        page, retry = self._send_request(full_url)
+
+        for attempt in range(1, self._get_max_retries() + 1):
+            if not retry:
+                break
+
+            delay = self.rate_limiter.backoff(attempt)
+            logger.warning(
+                f"Retrying URL {full_url} in {delay:.2f} seconds "
+                + f"(attempt {attempt}).\n"
+            )
+            time.sleep(delay)
+            page, retry = self._send_request(full_url)
+
+        return page
+
+    def _fetch_page(
+        self,
+        full_url: str,
+    ) -> Optional[str]:
+        """
+        Gets a page, using the prefetched pages if the page was
+        already requested (concurrent mode).
+
+        Args:
+            full_url (str): the page URL.
+
+        Returns:
+            Optional[str]: the page HTML code or None if the request failed.
+        """
+        if full_url in self._pages:
+            return self._pages.pop(full_url)
+
+        return self._request_page(full_url)
+
+    def _prefetch_pages(
+        self,
+        urls: List[str],
+    ) -> None:
+        """
+        Requests multiple pages concurrently, keeping them in memory until
+        they are used to extract the data. The failed requests are put in
+        a retry queue, which is requested again with exponential backoff
+        after all the other pages were requested.
+
+        Args:
+            urls (List[str]): the pages URL.
+        """
+        urls = remove_duplicates(urls)
+        max_concurrency = self.session_settings.max_concurrency
+        logger.info(
+            f"Requesting {len(urls)} pages using up to "
+            + f"{max_concurrency} concurrent requests.\n"
+        )
+
+        with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+            retry_queue = self._store_prefetched_pages(
+                urls,
+                executor.map(self._send_request, urls),
+            )
+
+            for attempt in range(1, self._get_max_retries() + 1):
+                if len(retry_queue) == 0:
+                    break
+
+                delay = self.rate_limiter.backoff(attempt)
+                logger.warning(
+                    f"Retrying {len(retry_queue)} failed pages in {delay:.2f} "
+                    + f"seconds (attempt {attempt}).\n"
+                )
+                time.sleep(delay)
+                retry_queue = self._store_prefetched_pages(
+                    retry_queue,
+                    executor.map(self._send_request, retry_queue),
+                )
+
+    def _store_prefetched_pages(
+        self,
+        urls: List[str],
+        results: Iterable[Tuple[Optional[str], bool]],
+    ) -> List[str]:
+        """
+        Stores the prefetched pages and gets the ones that must be retried.
+
+        Args:
+            urls (List[str]): the pages URL.
+            results (Iterable[Tuple[Optional[str], bool]]): the requests result
+                (the page HTML code and whether the request can be retried).
+
+        Returns:
+            List[str]: the URL of the pages that must be retried.
+        """
+        retry_queue = []
+
+        for full_url, (page, retry) in zip(urls, results):
+            self._pages[full_url] = page
+
+            if retry:
+                retry_queue.append(full_url)
+
+        return retry_queue
+
+    async def _send_request_async(
+        self,
+        full_url: str,
+        semaphore: asyncio.Semaphore,
+    ) -> Tuple[Optional[str], bool]:
+        """
+        Requests a page once using the pooled asynchronous HTTP session,
+        unless the page can be obtained from the response cache.
+
+        Args:
+            full_url (str): the page URL.
+            semaphore (asyncio.Semaphore): the semaphore used to limit
+                the number of concurrent requests.
+
+        Returns:
+            Tuple[Optional[str], bool]: the page HTML code (or None if
+                the request failed) and whether the request can be retried.
+        """
+        cached_response = None
+
+        # the response cache is read and written in worker threads,
+        # so its disk I/O doesn't block the other requests
+        if not self.cache_settings is None:
+            cached_response = await asyncio.to_thread(
+                self._get_cached_response,
+                full_url,
+            )
+
+        if self._can_use_cached_response(cached_response):
+            return cached_response.text, False
+
+        if self._cache_policy == "offline":
+            return None, False
+
+        async with semaphore:
+            if not self.rate_limiter is None:
+                await self.rate_limiter.acquire_async()
+
+            status_code, retry_after = None, None
+            timing = None if self.metrics is None else RequestTiming()
+
+            try:
+                session = await self._get_async_session()
+
+                async with session.get(
+                    full_url,
+                    headers=self._get_revalidation_headers(cached_response),
+                    trace_request_ctx=timing,
+                ) as request:
+                    status_code = request.status
+                    retry_after = request.headers.get("Retry-After")
+
+                    if not timing is None:
+                        timing.received_headers()
+
+                    # the page didn't change since it was cached
+                    if status_code == 304 and not cached_response is None:
+                        await asyncio.to_thread(self._get_cache().touch, full_url)
+                        return cached_response.text, False
+
+                    if status_code == 200:
+                        page = await request.text()
+
+                        if not timing is None:
+                            timing.received_body()
+                            size = len(await request.read())
+                            self._observe_request(full_url, timing, size)
+
+                        if not self.cache_settings is None:
+                            await asyncio.to_thread(
+                                self._cache_page,
+                                full_url,
+                                page,
+                                request.headers,
+                            )
+
+                        return page, False
+
+                    if not timing is None:
+                        self._observe_request(full_url, timing, None)
+            except (aiohttp.ClientError, asyncio.TimeoutError) as error:
+                if self.rate_limiter is None:
+                    raise
+
+                logger.warning(f"Request to URL {full_url} failed: {error}.\n")
+                return None, True
+            finally:
+                if not self.rate_limiter is None:
+                    self.rate_limiter.release(status_code, retry_after)
+
+        return None, status_code in RETRY_STATUS_CODES
+
+    async def _prefetch_pages_async(
+        self,
+        urls: List[str],
+    ) -> None:
+        """
+        Requests multiple pages concurrently without blocking the event loop,
+        keeping them in memory until they are used to extract the data. The
+        failed requests are put in a retry queue, which is requested again
+        with exponential backoff after all the other pages were requested.
+
+        Args:
+            urls (List[str]): the pages URL.
+        """
+        urls = remove_duplicates(urls)
+        max_concurrency = self.session_settings.max_concurrency
+        logger.info(
+            f"Requesting {len(urls)} pages asynchronously using up to "
+            + f"{max_concurrency} concurrent requests.\n"
+        )
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+        results = await asyncio.gather(
+            *[self._send_request_async(full_url, semaphore) for full_url in urls]
+        )
+        retry_queue = self._store_prefetched_pages(urls, results)
+
+        for attempt in range(1, self._get_max_retries() + 1):
+            if len(retry_queue) == 0:
+                break
+
+            delay = self.rate_limiter.backoff(attempt)
+            logger.warning(
+                f"Retrying {len(retry_queue)} failed pages in {delay:.2f} "
+                + f"seconds (attempt {attempt}).\n"
+            )
+            await asyncio.sleep(delay)
+            results = await asyncio.gather(
+                *[
+                    self._send_request_async(full_url, semaphore)
+                    for full_url in retry_queue
+                ]
+            )
+            retry_queue = self._store_prefetched_pages(retry_queue, results)
+
+    def _extract_page(
+        self,
+        full_url: str,
+        extractor: Extractor,
+    ) -> Optional[Dict[str, List[Any]]]:
+        """
+        Gets a page and extracts its data, using the data already extracted
+        if the page was completed in a previous run (checkpoint journal) or
+        went through the pipelined mode.
+
+        Args:
+            full_url (str): the page URL.
+            extractor (Extractor): the function that extracts the page data.
+
+        Returns:
+            Optional[Dict[str, List[Any]]]: the values of each column or None
+                if the request failed.
+        """
+        if not self.checkpoint_settings is None:
+            journal_entry = self._get_journal().get(self._run_id, full_url)
+
+            if not journal_entry is None and journal_entry.status == "done":
+                logger.info(f"Using the checkpointed data of URL {full_url}.\n")
+                return journal_entry.data
+
+            if self._checkpoint_policy == "failed" and journal_entry is None:
+                logger.warning(
+                    f"Skipping URL {full_url}, which didn't fail in the previous run.\n"
+                )
+                return None
+
+        if full_url in self._extracted:
+            data = self._extracted.pop(full_url)
+        else:
+            page = self._fetch_page(full_url)
+            data = None
+
+            if not page is None:
+                data = self._run_extractor(full_url, extractor, page)
+
+        self._checkpoint_page(full_url, data)
+        return data
+
+    def _run_extractor(
+        self,
+        full_url: str,
+        extractor: Extractor,
+        page: str,
+    ) -> Optional[Dict[str, List[Any]]]:
+        """
+        Extracts the data of a page, measuring the time spent parsing the page
+        and extracting its data when the metrics are enabled.
+
+        Args:
+            full_url (str): the page URL.
+            extractor (Extractor): the function that extracts the page data.
+            page (str): the page HTML code.
+
+        Returns:
+            Optional[Dict[str, List[Any]]]: the values of each column.
+        """
+        kwargs = dict(
+            page=page,
+            backend=self.parser_settings.backend,
+            parse_only=self.parser_settings.parse_only,
+        )
+
+        if self.metrics is None:
+            return extractor(**kwargs)
+
+        data, parse_seconds, extract_seconds = timed_extraction(extractor, **kwargs)
+        self._observe_extraction(full_url, parse_seconds, extract_seconds)
+        return data
+
+    def _observe_extraction(
+        self,
+        full_url: str,
+        parse_seconds: float,
+        extract_seconds: float,
+    ) -> None:
+        """
+        Adds the time spent parsing a page and extracting its data
+        to the metrics.
+
+        Args:
+            full_url (str): the page URL.
+            parse_seconds (float): the parsing time.
+            extract_seconds (float): the extraction time.
+        """
+        category = self._url_category(full_url)
+        self.metrics.observe("parse", parse_seconds, category, self.mode, full_url)
+        self.metrics.observe("extract", extract_seconds, category, self.mode, full_url)
+
+    def _time_stage(
+        self,
+        metric: str,
+        category: str,
+        full_url: Optional[str] = None,
+    ) -> ContextManager[None]:
+        """
+        Measures the time spent in a stage (e.g., building the dataframes)
+        when the metrics are enabled.
+
+        Args:
+            metric (str): the metric (see the `METRICS` constant).
+            category (str): the current category.
+            full_url (Optional[str], optional): the page URL. Defaults to None
+                (the stage isn't related to a single page).
+
+        Returns:
+            ContextManager[None]: the context manager that measures the time.
+        """
+        if self.metrics is None:
+            return nullcontext()
+
+        return self.metrics.timer(metric, category, self.mode, url=full_url)
+
+    def _url_category(
+        self,
+        full_url: str,
+    ) -> str:
+        """
+        Gets the category of a page given its URL (the first part of the
+        path, except for the historical data pages).
+
+        Args:
+            full_url (str): the page URL.
+
+        Returns:
+            str: the category.
+        """
+        path = full_url[len(self.base_url) :].split("?")[0]
+
+        if "/historical-data" in path:
+            return "historical-data"
+
+        return path.strip("/").split("/")[0]
+
+    def _export_metrics(self) -> None:
+        """
+        Writes the metrics to the file of the metrics settings, if any.
+        """
+        if self.metrics is None or self.metrics.settings.path is None:
+            return
+
+        path = self.metrics.export()
+        logger.info(f"Saved the scraper metrics in {path}.\n")
+
+    def _category_extractor(
+        self,
+        category: str,
+    ) -> Extractor:
+        """
+        Gets the function that extracts the data of a category's pages.
+        In 'country' and 'city-rankings' modes, the countries, cities and
+        years filters are passed to the extractor, so the rows that aren't
+        kept are skipped while the page is extracted.
+
+        Args:
+            category (str): the current category.
+
+        Returns:
+            Extractor: the extractor function.
+        """
+        if self.mode == "country":
+            if category == "historical-data":
+                return partial(extract_historical_data, years=frozenset(self.years))
+
+            return partial(
+                extract_country_ranking,
+                countries=self._kept_countries(),
+                rank_by_region=self.regions != [None],
+            )
+
+        if self.mode == "city-rankings":
+            cities = None
+
+            if not self.cities is None:
+                cities = frozenset(self._format_city(city) for city in self.cities)
+
+            return partial(extract_city_ranking, cities=cities)
+
+        if category in MONETARY_CATEGORIES:
+            return extract_cost_of_living_city
+
+        if category == "quality-of-life":
+            return extract_quality_of_life_city
+
+        if category == "traffic":
+            return extract_traffic_city
+
+        if category == "pollution":
+            return extract_pollution_city
+
+        return extract_others_city
+
+    def _kept_countries(self) -> Optional[FrozenSet[str]]:
+        """
+        Gets the countries kept in 'country' mode, which are the chosen
+        countries of the chosen regions.
+
+        Returns:
+            Optional[FrozenSet[str]]: the kept countries or None
+                if all the countries are kept.
+        """
+        countries = None
+
+        if self.regions != [None]:
+            countries = frozenset(
+                country
+                for region in self.regions
+                for country in REGIONS_COUNTRIES[region]
+            )
+
+        if not self.countries is None:
+            if countries is None:
+                countries = frozenset(self.countries)
+            else:
+                countries = countries.intersection(self.countries)
+
+        return countries
+
+    def _converted_currencies(self) -> List[str]:
+        """
+        Gets the currencies whose values are converted locally from the
+        base currency (all the chosen currencies, except the first one).
+
+        Returns:
+            List[str]: the converted currencies.
+        """
+        if self.currencies is None:
+            return []
+
+        return self.currencies[1:]
+
+    def _exchange_rate_units(
+        self,
+        category: str,
+    ) -> List[FetchUnit]:
+        """
+        Gets the pages used to derive the exchange rates of a category,
+        which are the first page of the category shown in each converted
+        currency (if another page is needed, it's requested when it's used).
+
+        Args:
+            category (str): the current category.
+
+        Returns:
+            List[FetchUnit]: the pages that must be fetched.
+        """
+        if self.mode == "country" and category == "historical-data":
+            items = list(filter(is_monetary_item, self.historical_items))
+
+            if self.countries is None or len(items) == 0:
+                return []
+
+            return [
+                FetchUnit(
+                    category=category,
+                    mode=self.mode,
+                    key=("exchange-rate", currency),
+                    url=self._historical_data_url(
+                        item=items[0],
+                        country=self.countries[0],
+                        currency=currency,
+                    ),
+                )
+                for currency in self._converted_currencies()
+                if not currency in self.historical_exchange_rates
+            ]
+
+        if self.mode == "city" and category in MONETARY_CATEGORIES:
+            return [
+                FetchUnit(
+                    category=category,
+                    mode=self.mode,
+                    key=("exchange-rate", currency),
+                    url=self._city_mode_url(
+                        category=category,
+                        city=self._format_city(self.cities[0]),
+                        currency=currency,
+                    ),
+                )
+                for currency in self._converted_currencies()
+                if not currency in self.exchange_rates
+            ]
+
+        return []
+
+    def _calibrate_city_currencies(
+        self,
+        category: str,
+        city: str,
+        data: Dict[str, List[Any]],
+        extractor: Extractor,
+    ) -> None:
+        """
+        Derives the exchange rates of the converted currencies that are still
+        unknown, comparing the city page in the base currency with the same
+        page shown in each converted currency.
+
+        Args:
+            category (str): the current category.
+            city (str): the formatted city's name.
+            data (Dict[str, List[Any]]): the values of each column
+                of the city page in the base currency.
+            extractor (Extractor): the function that extracts the page data.
+        """
+        base_means = pd.Series(data["Mean"], index=data["Category"], dtype=object)
+
+        for currency in self._converted_currencies():
+            if currency in self.exchange_rates:
+                continue
+
+            full_url = self._city_mode_url(
+                category=category,
+                city=city,
+                currency=currency,
+            )
+            currency_data = self._extract_page(full_url, extractor)
+
+            if currency_data is None:
+                logger.error(f"Could not find data for URL {full_url}.\n")
+                continue
+
+            means = pd.Series(
+                currency_data["Mean"],
+                index=currency_data["Category"],
+                dtype=object,
+            )
+            rate = exchange_rate(base_means, means)
+            template = currency_template(means)
+
+            if rate is None or template is None:
+                logger.warning(
+                    f"Could not derive the exchange rate of currency '{currency}' "
+                    + f"from city '{city}'.\n"
+                )
+                continue
+
+            logger.info(
+                f"Using the exchange rate {rate:.6f} from currency "
+                + f"'{self.currency}' to currency '{currency}'.\n"
+            )
+            self.exchange_rates[currency] = rate
+            self.currency_templates[currency] = template
+
+    def _calibrate_historical_currencies(
+        self,
+        item: str,
+        country: str,
+        data: Dict[str, List[Any]],
+        extractor: Extractor,
+    ) -> None:
+        """
+        Derives the exchange rates (of each year) of the converted currencies
+        that are still unknown, comparing the historical data page in the base
+        currency with the same page shown in each converted currency. The page
+        is compared again when it has years that weren't compared yet (e.g.,
+        a country with a longer history), so their rates are derived too.
+
+        Args:
+            item (str): the current item.
+            country (str): the current country.
+            data (Dict[str, List[Any]]): the values of each column of the
+                historical data page in the base currency.
+            extractor (Extractor): the function that extracts the page data.
+        """
+        if not is_monetary_item(item):
+            return
+
+        years = {int(year) for year in data["Year"]}
+
+        for currency in self._converted_currencies():
+            calibrated_years = self._calibrated_years.setdefault(currency, set())
+
+            if years <= calibrated_years:
+                continue
+
+            full_url = self._historical_data_url(
+                item=item,
+                country=country,
+                currency=currency,
+            )
+            currency_data = self._extract_page(full_url, extractor)
+
+            if currency_data is None:
+                logger.error(f"Could not find data for URL {full_url}.\n")
+                continue
+
+            calibrated_years.update(years)
+            rates = yearly_exchange_rates(data, currency_data)
+
+            if len(rates) == 0:
+                logger.warning(
+                    f"Could not derive the exchange rates of currency '{currency}' "
+                    + f"from country '{country}'.\n"
+                )
+                continue
+
+            # the rates already derived are kept, only the new years are added
+            known_rates = self.historical_exchange_rates.setdefault(currency, {})
+
+            for year, rate in rates.items():
+                known_rates.setdefault(year, rate)
+
+    def _get_parsers(self) -> ProcessPoolExecutor:
+        """
+        Gets the pool of processes used by the pipelined mode, starting it
+        if it isn't started yet. The same pool is used by all the categories
+        of a run.
+
+        Returns:
+            ProcessPoolExecutor: the pool of processes.
+        """
+        if self._parsers is None:
+            self._parsers = ProcessPoolExecutor(
+                max_workers=self.parser_settings.workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+
+        return self._parsers
+
+    def _shutdown_parsers(self) -> None:
+        """
+        Shuts down the pool of processes used by the pipelined mode,
+        cancelling the extractions that didn't start yet.
+        """
+        if not self._parsers is None:
+            self._parsers.shutdown(cancel_futures=True)
+            self._parsers = None
+
+    def _pipeline_pages(
+        self,
+        units: List[FetchUnit],
+    ) -> None:
+        """
+        Requests the pages in a pool of threads and extracts their data in a
+        pool of processes as soon as each page arrives, so the network and all
+        the CPU cores are used at the same time. At most two pages per process
+        wait to be extracted (the requests are paused otherwise) and only the
+        extracted values are kept in memory until they are used.
+
+        Args:
+            units (List[FetchUnit]): the pages that must be fetched.
+        """
+        units = remove_duplicates(units, key=lambda unit: unit.url)
+        workers = self.parser_settings.workers
+        max_concurrency = self.session_settings.max_concurrency
+        pending_pages = threading.BoundedSemaphore(2 * workers)
+
+        # the pages are kept until their data is extracted, so a page whose
+        # extraction fails in a worker is extracted in the main process
+        # without requesting it again
+        extracting_pages = {}
+        logger.info(
+            f"Requesting {len(units)} pages using up to {max_concurrency} "
+            + f"concurrent requests and extracting them using {workers} processes.\n"
+        )
+
+        parsers = self._get_parsers()
+
+        def release_page(url: str, future: Future) -> None:
+            pending_pages.release()
+
+            if not future.cancelled() and future.exception() is None:
+                extracting_pages.pop(url, None)
+
+        def fetch_and_submit(unit: FetchUnit) -> Optional[Future]:
+            pending_pages.acquire()
+
+            try:
+                page = self._fetch_page(unit.url)
+            except BaseException:
+                pending_pages.release()
+                raise
+
+            if page is None:
+                pending_pages.release()
+                return None
+
+            # the parsing and extraction times are measured in the worker
+            extractor = self._category_extractor(unit.category)
+
+            if not self.metrics is None:
+                extractor = partial(timed_extraction, extractor)
+
+            extracting_pages[unit.url] = page
+
+            try:
+                future = parsers.submit(
+                    extractor,
+                    page=page,
+                    backend=self.parser_settings.backend,
+                    parse_only=self.parser_settings.parse_only,
+                )
+            except BaseException as error:
+                pending_pages.release()
+                page = extracting_pages.pop(unit.url)
+
+                if not isinstance(error, Exception):
+                    raise
+
+                # the pool is broken (e.g., a worker process died), so the
+                # page is extracted in the main process
+                logger.warning(
+                    f"Could not extract the data of URL {unit.url} "
+                    + f"in a worker process: {error}.\n"
+                )
+                self._pages[unit.url] = page
+                return None
+
+            future.add_done_callback(partial(release_page, unit.url))
+            return future
+
+        with ThreadPoolExecutor(max_workers=max_concurrency) as fetchers:
+            futures = list(fetchers.map(fetch_and_submit, units))
+
+        for unit, future in zip(units, futures):
+            if future is None:
+                # the page is extracted in the main process (if it was fetched)
+                if not unit.url in self._pages:
+                    self._extracted[unit.url] = None
+
+                continue
+
+            try:
+                data = future.result()
+            except Exception as error:
+                # the page will be extracted again in the main process
+                # (using the page already requested), so the error is
+                # handled the same way as the other modes
+                logger.warning(
+                    f"Could not extract the data of URL {unit.url} "
+                    + f"in a worker process: {error}.\n"
+                )
+                self._pages[unit.url] = extracting_pages.pop(unit.url)
+                continue
+
+            if not self.metrics is None:
+                data, parse_seconds, extract_seconds = data
+                self._observe_extraction(unit.url, parse_seconds, extract_seconds)
+
+            self._extracted[unit.url] = data
+
+    def _category_units(
+        self,
+        category: str,
+    ) -> List[FetchUnit]:
+        """
+        Gets all the pages that will be used to extract the data
+        for a given category, in the same order they are used.
+
+        Args:
+            category (str): the current category.
+
+        Returns:
+            List[FetchUnit]: the pages that must be fetched.
+        """
+        if self.mode == "country":
+            if category == "historical-data":
+                if self.countries is None:
+                    return []
+
+                return [
+                    FetchUnit(
+                        category=category,
+                        mode=self.mode,
+                        key=(country, item),
+                        url=self._historical_data_url(item=item, country=country),
+                    )
+                    for country in self.countries
+                    for item in self.historical_items
+                ] + self._exchange_rate_units(category)
+
+            # the regions are resolved locally, so only the global
+            # ranking page of each year is needed
+            return [
+                FetchUnit(
+                    category=category,
+                    mode=self.mode,
+                    key=(year,),
+                    url=self._country_mode_url(category=category, year=year),
+                )
+                for year in self.years
+            ]
+
+        if self.mode == "city-rankings":
+            # all the ranked cities are in the same page
+            return [
+                FetchUnit(
+                    category=category,
+                    mode=self.mode,
+                    key=(year,),
+                    url=self._city_rankings_url(category=category, year=year),
+                )
+                for year in self.years
+            ]
+
+        currency = None
+
+        if category in MONETARY_CATEGORIES:
+            currency = self.currency
+
+        return [
+            FetchUnit(
+                category=category,
+                mode=self.mode,
+                key=(self._format_city(city),),
+                url=self._city_mode_url(
+                    category=category,
+                    city=self._format_city(city),
+                    currency=currency,
+                ),
+            )
+            for city in self.cities
+        ] + self._exchange_rate_units(category)
+
+    def _category_filters(
+        self,
+        category: str,
+    ) -> Dict[str, List[Any]]:
+        """
+        Gets the filters that are applied locally to the data extracted
+        for a given category.
+
+        Args:
+            category (str): the current category.
+
+        Returns:
+            Dict[str, List[Any]]: the column name and the values kept.
+        """
+        if self.mode == "city-rankings":
+            if self.cities is None:
+                return {}
+
+            return {"City": self.cities}
+
+        if self.mode != "country":
+            return {}
+
+        if category == "historical-data":
+            return {"Year": self.years}
+
+        filters = {}
+
+        if self.regions != [None]:
+            filters["Region"] = self.regions
+
+        if not self.countries is None:
+            filters["Country"] = self.countries
+
+        return filters
+
+    def _plan_units(self) -> List[FetchUnit]:
+        """
+        Gets all the pages implied by the config, for all the categories.
+
+        Returns:
+            List[FetchUnit]: the pages that must be fetched.
+        """
+        return [
+            unit
+            for category in self.categories
+            for unit in self._category_units(category)
+        ]
+
+    def plan(
+        self,
+        latency: float = 1.0,
+        cache_policy: VALID_CACHE_POLICIES = "use",
+    ) -> RequestPlan:
+        """
+        Creates the request plan of the config (dry-run), which contains the
+        deduplicated pages that will be fetched, the filters applied locally,
+        and the number of requests and estimated time, without requesting
+        anything.
+
+        Args:
+            latency (float, optional): the average time of a request
+                (in seconds) used to estimate the time. Defaults to 1.0.
+            cache_policy (VALID_CACHE_POLICIES, optional): the cache policy
+                that will be used (see the `scrap` function). Defaults to 'use'.
+
+        Returns:
+            RequestPlan: the request plan.
+        """
+        self._set_cache_policy(cache_policy)
+
+        units = self._plan_units()
+        urls = remove_duplicates([unit.url for unit in units])
+        cached_urls = []
+
+        if not self.cache_settings is None and cache_policy != "refresh":
+            cache = self._get_cache()
+            cached_urls = [full_url for full_url in urls if cache.is_cached(full_url)]
+
+        if cache_policy == "offline":
+            cached_urls = urls
+
+        rate = None
+
+        if not self.rate_limiter is None:
+            rate = self.rate_limit_settings.max_rate
+
+        filters = {
+            category: self._category_filters(category) for category in self.categories
+        }
+
+        request_plan = RequestPlan(
+            units=units,
+            urls=urls,
+            cached_urls=cached_urls,
+            filters={
+                category: category_filters
+                for category, category_filters in filters.items()
+                if len(category_filters) > 0
+            },
+            estimated_time=estimate_time(
+                request_count=len(urls) - len(cached_urls),
+                latency=latency,
+                max_concurrency=self.session_settings.max_concurrency,
+                rate=rate,
+            ),
+        )
+        logger.info(f"Request plan:\n{request_plan.summary()}\n")
+
+        return request_plan
+
+    @staticmethod
+    def _format_city(city: str) -> str:
+        """
+        Formats the city's name the same way it's used in the page URL.
+
+        Args:
+            city (str): the city's name.
+
+        Returns:
+            str: the formatted city's name.
+        """
+        return format_city(city)
+
+    def _country_mode_url(
+        self,
+        category: str,
+        year: Union[int, str],
+    ) -> str:
+        """
+        Creates the rankings by country page URL (for all regions).
+
+        Args:
+            category (str): the current category.
+            year (Union[int, str]): the current year.
+
+        Returns:
+            str: the page URL.
+        """
+        return f"{self.base_url}/{category}/rankings_by_country.jsp?title={year}"
+
+    def _city_rankings_url(
+        self,
+        category: str,
+        year: Union[int, str],
+    ) -> str:
+        """
+        Creates the rankings by city page URL (for all the ranked cities).
+
+        Args:
+            category (str): the current category.
+            year (Union[int, str]): the current year.
+
+        Returns:
+            str: the page URL.
+        """
+        return f"{self.base_url}/{category}/rankings.jsp?title={year}"
+
+    def _historical_data_url(
+        self,
+        item: str,
+        country: str,
+        currency: Optional[str] = None,
+    ) -> str:
+        """
+        Creates the historical data page URL.
+
+        Args:
+            item (str): the current item.
+            country (str): the current country.
+            currency (Optional[str], optional): the currency used to display
+                the values. Defaults to None (uses the base currency).
+
+        Returns:
+            str: the page URL.
+        """
+        if currency is None:
+            currency = self.currency
+
+        full_url = f"{self.base_url}/cost-of-living/historical-data-country"
+        full_url = full_url + f"?itemId={ITENS_MAPPING[item]}"
+        return full_url + f"&country={country}&currency={currency}"
+
+    def _city_mode_url(
+        self,
+        category: str,
+        city: str,
+        currency: Optional[str] = None,
+    ) -> str:
+        """
+        Creates the city page URL.
+
+        Args:
+            category (str): the current category.
+            city (str): the formatted city's name.
+            currency (Optional[str], optional): the currency used to display
+                the values. Defaults to None.
+
+        Returns:
+            str: the page URL.
+        """
+        full_url = f"{self.base_url}/{category}/in/{city}"
+
+        if not currency is None:
+            full_url = full_url + f"?displayCurrency={currency}"
+
+        return full_url
+
+    @logger.catch
+    def scrap(
+        self,
+        cache_policy: VALID_CACHE_POLICIES = "use",
+        checkpoint_policy: VALID_CHECKPOINT_POLICIES = "resume",
+    ) -> List[Tuple[str, pd.DataFrame]]:
+        """
+        Main function responsible for scraping the data.
+
+        Args:
+            cache_policy (VALID_CACHE_POLICIES, optional): how the response
+                cache is used (only when the cache is enabled). 'use' gets the
+                pages from the cache while they don't expire, 'refresh'
+                always requests the pages again (updating the cache), and
+                'offline' only uses the cached pages. Defaults to 'use'.
+            checkpoint_policy (VALID_CHECKPOINT_POLICIES, optional): how the
+                checkpoint journal is used (only when it's enabled). 'resume'
+                skips the pages completed in a previous run of the same config,
+                'failed' only requests again the pages that failed, and
+                'restart' clears the journal and requests all the pages.
+                Defaults to 'resume'.
+
+        Returns:
+            dataframes (List[Tuple[str, pd.DataFrame]]): a list containing
+                the extracted data (saved in a dataframe format) with it
+                respective name used to identify it.
+        """
+        dataframes = []
+        self._set_cache_policy(cache_policy)
+        self._set_checkpoint_policy(checkpoint_policy)
+
+        try:
+            # when the pipelined mode is enabled, the data of all the pages
+            # implied by the config is extracted beforehand in other processes
+            # (see the `_pipeline_pages` function). Similarly, when the
+            # concurrent mode is enabled, all the pages are requested
+            # beforehand. In both cases, the dataframes are still created
+            # following the same order as the sequential mode
+            units = self._pending_units(self._plan_units())
+
+            if self.parser_settings.workers > 1:
+                self._pipeline_pages(units)
+            elif self.session_settings.max_concurrency > 1:
+                self._prefetch_pages([unit.url for unit in units])
+
+            dataframes = self._scrap_categories()
+            self._finish_checkpoint()
+        finally:
+            self._shutdown_parsers()
+            self._pages.clear()
+            self._extracted.clear()
+            self._log_checkpoint()
+            self._export_metrics()
+
+        return dataframes
+
+    @logger.catch
+    async def scrap_async(
+        self,
+        cache_policy: VALID_CACHE_POLICIES = "use",
+        checkpoint_policy: VALID_CHECKPOINT_POLICIES = "resume",
+    ) -> List[Tuple[str, pd.DataFrame]]:
+        """
+        Asynchronous version of the `scrap` function. All the pages implied
+        by the config are requested without blocking the event loop (using
+        up to `max_concurrency` concurrent requests) and then the data is
+        extracted in a worker thread.
+
+        Args:
+            cache_policy (VALID_CACHE_POLICIES, optional): how the response
+                cache is used (see the `scrap` function). Defaults to 'use'.
+            checkpoint_policy (VALID_CHECKPOINT_POLICIES, optional): how the
+                checkpoint journal is used (see the `scrap` function).
+                Defaults to 'resume'.
+
+        Returns:
+            dataframes (List[Tuple[str, pd.DataFrame]]): a list containing
+                the extracted data (saved in a dataframe format) with it
+                respective name used to identify it.
+        """
+        # the checkpoint journal and the metrics are read and written
+        # in worker threads, so their disk I/O doesn't block the event loop
+        self._set_cache_policy(cache_policy)
+        await asyncio.to_thread(self._set_checkpoint_policy, checkpoint_policy)
+
+        try:
+            units = await asyncio.to_thread(self._pending_units, self._plan_units())
+            await self._prefetch_pages_async([unit.url for unit in units])
+
+            if self.parser_settings.workers > 1:
+                await asyncio.to_thread(self._pipeline_pages, units)
+
+            dataframes = await asyncio.to_thread(self._scrap_categories)
+            await asyncio.to_thread(self._finish_checkpoint)
+        finally:
+            await asyncio.to_thread(self._shutdown_parsers)
+            self._pages.clear()
+            self._extracted.clear()
+            await asyncio.to_thread(self._log_checkpoint)
+            await asyncio.to_thread(self._export_metrics)
+
+            # the session is bound to the event loop, so it can't be reused
+            # by a later call unless the scraper is used with `async with`
+            if not self._async_context:
+                await self._close_async_session()
+
+        return dataframes
+
+    def _scrap_categories(
+        self,
+    ) -> List[Tuple[str, pd.DataFrame]]:
+        """
+        Extracts the data of each category.
+
+        Returns:
+            dataframes (List[Tuple[str, pd.DataFrame]]): a list containing
+                the extracted data (saved in a dataframe format) with it
+                respective name used to identify it.
+        """
+        dataframes = []
+
+        # iterating over the categories
+        for category in self.categories:
+            data = pd.DataFrame()
+            logger.info(f"Collecting '{category}' data using mode '{self.mode}'.\n")
+
+            if self.mode == "country":
+                if category == "historical-data":
+                    data = self._historical_data_country_mode(
+                        itens=self.historical_items,
+                        countries=self.countries,
+                    )
+                else:
+                    data = self._country_mode(
+                        category=category,
+                        regions=self.regions,
+                    )
+            elif self.mode == "city-rankings":
+                data = concat_frames(
+                    [
+                        dataframe
+                        for _, dataframe in self._iter_city_rankings_mode(
+                            category=category,
+                        )
+                    ]
                 )
             else:
-                logger.error(f"Could not find data for URL {full_url}.\n")
+                data = self._scrap_city_category(
+                    category=category,
+                    cities=self.cities,
+                )
+
+            with self._time_stage("frame", category):
+                data = self._format_output(data)
+
+            data_name = f"{category}_{self.mode}"
+            dataframes.append((data_name, data))
+
+        # the dataframes of the first categories are updated to the final
+        # categories, so all of them have the same categorical dtypes
+        if self.output_settings.categorical:
+            dataframes = [
+                (data_name, self.shared_categories.align(data))
+                for data_name, data in dataframes
+            ]
 
         return dataframes
 
-    def _others_city_mode(
+    def _format_output(
         self,
-        category: str,
-        cities: Union[str, List[str]],
+        data: pd.DataFrame,
     ) -> pd.DataFrame:
         """
-        Extracts others measurements (crime and health care) considering
-        the 'city mode', which means that the data extracted will be for the desired city.
+        Formats the extracted data following the output settings.
 
         Args:
-            category (str): the current category.
-            cities (Union[str, List[str]]): the cities that will be scraped.
+            data (pd.DataFrame): the extracted data.
 
         Returns:
-            dataframes (List[Tuple[str, pd.DataFrame]]): a list containing
-                the data (saved in a dataframe format) for the given cities.
+            pd.DataFrame: the formatted data.
         """
-        dataframes = pd.DataFrame()
-        logger.warning(
-            "Filter by year option can not be used for this category and mode.\n"
-        )
+        if self.output_settings.typed:
+            data = to_typed_frame(data, float_dtype=self.output_settings.float_dtype)
 
-        for city in cities:
-            city_dataframe = pd.DataFrame()
-            city = city.title().replace(" ", "-")  # formatting the city's name
-            logger.info(
-                f"Collecting '{category}' data in 'city' mode for city '{city}'.\n"
-            )
+        if self.output_settings.categorical:
+            data = self.shared_categories.encode(data)
 
-            full_url = f"{BASE_URL}/{category}/in/{city}"
+        return data
 
-            request = requests.get(full_url, timeout=300)
+    @logger.catch(reraise=True)
+    def iter_scrap(
+        self,
+        cache_policy: VALID_CACHE_POLICIES = "use",
+        checkpoint_policy: VALID_CHECKPOINT_POLICIES = "resume",
+    ) -> Iterator[Tuple[str, str, Tuple[Any, ...], pd.DataFrame]]:
+        """
+        Streaming version of the `scrap` function, which yields the data
+        of each page as soon as it's extracted, so only the current page is
+        kept in memory and the data can be saved while the other pages are
+        still being scraped. When the concurrent or pipelined mode is enabled,
+        only the pages of the current category are requested beforehand.
 
-            if request.status_code == 200:
-                numbeo_html_data = BeautifulSoup(request.text, "html.parser")
+        Args:
+            cache_policy (VALID_CACHE_POLICIES, optional): how the response
+                cache is used (see the `scrap` function). Defaults to 'use'.
+            checkpoint_policy (VALID_CHECKPOINT_POLICIES, optional): how the
+                checkpoint journal is used (see the `scrap` function).
+                Defaults to 'resume'.
+
+        Yields:
+            Tuple[str, str, Tuple[Any, ...], pd.DataFrame]: the category, the
+                mode, the key that identifies the data within the category
+                (the year in 'country' mode, the country for the historical
+                data and the city in 'city' mode) and the extracted data.
+        """
+        self._set_cache_policy(cache_policy)
+        self._set_checkpoint_policy(checkpoint_policy)
 
-                # getting the tables headers
-                tables_headers = numbeo_html_data.find_all("h2")
+        try:
+            for category in self.categories:
+                logger.info(f"Collecting '{category}' data using mode '{self.mode}'.\n")
+                units = self._pending_units(self._category_units(category))
 
-                # getting the tables
-                tables = numbeo_html_data.find_all(
-                    "table",
-                    attrs={
-                        "class": "table_builder_with_value_explanation data_wide_table"
-                    },
-                )
+                if self.parser_settings.workers > 1:
+                    self._pipeline_pages(units)
+                elif self.session_settings.max_concurrency > 1:
+                    self._prefetch_pages([unit.url for unit in units])
 
-                # extracting the data from the tables
-                city_dataframe = self._get_tables_city_mode(
-                    tables_headers=tables_headers,
-                    tables=tables,
-                    attributes_class_name="columnWithName",
-                    attributes_values_class_name="indexValueTd",
-                    levels_class_name="hidden_on_small_mobile",
-                )
+                for key, dataframe in self._iter_category(category):
+                    with self._time_stage("frame", category):
+                        dataframe = self._format_output(dataframe)
 
-                # getting the indices table
-                indices_df = self._get_index_table(
-                    html_data=numbeo_html_data,
-                    index_table_class_name="table_indices",
-                    indices_values_style="text-align: right",
-                )
+                    yield category, self.mode, key, dataframe
 
-                city_dataframe = pd.concat(
-                    [city_dataframe, indices_df], axis=0, ignore_index=True
-                )
+                self._pages.clear()
+                self._extracted.clear()
 
-                logger.info(
-                    f"Found {city_dataframe.shape[0]} data rows "
-                    + f"and {city_dataframe.shape[0]} features.\n"
-                )
+            self._finish_checkpoint()
+        finally:
+            self._shutdown_parsers()
+            self._pages.clear()
+            self._extracted.clear()
+            self._log_checkpoint()
+            self._export_metrics()
 
-                city_dataframe["City"] = [city] * city_dataframe.shape[0]
+    def _iter_category(
+        self,
+        category: str,
+    ) -> Iterator[Tuple[Tuple[Any, ...], pd.DataFrame]]:
+        """
+        Extracts the data of a category page by page, using the function
+        that matches the mode and the category.
+
+        Args:
+            category (str): the current category.
 
-                dataframes = pd.concat(
-                    [dataframes, city_dataframe], axis=0, ignore_index=True
+        Returns:
+            Iterator[Tuple[Tuple[Any, ...], pd.DataFrame]]: the key that
+                identifies the data within the category and the extracted data.
+        """
+        if self.mode == "country":
+            if category == "historical-data":
+                return self._iter_historical_data_country_mode(
+                    itens=self.historical_items,
+                    countries=self.countries,
                 )
-            else:
-                logger.error(f"Could not find data for URL {full_url}.\n")
 
-        return dataframes
+            return self._iter_country_mode(
+                category=category,
+                regions=self.regions,
+            )
+
+        if self.mode == "city-rankings":
+            return self._iter_city_rankings_mode(category=category)
+
+        return self._iter_city_mode(
+            category=category,
+            cities=self.cities,
+        )
 
-    def _pollution_city_mode(
+    def _scrap_city_category(
         self,
         category: str,
         cities: Union[str, List[str]],
     ) -> pd.DataFrame:
         """
-        Extracts pollution data considering the 'city mode',
+        Extracts the data of a category considering the 'city mode',
         which means that the data extracted will be for the desired city.
 
         Args:
@@ -725,256 +2289,543 @@ class NumbeoScraper:
             cities (Union[str, List[str]]): the cities that will be scraped.
 
         Returns:
-            dataframes (List[Tuple[str, pd.DataFrame]]): a list containing
-                the pollution data (saved in a dataframe format) for the given
-                cities.
+            pd.DataFrame: the extracted data.
         """
-        dataframes = pd.DataFrame()
-        logger.warning(
-            "Filter by year option can not be used for this category and mode.\n"
+        return concat_frames(
+            [
+                dataframe
+                for _, dataframe in self._iter_city_mode(
+                    category=category,
+                    cities=cities,
+                )
+            ]
         )
 
-        for city in cities:
-            city = city.title().replace(" ", "-")  # formatting the city's name
-            logger.info(
-                f"Collecting '{category}' data in 'city' mode for city '{city}'.\n"
+    def _country_mode(
+        self,
+        category: str,
+        regions: Union[str, List[str]],
+    ) -> pd.DataFrame:
+        """
+        Extracts the data considering the 'country mode', which means that
+        the data extracted will be for the country as a whole.
+
+        Args:
+            category (str): the current category.
+            regions (Union[str, List[str]]): the regions that will be kept
+                ([None] for all regions).
+
+        Returns:
+            pd.DataFrame: the extracted data.
+        """
+        years_dataframes = [
+            dataframe
+            for _, dataframe in self._iter_country_mode(
+                category=category,
+                regions=regions,
             )
+        ]
+
+        if regions == [None]:
+            return concat_frames(years_dataframes)
+
+        # the data is grouped by region (and then by year)
+        return concat_frames(
+            [
+                dataframe[dataframe["Region"] == region]
+                for region in regions
+                for dataframe in years_dataframes
+            ]
+        )
+
+    def _iter_country_mode(
+        self,
+        category: str,
+        regions: Union[str, List[str]],
+    ) -> Iterator[Tuple[Tuple[Any, ...], pd.DataFrame]]:
+        """
+        Extracts the data considering the 'country mode', one year at a time.
+
+        The global ranking page is fetched once per year and each country
+        is labelled with its region locally, so filtering by region does not
+        need any extra request.
+
+        Args:
+            category (str): the current category.
+            regions (Union[str, List[str]]): the regions that will be kept
+                ([None] for all regions).
 
-            full_url = f"{BASE_URL}/{category}/in/{city}"
+        Yields:
+            Tuple[Tuple[Any, ...], pd.DataFrame]: the year and its data.
+        """
+        for year in self.years:
+            full_url = self._country_mode_url(category=category, year=year)
 
-            request = requests.get(full_url, timeout=300)
+            logger.debug(
+                f"Collecting '{category}' data in 'country' mode for year '{year}'.\n"
+            )
 
-            if request.status_code == 200:
-                numbeo_html_data = BeautifulSoup(request.text, "html.parser")
+            data = self._extract_page(full_url, self._category_extractor(category))
 
-                # getting the tables headers
-                tables_headers = numbeo_html_data.find_all("h2")
+            if data is None:
+                logger.error(f"Could not find data for URL {full_url}.\n")
+                continue
 
-                # getting the tables
-                tables = numbeo_html_data.find_all(
-                    "table",
-                    attrs={
-                        "class": "table_builder_with_value_explanation data_wide_table"
-                    },
+            with self._time_stage("frame", category, full_url):
+                dataframe = to_dataframe(data)
+                dataframe["Year"] = [year] * dataframe.shape[0]
+                dataframe["Region"] = dataframe["Country"].map(
+                    COUNTRIES_REGIONS_MAPPING
                 )
 
-                # extracting the data from the tables
-                city_dataframe = self._get_tables_city_mode(
-                    tables_headers=tables_headers,
-                    tables=tables,
-                    attributes_class_name="columnWithName",
-                    attributes_values_class_name="indexValueTd",
-                    levels_class_name="hidden_on_small_mobile",
+            unknown_countries = dataframe.loc[
+                dataframe["Region"].isna(), "Country"
+            ].tolist()
+
+            if len(unknown_countries) > 0:
+                logger.warning(
+                    f"Could not find the region of countries {unknown_countries}.\n"
                 )
 
-                # creating the pollution indexes dataframe
-                try:
-                    pol_indices_df = self._get_index_table(
-                        html_data=numbeo_html_data,
-                        index_table_class_name="who_pollution_data_widget",
-                        indices_values_style="text-align: right",
-                        pollution_index_table=True,
-                    )
-                except AttributeError:
-                    # some cities doesn't have the pollution index table,
-                    # so we'll just ignore it
-                    logger.warning(
-                        f"Could not find pollution index for URL {full_url}.\n"
-                    )
-                    pol_indices_df = pd.DataFrame()
+            logger.info(
+                f"Found {dataframe.shape[0]} data rows and "
+                + f"{dataframe.shape[1]} features for year '{year}'.\n"
+            )
 
-                # creating the indexes dataframe
-                indices_df = self._get_index_table(
-                    html_data=numbeo_html_data,
-                    index_table_class_name="table_indices",
-                    indices_values_style="text-align: right",
+            # the rows of the countries that aren't kept were already skipped
+            # (and the rank is relative to the countries of the region) while
+            # the page was extracted, so the rows are only grouped by region
+            if regions != [None]:
+                dataframe = concat_frames(
+                    [dataframe[dataframe["Region"] == region] for region in regions]
                 )
 
-                city_dataframe = pd.concat(
-                    [city_dataframe, indices_df, pol_indices_df],
-                    axis=0,
-                    ignore_index=True,
+            yield (year,), dataframe
+
+    def _iter_city_rankings_mode(
+        self,
+        category: str,
+    ) -> Iterator[Tuple[Tuple[Any, ...], pd.DataFrame]]:
+        """
+        Extracts the data considering the 'city-rankings mode', one year at
+        a time. The rankings page has the indices of all the ranked cities,
+        so a single page is requested per year (instead of one page per
+        city) and the chosen cities are kept locally.
+
+        Args:
+            category (str): the current category.
+
+        Yields:
+            Tuple[Tuple[Any, ...], pd.DataFrame]: the year and its data.
+        """
+        extractor = self._category_extractor(category)
+
+        for year in self.years:
+            full_url = self._city_rankings_url(category=category, year=year)
+
+            logger.debug(
+                f"Collecting '{category}' data in 'city-rankings' mode "
+                + f"for year '{year}'.\n"
+            )
+
+            data = self._extract_page(full_url, extractor)
+
+            if data is None:
+                logger.error(f"Could not find data for URL {full_url}.\n")
+                continue
+
+            with self._time_stage("frame", category, full_url):
+                dataframe = to_dataframe(data)
+                dataframe["Year"] = [year] * dataframe.shape[0]
+
+            logger.info(
+                f"Found {dataframe.shape[0]} data rows and "
+                + f"{dataframe.shape[1]} features for year '{year}'.\n"
+            )
+
+            if not self.cities is None:
+                found_cities = set(dataframe["City"].map(self._format_city))
+                found_cities.update(
+                    self._format_city(f"{city}, {country}")
+                    for city, country in zip(dataframe["City"], dataframe["Country"])
                 )
+                missing_cities = [
+                    city
+                    for city in self.cities
+                    if not self._format_city(city) in found_cities
+                ]
+
+                if len(missing_cities) > 0:
+                    logger.warning(
+                        f"Could not find cities {missing_cities} in the "
+                        + f"'{category}' rankings of year '{year}'.\n"
+                    )
+
+            yield (year,), dataframe
+
+    def _historical_data_country_mode(
+        self,
+        itens: Union[str, List[str]],
+        countries: Union[str, List[str]],
+    ) -> pd.DataFrame:
+        """
+        Extracts the historical data considering the 'country mode',
+        which means that the data extracted will be for the country as a whole.
+
+        Args:
+            itens (Union[str, List[str]]): the itens that will be scraped.
+            countries (Union[str, List[str]]): the countries that will be scraped.
+
+        Returns:
+            pd.DataFrame: the historical data for the given countries and itens.
+        """
+        records = RowBuilder(columns=HISTORICAL_RECORDS_COLUMNS)
+
+        for _, country_records in self._iter_historical_records(
+            itens=itens,
+            countries=countries,
+        ):
+            records.extend(country_records)
+
+        # all the countries are pivoted at once
+        with self._time_stage("frame", "historical-data"):
+            return self._pivot_historical_records(records.to_dict(), countries)
+
+    def _iter_historical_data_country_mode(
+        self,
+        itens: Union[str, List[str]],
+        countries: Union[str, List[str]],
+    ) -> Iterator[Tuple[Tuple[Any, ...], pd.DataFrame]]:
+        """
+        Extracts the historical data considering the 'country mode',
+        one country at a time (with all the itens).
+
+        Args:
+            itens (Union[str, List[str]]): the itens that will be scraped.
+            countries (Union[str, List[str]]): the countries that will be scraped.
 
-                logger.info(
-                    f"Found {city_dataframe.shape[0]} data rows "
-                    + f"and {city_dataframe.shape[0]} features.\n"
+        Yields:
+            Tuple[Tuple[Any, ...], pd.DataFrame]: the country and its data.
+        """
+        for country, country_records in self._iter_historical_records(
+            itens=itens,
+            countries=countries,
+        ):
+            with self._time_stage("frame", "historical-data"):
+                dataframe = self._pivot_historical_records(
+                    country_records,
+                    countries,
                 )
 
-                city_dataframe["City"] = [city] * city_dataframe.shape[0]
+            yield (country,), dataframe
+
+    def _iter_historical_records(
+        self,
+        itens: Union[str, List[str]],
+        countries: Union[str, List[str]],
+    ) -> Iterator[Tuple[str, Dict[str, List[Any]]]]:
+        """
+        Extracts the historical data of each country as long-format records
+        (one record per country, year and item), keeping only the records of
+        the chosen years. The countries without any data are skipped.
+
+        Args:
+            itens (Union[str, List[str]]): the itens that will be scraped.
+            countries (Union[str, List[str]]): the countries that will be scraped.
+
+        Yields:
+            Tuple[str, Dict[str, List[Any]]]: the country and the values of
+                each column of its records (see `HISTORICAL_RECORDS_COLUMNS`).
+        """
+        category = "cost-of-living"
+
+        # the years that aren't kept are skipped while the page is extracted
+        extractor = self._category_extractor("historical-data")
+
+        for position, country in enumerate(countries):
+            records = RowBuilder(columns=HISTORICAL_RECORDS_COLUMNS)
+            found_data = False
 
-                dataframes = pd.concat(
-                    [dataframes, city_dataframe], axis=0, ignore_index=True
+            for item in itens:
+                full_url = self._historical_data_url(
+                    item=item,
+                    country=country,
+                )
+                logger.debug(
+                    f"Collecting '{category}' data for country '{country}', "
+                    + f"item '{item}', and currency '{self.currency}'.\n"
                 )
-            else:
-                logger.error(f"Could not find data for URL {full_url}.\n")
 
-        return dataframes
+                data = self._extract_page(full_url, extractor)
 
-    @logger.catch
-    def _get_index_table(
+                if data is None:
+                    logger.error(f"Could not find data for URL {full_url}.\n")
+                    continue
+
+                found_data = True
+
+                if len(self._converted_currencies()) > 0:
+                    self._calibrate_historical_currencies(
+                        item, country, data, extractor
+                    )
+
+                with self._time_stage("frame", "historical-data", full_url):
+                    rows = [
+                        (index, int(year)) for index, year in enumerate(data["Year"])
+                    ]
+
+                    for item_column, values in data.items():
+                        if item_column == "Year":
+                            continue
+
+                        for index, year in rows:
+                            records.append([position, year, item_column, values[index]])
+
+            if not found_data:
+                continue
+
+            logger.info(
+                f"Found {len(records)} data records for country '{country}' "
+                + f"from years {self.years}.\n"
+            )
+            yield country, records.to_dict()
+
+    def _pivot_historical_records(
         self,
-        html_data: BeautifulSoup,
-        index_table_class_name: str,
-        indices_values_style: str,
-        pollution_index_table: bool = False,
-        create_level_column: bool = True,
+        records: Dict[str, List[Any]],
+        countries: List[str],
     ) -> pd.DataFrame:
         """
-        Extracts the index table within the page. This necessary only
-        when we are getting the data using the 'city' mode (and only
-        for the 'crime', 'health care', 'traffic', and 'pollution'
-        measurements).
+        Creates the historical data table from the long-format records,
+        with one row per country and year and one column per item.
 
         Args:
-            html_data (BeautifulSoup): the page HTML code.
-            index_table_class_name (str): the index table class string.
-                It's used to identify the index table.
-            indices_values_style (str): the indices values style string.
-                It's used to extract the table values.
-            pollution_index_table (bool, optional): Whether it's a special
-                case of the individual pollution index table or not. Defaults to False.
-            create_level_column (bool, optional): Whether to create
-                a 'Level' column or not. Defaults to True.
+            records (Dict[str, List[Any]]): the values of each column
+                of the records (see `HISTORICAL_RECORDS_COLUMNS`).
+            countries (List[str]): the countries, following the positions
+                used in the records.
 
         Returns:
-            pd.DataFrame: the index table in a dataframe format.
+            pd.DataFrame: the historical data.
         """
-        logger.info("Getting the index table using values:\n")
-        logger.info(
-            f"index_table_class_name: {index_table_class_name}, "
-            + f"indices_values_style: {indices_values_style}, "
-            + f"pollution_index_table: {pollution_index_table}, "
-            + f"create_level_column: {create_level_column}\n"
+        if len(self._converted_currencies()) > 0:
+            return self._pivot_historical_currencies(records, countries)
+
+        # the country position is used as the index, so the rows follow
+        # the countries order (and then the years order)
+        dataframe = pivot_records(
+            records,
+            index=["Position", "Year"],
+            column="Item",
+            value="Value",
         )
 
-        # getting the indices table
-        indices_table = html_data.find("table", attrs={"class": index_table_class_name})
+        if dataframe.empty:
+            return pd.DataFrame()
+
+        dataframe["Country"] = [
+            countries[position] for position in dataframe["Position"]
+        ]
+        return dataframe.drop(columns=["Position"])
+
+    def _pivot_historical_currencies(
+        self,
+        records: Dict[str, List[Any]],
+        countries: List[str],
+    ) -> pd.DataFrame:
+        """
+        Creates the historical data table from the long-format records in
+        all the currencies, converting the records of the base currency to each
+        converted currency (using the exchange rates already derived). The
+        'Currency Code' column identifies the currency of the rows.
 
-        # extracting the indices name
-        indices = [ind for ind in indices_table.find_all("td") if not ind.attrs]
-        indices = [indice.text.strip().replace(":", "") for indice in indices]
+        Args:
+            records (Dict[str, List[Any]]): the values of each column of the
+                records in the base currency (see `HISTORICAL_RECORDS_COLUMNS`).
+            countries (List[str]): the countries, following the positions
+                used in the records.
 
-        # extracting the indices values
-        indices_values = indices_table.find_all(
-            "td",
-            attrs={"style": indices_values_style},
+        Returns:
+            pd.DataFrame: the historical data.
+        """
+        currencies = [self.currency]
+        currencies_records = RowBuilder(
+            columns=HISTORICAL_RECORDS_COLUMNS + ["Currency Position"]
+        )
+        currencies_records.extend(
+            {**records, "Currency Position": [0] * len(records["Value"])}
         )
-        indices_values = [
-            value.text.strip().replace(":", "") for value in indices_values
-        ]
 
-        # creating the index dataframe
-        if not pollution_index_table:
-            indices_df = pd.DataFrame(
+        for currency in self._converted_currencies():
+            if not currency in self.historical_exchange_rates:
+                # the items that aren't amounts of money don't need a rate
+                if any(filter(is_monetary_item, records["Item"])):
+                    logger.warning(
+                        f"Skipping currency '{currency}', "
+                        + "since its exchange rates are unknown.\n"
+                    )
+                    continue
+
+            rates = self.historical_exchange_rates.get(currency, {})
+            missing_years = sorted(
                 {
-                    "Header": ["Index"] * len(indices),
-                    "Category": indices,
-                    "Value": indices_values,
-                    "Level": [pd.NA] * len(indices),
+                    int(year)
+                    for year, item in zip(records["Year"], records["Item"])
+                    if is_monetary_item(item)
                 }
+                - rates.keys()
             )
-        else:
-            indices_df = pd.DataFrame(
+
+            if len(rates) > 0 and len(missing_years) > 0:
+                logger.warning(
+                    f"Using the average exchange rate of currency '{currency}' "
+                    + f"for years {missing_years}, since their exchange rates "
+                    + "are unknown.\n"
+                )
+
+            currencies_records.extend(
                 {
-                    "Header": ["Index"] * len(indices),
-                    "Category": indices,
-                    "Value": indices_values[:-1] + [pd.NA],
-                    "Level": [pd.NA, pd.NA, indices_values[-1]],
+                    **convert_historical_records(records, rates=rates),
+                    "Currency Position": [len(currencies)] * len(records["Value"]),
                 }
             )
+            currencies.append(currency)
+
+        # all the currencies are pivoted at once, and the rows follow
+        # the countries order (and then the currencies and years order)
+        dataframe = pivot_records(
+            currencies_records.to_dict(),
+            index=["Position", "Currency Position", "Year"],
+            column="Item",
+            value="Value",
+        )
 
-        # deleting the 'level' column
-        if not create_level_column:
-            logger.info("Deleting the 'level' column.\n")
-            indices_df = indices_df.drop(columns=["Level"])
+        if dataframe.empty:
+            return pd.DataFrame()
 
-        return indices_df
+        dataframe["Country"] = [
+            countries[position] for position in dataframe["Position"]
+        ]
+        dataframe["Currency Code"] = [
+            currencies[position] for position in dataframe["Currency Position"]
+        ]
+        return dataframe.drop(columns=["Position", "Currency Position"])
 
-    @logger.catch
-    def _get_tables_city_mode(
+    def _iter_city_mode(
         self,
-        tables_headers: List,
-        tables: List,
-        attributes_class_name: str,
-        attributes_values_class_name: str,
-        levels_class_name: str = None,
-    ) -> pd.DataFrame:
+        category: str,
+        cities: Union[str, List[str]],
+    ) -> Iterator[Tuple[Tuple[Any, ...], pd.DataFrame]]:
         """
-        Extracts the tables for the majority of the measurements for the 'city'
-        mode. With the exception of 'cost of living', the page for the other
-        measures isn't organized in just only table, but rather multiple ones.
+        Extracts the data considering the 'city mode', one city at a time.
+        The page of each category is extracted by its own extractor function
+        (see the `_category_extractor` function).
 
         Args:
-            tables_headers (List): a list containing the tables headears.
-            tables (List): a list containing the tables HTML.
-            attributes_class_name (str): the table attributes class string.
-                It's used to identify the table attributes.
-            attributes_values_class_name (str): the table attributes values
-                class string. It's used to identify the table data.
-            levels_class_name (str, optional): the levels class string.
-                It's used to identify the table measures levels. Defaults to None.
+            category (str): the current category.
+            cities (Union[str, List[str]]): the cities that will be scraped.
 
-        Returns:
-            pd.DataFrame: the collected data in a dataframe format.
+        Yields:
+            Tuple[Tuple[Any, ...], pd.DataFrame]: the city and its data.
         """
-        logger.info("Getting the data table for city mode using values:\n")
-        logger.info(
-            f"attributes_class_name: {attributes_class_name}, "
-            + f"attributes_values_class_name: {attributes_values_class_name}, "
-            + f"levels_class_name: {levels_class_name}\n"
+        extractor = self._category_extractor(category)
+        currency = None
+
+        if category in MONETARY_CATEGORIES:
+            currency = self.currency
+
+        logger.warning(
+            "Filter by year option can not be used for this category and mode.\n"
         )
-        city_dataframe = pd.DataFrame()
 
-        for header, table in zip(
-            tables_headers,
-            tables,
-        ):
-            # getting only the header text
-            header_text = header.text
+        for city in cities:
+            city = self._format_city(city)
 
-            # getting the attributes name
-            attributes_name = table.find_all(
-                "td",
-                attrs={"class": attributes_class_name},
+            full_url = self._city_mode_url(
+                category=category,
+                city=city,
+                currency=currency,
             )
-            attributes_name = [att.text.strip() for att in attributes_name]
 
-            # getting the attributes value
-            values = table.find_all(
-                "td",
-                attrs={"class": attributes_values_class_name},
+            if currency is None:
+                logger.debug(
+                    f"Collecting '{category}' data in 'city' mode for city '{city}'.\n"
+                )
+            else:
+                logger.debug(
+                    f"Collecting '{category}' data in 'city' mode "
+                    + f"for city '{city}' and currency '{currency}'.\n"
+                )
+
+            data = self._extract_page(full_url, extractor)
+
+            if data is None:
+                logger.error(f"Could not find data for URL {full_url}.\n")
+                continue
+
+            with self._time_stage("frame", category, full_url):
+                city_dataframe = to_dataframe(data)
+
+            logger.info(
+                f"Found {city_dataframe.shape[0]} data rows "
+                + f"and {city_dataframe.shape[1]} features for city '{city}'.\n"
             )
-            values = [value.text.strip() for value in values]
 
-            # getting the levels value
-            if not levels_class_name is None:
-                logger.info("Getting the level data for all attributes.\n")
-                levels = table.find_all(
-                    "td",
-                    attrs={"class": levels_class_name},
-                )
-                levels = [level.text.strip() for level in levels]
+            city_dataframe["City"] = [city] * city_dataframe.shape[0]
+
+            if currency is None or len(self._converted_currencies()) == 0:
+                yield (city,), city_dataframe
+                continue
+
+            self._calibrate_city_currencies(category, city, data, extractor)
 
-                row_df = pd.DataFrame(
-                    {
-                        "Header": [header_text] * len(values),
-                        "Category": attributes_name,
-                        "Value": values,
-                        "Level": levels,
-                    }
+            with self._time_stage("frame", category, full_url):
+                city_dataframe = self._convert_city_dataframe(
+                    city, data, city_dataframe
                 )
-            else:
-                row_df = pd.DataFrame(
-                    {
-                        "Header": [header_text] * len(values),
-                        "Category": attributes_name,
-                        "Value": values,
-                    }
+
+            yield (city,), city_dataframe
+
+    def _convert_city_dataframe(
+        self,
+        city: str,
+        data: Dict[str, List[Any]],
+        city_dataframe: pd.DataFrame,
+    ) -> pd.DataFrame:
+        """
+        Adds the rows of the city data converted to each converted currency
+        (using the exchange rates already derived), below the rows in the base
+        currency. The 'Currency Code' column identifies the currency of the rows.
+
+        Args:
+            city (str): the formatted city's name.
+            data (Dict[str, List[Any]]): the values of each column
+                in the base currency.
+            city_dataframe (pd.DataFrame): the city data in the base currency.
+
+        Returns:
+            pd.DataFrame: the city data in all the currencies.
+        """
+        city_dataframe["Currency Code"] = [self.currency] * city_dataframe.shape[0]
+        dataframes = [city_dataframe]
+
+        for currency in self._converted_currencies():
+            if not currency in self.exchange_rates:
+                logger.warning(
+                    f"Skipping currency '{currency}' for city '{city}', "
+                    + "since its exchange rate is unknown.\n"
                 )
+                continue
 
-            city_dataframe = pd.concat(
-                [city_dataframe, row_df], axis=0, ignore_index=True
+            dataframe = to_dataframe(
+                convert_city_data(
+                    data,
+                    rate=self.exchange_rates[currency],
+                    template=self.currency_templates[currency],
+                )
             )
+            dataframe["City"] = [city] * dataframe.shape[0]
+            dataframe["Currency Code"] = [currency] * dataframe.shape[0]
+            dataframes.append(dataframe)
 
-        return city_dataframe
+        return concat_frames(dataframes)
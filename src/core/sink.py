@@ -0,0 +1,290 @@
+import os
+import shutil
+import uuid
+from pathlib import Path
+from typing import Any, Iterable, List, Optional, Set, Tuple
+from urllib.parse import quote
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+from loguru import logger
+
+from ..schema.sink import SinkSettings
+
+
+# the file extension and the `pyarrow.dataset` format name of each sink format
+SINK_FORMATS = {
+    "parquet": (".parquet", "parquet"),
+    "arrow": (".arrow", "ipc"),
+}
+
+
+def partition_column(
+    category: str,
+    mode: str,
+) -> str:
+    """
+    Gets the column used to partition the data of a category: the year
+    in 'country' mode, the country for the historical data and the city
+    in 'city' mode (the same values as the keys yielded by `iter_scrap`).
+
+    Args:
+        category (str): the category.
+        mode (str): the mode.
+
+    Returns:
+        str: the partition column name.
+    """
+    if mode == "city":
+        return "City"
+
+    if category == "historical-data":
+        return "Country"
+
+    return "Year"
+
+
+def to_table(
+    dataframe: pd.DataFrame,
+) -> pa.Table:
+    """
+    Converts a dataframe to an Arrow table. The object columns (the
+    scraped text) are always stored as strings, so all the files of a
+    category have the same schema even when a column is empty in a page.
+
+    Args:
+        dataframe (pd.DataFrame): the dataframe.
+
+    Returns:
+        pa.Table: the Arrow table.
+    """
+    schema = pa.Schema.from_pandas(dataframe, preserve_index=False)
+
+    for index, (column, dtype) in enumerate(dataframe.dtypes.items()):
+        if dtype == object:
+            schema = schema.set(index, pa.field(column, pa.string()))
+
+    return pa.Table.from_pandas(dataframe, schema=schema, preserve_index=False)
+
+
+class DatasetSink:
+    """
+    Writes the scraped data as a Parquet (or Arrow IPC) dataset, using the
+    Hive partitioning layout `category=.../mode=.../<column>=<value>/`, where
+    the partition column is the year in 'country' mode, the country for the
+    historical data and the city in 'city' mode. Each write creates a new
+    file, so the data of several runs can be appended to the same dataset,
+    and the readers only need to read the partitions they need.
+    """
+
+    def __init__(
+        self,
+        settings: SinkSettings,
+    ) -> None:
+        """
+        Args:
+            settings (SinkSettings): the dataset sink settings.
+        """
+        self.settings = settings
+        self.settings.path.mkdir(parents=True, exist_ok=True)
+        self.extension, self.format = SINK_FORMATS[self.settings.format]
+
+        # the partitions already cleared by this sink in 'overwrite' mode,
+        # so the pages written to the same partition don't clear each other
+        self._overwritten: Set[Path] = set()
+
+    def partition_path(
+        self,
+        category: str,
+        mode: str,
+        value: Optional[Any] = None,
+    ) -> Path:
+        """
+        Gets the folder of a partition (or of the whole category
+        and mode, if the partition value is empty).
+
+        Args:
+            category (str): the category.
+            mode (str): the mode.
+            value (Optional[Any], optional): the partition value.
+                Defaults to None.
+
+        Returns:
+            Path: the partition folder.
+        """
+        path = (
+            self.settings.path
+            / f"category={quote(category, safe='')}"
+            / f"mode={quote(mode, safe='')}"
+        )
+
+        if value is None:
+            return path
+
+        column = partition_column(category=category, mode=mode)
+        return path / f"{column}={quote(str(value), safe='')}"
+
+    def write(
+        self,
+        category: str,
+        mode: str,
+        key: Tuple[Any, ...],
+        dataframe: pd.DataFrame,
+    ) -> Optional[Path]:
+        """
+        Writes the data of a page (as yielded by `iter_scrap`) to its
+        partition. The partition column is stored in the folder name only.
+
+        Args:
+            category (str): the category.
+            mode (str): the mode.
+            key (Tuple[Any, ...]): the key that identifies the data
+                within the category (the partition value).
+            dataframe (pd.DataFrame): the extracted data.
+
+        Returns:
+            Optional[Path]: the written file or None if the data is empty.
+        """
+        if dataframe.empty:
+            logger.warning(
+                f"Skipping the empty '{category}' data of {key} in the dataset.\n"
+            )
+            return None
+
+        partition = self.partition_path(category=category, mode=mode, value=key[0])
+
+        if self.settings.mode == "overwrite" and not partition in self._overwritten:
+            shutil.rmtree(partition, ignore_errors=True)
+            self._overwritten.add(partition)
+
+        partition.mkdir(parents=True, exist_ok=True)
+
+        column = partition_column(category=category, mode=mode)
+        table = to_table(dataframe.drop(columns=[column], errors="ignore"))
+
+        # the file is renamed only when it's complete, so the readers never
+        # read a file that is still being written (the files starting
+        # with a dot are ignored by the readers)
+        path = partition / f"part-{uuid.uuid4().hex}{self.extension}"
+        temporary_path = partition / f".{path.name}.tmp"
+
+        if self.settings.format == "parquet":
+            pq.write_table(table, temporary_path)
+        else:
+            with pa.OSFile(str(temporary_path), "wb") as file:
+                with pa.ipc.new_file(file, table.schema) as writer:
+                    writer.write_table(table)
+
+        os.replace(temporary_path, path)
+        return path
+
+    def write_pages(
+        self,
+        pages: Iterable[Tuple[str, str, Tuple[Any, ...], pd.DataFrame]],
+    ) -> List[Path]:
+        """
+        Writes the data of each page as soon as it's extracted.
+
+        Args:
+            pages (Iterable[Tuple[str, str, Tuple[Any, ...], pd.DataFrame]]):
+                the pages data, as yielded by `iter_scrap`.
+
+        Returns:
+            List[Path]: the written files.
+        """
+        paths = []
+
+        for category, mode, key, dataframe in pages:
+            path = self.write(
+                category=category,
+                mode=mode,
+                key=key,
+                dataframe=dataframe,
+            )
+
+            if not path is None:
+                paths.append(path)
+
+        return paths
+
+    def write_dataframes(
+        self,
+        dataframes: List[Tuple[str, pd.DataFrame]],
+    ) -> List[Path]:
+        """
+        Writes the dataframes returned by `scrap`, splitting
+        each one by its partition column.
+
+        Args:
+            dataframes (List[Tuple[str, pd.DataFrame]]): the extracted data
+                with it respective name (e.g., 'crime_country').
+
+        Returns:
+            List[Path]: the written files.
+        """
+        paths = []
+
+        for data_name, dataframe in dataframes:
+            category, mode = data_name.rsplit("_", 1)
+            column = partition_column(category=category, mode=mode)
+
+            if dataframe.empty or not column in dataframe.columns:
+                logger.warning(f"Skipping '{data_name}' data in the dataset.\n")
+                continue
+
+            partitions = dataframe.groupby(column, sort=False, observed=True)
+
+            for value, partition_data in partitions:
+                path = self.write(
+                    category=category,
+                    mode=mode,
+                    key=(value,),
+                    dataframe=partition_data.reset_index(drop=True),
+                )
+
+                if not path is None:
+                    paths.append(path)
+
+        return paths
+
+    def read(
+        self,
+        category: str,
+        mode: str,
+        values: Optional[List[Any]] = None,
+    ) -> pd.DataFrame:
+        """
+        Reads the data of a category, reading only the files of the given
+        partitions. The partition column is added as the last column.
+
+        Args:
+            category (str): the category.
+            mode (str): the mode.
+            values (Optional[List[Any]], optional): the partition values
+                that will be read. Defaults to None (reads all the partitions).
+
+        Returns:
+            pd.DataFrame: the data.
+        """
+        path = self.partition_path(category=category, mode=mode)
+
+        if not path.exists():
+            return pd.DataFrame()
+
+        dataset = ds.dataset(
+            path,
+            format=self.format,
+            partitioning="hive",
+        )
+        column = partition_column(category=category, mode=mode)
+        filter_expression = None
+
+        if not values is None:
+            if pa.types.is_string(dataset.schema.field(column).type):
+                values = [str(value) for value in values]
+
+            filter_expression = ds.field(column).isin(values)
+
+        return dataset.to_table(filter=filter_expression).to_pandas()
@@ -1,10 +1,58 @@
-from copy import deepcopy
+import importlib
+import sys
 from pathlib import Path
-from typing import Dict, Optional, Type, Any, Tuple
+from types import ModuleType
+from typing import Callable, Dict, List, Optional, Any
 
-import yaml
-from pydantic import BaseModel, create_model
-from pydantic.fields import FieldInfo
+
+class LazyModule(ModuleType):
+    """
+    A placeholder for a module that is only imported when one of its
+    attributes is first used, so the heavy dependencies (e.g., pandas)
+    don't slow down importing the scraper. The import itself is done by
+    `importlib`, so it's safe when the first use happens in several threads.
+    """
+
+    def __getattr__(
+        self,
+        attribute: str,
+    ) -> Any:
+        """
+        Imports the module (only the first time) and gets one of its attributes.
+
+        Args:
+            attribute (str): the attribute name.
+
+        Returns:
+            Any: the attribute value.
+        """
+        module = importlib.import_module(self.__name__)
+
+        # the next attributes are found without going through this function
+        self.__dict__.update(module.__dict__)
+        return getattr(module, attribute)
+
+
+def lazy_import(name: str) -> ModuleType:
+    """
+    Gets a module that is only imported when it's first used
+    (see the `LazyModule` class).
+
+    Args:
+        name (str): the module name (e.g., 'pandas').
+
+    Returns:
+        ModuleType: the module (or its placeholder, if it isn't imported yet).
+    """
+    module = sys.modules.get(name)
+
+    if not module is None:
+        return module
+
+    return LazyModule(name)
+
+
+yaml = lazy_import("yaml")
 
 
 REGIONS_MAPPING = {
@@ -15,6 +63,260 @@ REGIONS_MAPPING = {
     "Oceania": "009",
 }
 
+# the countries of each region, following the same regions (UN M49 geographic
+# regions) used by Numbeo to filter the rankings by region
+REGIONS_COUNTRIES = {
+    "Africa": [
+        "Algeria",
+        "Angola",
+        "Benin",
+        "Botswana",
+        "Burkina Faso",
+        "Burundi",
+        "Cameroon",
+        "Cape Verde",
+        "Central African Republic",
+        "Chad",
+        "Comoros",
+        "Congo",
+        "Djibouti",
+        "Egypt",
+        "Equatorial Guinea",
+        "Eritrea",
+        "Ethiopia",
+        "French Southern Territories",
+        "Gabon",
+        "Gambia",
+        "Ghana",
+        "Guinea",
+        "Guinea-Bissau",
+        "Ivory Coast",
+        "Kenya",
+        "Lesotho",
+        "Liberia",
+        "Libya",
+        "Madagascar",
+        "Malawi",
+        "Mali",
+        "Mauritania",
+        "Mauritius",
+        "Morocco",
+        "Mozambique",
+        "Namibia",
+        "Niger",
+        "Nigeria",
+        "Republic Of Congo",
+        "Reunion",
+        "Rwanda",
+        "Saint Helena",
+        "Sao Tome And Principe",
+        "Senegal",
+        "Seychelles",
+        "Sierra Leone",
+        "Somalia",
+        "South Africa",
+        "South Sudan",
+        "Sudan",
+        "Swaziland",
+        "Tanzania",
+        "Togo",
+        "Tunisia",
+        "Uganda",
+        "Western Sahara",
+        "Zambia",
+        "Zimbabwe",
+    ],
+    "America": [
+        "Anguilla",
+        "Antigua And Barbuda",
+        "Argentina",
+        "Aruba",
+        "Bahamas",
+        "Barbados",
+        "Belize",
+        "Bermuda",
+        "Bolivia",
+        "Bonaire",
+        "Brazil",
+        "British Virgin Islands",
+        "Canada",
+        "Cayman Islands",
+        "Chile",
+        "Colombia",
+        "Costa Rica",
+        "Cuba",
+        "Curacao",
+        "Dominica",
+        "Dominican Republic",
+        "Ecuador",
+        "El Salvador",
+        "Falkland Islands",
+        "French Guiana",
+        "Greenland",
+        "Grenada",
+        "Guadeloupe",
+        "Guatemala",
+        "Guyana",
+        "Haiti",
+        "Honduras",
+        "Jamaica",
+        "Martinique",
+        "Mexico",
+        "Montserrat",
+        "Nicaragua",
+        "Panama",
+        "Paraguay",
+        "Peru",
+        "Puerto Rico",
+        "Saint Kitts And Nevis",
+        "Saint Lucia",
+        "Saint Vincent And The Grenadines",
+        "Sint Maarten",
+        "Suriname",
+        "Trinidad And Tobago",
+        "Turks And Caicos Islands",
+        "United States",
+        "Uruguay",
+        "Us Virgin Islands",
+        "Venezuela",
+    ],
+    "Asia": [
+        "Afghanistan",
+        "Armenia",
+        "Azerbaijan",
+        "Bahrain",
+        "Bangladesh",
+        "Bhutan",
+        "Brunei",
+        "Cambodia",
+        "China",
+        "Cyprus",
+        "Georgia",
+        "Hong Kong",
+        "India",
+        "Indonesia",
+        "Iran",
+        "Iraq",
+        "Israel",
+        "Japan",
+        "Jordan",
+        "Kazakhstan",
+        "Kuwait",
+        "Kyrgyzstan",
+        "Laos",
+        "Lebanon",
+        "Macao",
+        "Malaysia",
+        "Maldives",
+        "Mongolia",
+        "Myanmar",
+        "Nepal",
+        "North Korea",
+        "Oman",
+        "Pakistan",
+        "Palestine",
+        "Philippines",
+        "Qatar",
+        "Saudi Arabia",
+        "Singapore",
+        "South Korea",
+        "Sri Lanka",
+        "Syria",
+        "Taiwan",
+        "Tajikistan",
+        "Thailand",
+        "Timor-Leste",
+        "Turkey",
+        "Turkmenistan",
+        "United Arab Emirates",
+        "Uzbekistan",
+        "Vietnam",
+        "Yemen",
+    ],
+    "Europe": [
+        "Aland Islands",
+        "Albania",
+        "Alderney",
+        "Andorra",
+        "Austria",
+        "Belarus",
+        "Belgium",
+        "Bosnia And Herzegovina",
+        "Bulgaria",
+        "Croatia",
+        "Czech Republic",
+        "Denmark",
+        "Estonia",
+        "Faroe Islands",
+        "Finland",
+        "France",
+        "Germany",
+        "Gibraltar",
+        "Greece",
+        "Guernsey",
+        "Hungary",
+        "Iceland",
+        "Ireland",
+        "Isle Of Man",
+        "Italy",
+        "Jersey",
+        "Kosovo (Disputed Territory)",
+        "Latvia",
+        "Liechtenstein",
+        "Lithuania",
+        "Luxembourg",
+        "Malta",
+        "Moldova",
+        "Monaco",
+        "Montenegro",
+        "Netherlands",
+        "North Macedonia",
+        "Norway",
+        "Poland",
+        "Portugal",
+        "Romania",
+        "Russia",
+        "San Marino",
+        "Serbia",
+        "Slovakia",
+        "Slovenia",
+        "Spain",
+        "Sweden",
+        "Switzerland",
+        "Ukraine",
+        "United Kingdom",
+        "Vatican City",
+    ],
+    "Oceania": [
+        "American Samoa",
+        "Australia",
+        "Cook Islands",
+        "Fiji",
+        "French Polynesia",
+        "Guam",
+        "Marshall Islands",
+        "Micronesia",
+        "Nauru",
+        "New Caledonia",
+        "New Zealand",
+        "Norfolk Island",
+        "Northern Mariana Islands",
+        "Palau",
+        "Papua New Guinea",
+        "Samoa",
+        "Solomon Islands",
+        "Tonga",
+        "Tuvalu",
+        "Vanuatu",
+    ],
+}
+
+COUNTRIES_REGIONS_MAPPING = {
+    country: region
+    for region, countries in REGIONS_COUNTRIES.items()
+    for country in countries
+}
+
 ITENS_MAPPING = {
     "Price per Square Meter to Buy Apartment Outside of Centre": 101,
     "Price per Square Meter to Buy Apartment in City Centre": 100,
@@ -74,33 +376,43 @@ ITENS_MAPPING = {
 }
 
 
-def partial_model(model: Type[BaseModel]):
+def format_city(city: str) -> str:
     """
-    Make some fields optional.
+    Formats the city's name the same way it's used in the page URL.
 
     Args:
-        model (Type[BaseModel]): the Pydantic's base model class.
+        city (str): the city's name.
+
+    Returns:
+        str: the formatted city's name.
     """
+    return city.title().replace(" ", "-")
 
-    def make_field_optional(
-        field: FieldInfo, default: Any = None
-    ) -> Tuple[Any, FieldInfo]:
-        new = deepcopy(field)
-        new.default = default
-        new.annotation = Optional[field.annotation]  # type: ignore
-        return new.annotation, new
-
-    return create_model(
-        f"Partial{model.__name__}",
-        __base__=model,
-        __module__=model.__module__,
-        **{
-            field_name: make_field_optional(field_info)
-            for field_name, field_info in model.model_fields.items()
-            if field_name
-            in ["regions", "currency", "countries", "historical_items", "cities"]
-        },
-    )
+
+def remove_duplicates(
+    values: List[Any],
+    key: Optional[Callable[[Any], Any]] = None,
+) -> List[Any]:
+    """
+    Removes the duplicated values of a list, keeping the original order.
+
+    Args:
+        values (List[Any]): the list of values.
+        key (Optional[Callable[[Any], Any]], optional): function used to
+            compare the values. Defaults to None (compares the values).
+
+    Returns:
+        List[Any]: the list without duplicated values.
+    """
+    if key is None:
+        key = lambda value: value
+
+    unique_values = {}
+
+    for value in values:
+        unique_values.setdefault(key(value), value)
+
+    return list(unique_values.values())
 
 
 def read_yaml_credentials_file(file_path: Path, file_name: str) -> Dict:
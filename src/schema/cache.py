@@ -0,0 +1,21 @@
+from pathlib import Path
+from typing import Literal
+
+from pydantic import BaseModel, Field, PositiveInt
+
+
+VALID_CACHE_POLICIES = Literal["use", "refresh", "offline"]
+
+
+class CacheSettings(BaseModel):
+    """
+    HTTP response cache settings schema.
+
+    Args:
+        BaseModel (pydantic.BaseModel): Pydantic base model instance.
+    """
+
+    path: Path = Path.home() / ".cache" / "numbeo-scraper"
+    ttl: PositiveInt = 86400  # in seconds
+    max_size: PositiveInt = 512 * 1024 * 1024  # in bytes
+    compression_level: int = Field(default=6, ge=0, le=9)
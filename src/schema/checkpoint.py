@@ -0,0 +1,18 @@
+from pathlib import Path
+from typing import Literal
+
+from pydantic import BaseModel
+
+
+VALID_CHECKPOINT_POLICIES = Literal["resume", "failed", "restart"]
+
+
+class CheckpointSettings(BaseModel):
+    """
+    Checkpoint journal settings schema.
+
+    Args:
+        BaseModel (pydantic.BaseModel): Pydantic base model instance.
+    """
+
+    path: Path = Path.home() / ".cache" / "numbeo-scraper"
@@ -2,8 +2,6 @@ from typing import List, Literal, Union, Optional
 
 from pydantic import BaseModel
 
-from ..core.utils import partial_model
-
 
 VALID_YEARS = Literal[
     2012,
@@ -46,7 +44,7 @@ VALID_CATEGORIES = Literal[
     "historical-data",
 ]
 
-VALID_MODES = Literal["country", "city"]
+VALID_MODES = Literal["country", "city", "city-rankings"]
 
 VALID_REGIONS = Literal["Africa", "America", "Asia", "Europe", "Oceania"]
 
@@ -504,17 +502,19 @@ VALID_ITEMS = Literal[
 ]
 
 
-@partial_model
 class Input(BaseModel):
     """
     Input schema.
+
+    The optional fields are declared as optional directly, so the validators
+    of the large `Literal` unions are only built once.
     """
 
     categories: Union[VALID_CATEGORIES, List[VALID_CATEGORIES]]
     mode: VALID_MODES
     years: Union[VALID_YEARS, List[VALID_YEARS]]
-    regions: Union[VALID_REGIONS, List[VALID_REGIONS]]
-    currency: VALID_CURRENCIES
-    countries: Union[VALID_COUNTRIES, List[VALID_COUNTRIES]]
-    historical_items: Union[VALID_ITEMS, List[VALID_ITEMS]]
-    cities: Union[str, List[str]]
+    regions: Optional[Union[VALID_REGIONS, List[VALID_REGIONS]]] = None
+    currency: Optional[Union[VALID_CURRENCIES, List[VALID_CURRENCIES]]] = None
+    countries: Optional[Union[VALID_COUNTRIES, List[VALID_COUNTRIES]]] = None
+    historical_items: Optional[Union[VALID_ITEMS, List[VALID_ITEMS]]] = None
+    cities: Optional[Union[str, List[str]]] = None
@@ -1,7 +1,11 @@
-from pathlib import Path
+from typing import Literal, Optional
 
-from loguru import logger
-from pydantic import BaseModel, DirectoryPath
+from pydantic import BaseModel, DirectoryPath, PositiveInt
+
+
+VALID_LOG_LEVELS = Literal[
+    "TRACE", "DEBUG", "INFO", "SUCCESS", "WARNING", "ERROR", "CRITICAL"
+]
 
 
 class LoggingSettings(BaseModel):
@@ -11,21 +15,6 @@ class LoggingSettings(BaseModel):
         BaseModel (pydantic.BaseModel): Pydantic base model instance.
     """
 
-    LOG_LEVEL: str
-    LOG_PATH: DirectoryPath
-
-
-log_settings = LoggingSettings(
-    LOG_LEVEL="INFO",
-    LOG_PATH=Path.cwd(),
-)
-logger.add(
-    Path.joinpath(log_settings.LOG_PATH, "loguru.log"),
-    rotation="1 day",
-    retention="7 days",
-    compression="zip",
-    backtrace=True,
-    diagnose=True,
-    watch=True,
-    mode="w",
-)
+    LOG_LEVEL: VALID_LOG_LEVELS = "INFO"
+    LOG_PATH: Optional[DirectoryPath] = None  # None logs to the standard error
+    LOG_SAMPLING: PositiveInt = 1  # keeps one in every N records below WARNING
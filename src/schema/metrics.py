@@ -0,0 +1,26 @@
+from pathlib import Path
+from typing import List, Literal, Optional
+
+from pydantic import BaseModel, PositiveFloat, PositiveInt
+
+
+VALID_METRICS_FORMATS = Literal["prometheus", "json"]
+
+# the upper bounds of the histogram buckets
+DEFAULT_BUCKETS = [0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0]
+DEFAULT_SIZE_BUCKETS = [2**10, 2**12, 2**14, 2**16, 2**18, 2**20, 2**22]
+
+
+class MetricsSettings(BaseModel):
+    """
+    Per-stage timing metrics settings schema.
+
+    Args:
+        BaseModel (pydantic.BaseModel): Pydantic base model instance.
+    """
+
+    buckets: List[PositiveFloat] = DEFAULT_BUCKETS  # in seconds
+    size_buckets: List[PositiveInt] = DEFAULT_SIZE_BUCKETS  # in bytes
+    keep_pages: bool = True  # keeps the metrics of each URL
+    path: Optional[Path] = None  # None doesn't write the metrics after each run
+    format: VALID_METRICS_FORMATS = "prometheus"
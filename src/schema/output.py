@@ -0,0 +1,19 @@
+from typing import Literal
+
+from pydantic import BaseModel
+
+
+VALID_FLOAT_DTYPES = Literal["float32", "float64"]
+
+
+class OutputSettings(BaseModel):
+    """
+    Output dataframes settings schema.
+
+    Args:
+        BaseModel (pydantic.BaseModel): Pydantic base model instance.
+    """
+
+    typed: bool = False  # converts the values to numbers (otherwise strings)
+    float_dtype: VALID_FLOAT_DTYPES = "float64"
+    categorical: bool = False  # stores the label columns as categoricals
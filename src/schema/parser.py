@@ -0,0 +1,19 @@
+from typing import Literal
+
+from pydantic import BaseModel, PositiveInt
+
+
+VALID_PARSER_BACKENDS = Literal["html.parser", "lxml"]
+
+
+class ParserSettings(BaseModel):
+    """
+    HTML parser settings schema.
+
+    Args:
+        BaseModel (pydantic.BaseModel): Pydantic base model instance.
+    """
+
+    backend: VALID_PARSER_BACKENDS = "html.parser"  # 'lxml' is faster
+    parse_only: bool = True  # only builds the parts of the page that are used
+    workers: PositiveInt = 1  # processes used to extract the data (pipelined mode)
@@ -0,0 +1,20 @@
+from pydantic import BaseModel, Field, NonNegativeInt, PositiveFloat, PositiveInt
+
+
+class RateLimitSettings(BaseModel):
+    """
+    Rate limiter and retry settings schema.
+
+    Args:
+        BaseModel (pydantic.BaseModel): Pydantic base model instance.
+    """
+
+    rate: PositiveFloat = 2.0  # initial requests per second
+    min_rate: PositiveFloat = 0.2
+    max_rate: PositiveFloat = 20.0
+    burst: PositiveInt = 5
+    rate_increase: PositiveFloat = 0.1  # added after each successful request
+    rate_decrease: float = Field(default=0.5, gt=0, lt=1)  # multiplied when throttled
+    max_retries: NonNegativeInt = 5
+    backoff_factor: PositiveFloat = 1.0  # in seconds
+    max_backoff: PositiveFloat = 60.0  # in seconds
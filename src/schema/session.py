@@ -0,0 +1,20 @@
+from typing import Dict
+
+from pydantic import BaseModel, PositiveInt
+
+
+class SessionSettings(BaseModel):
+    """
+    HTTP session settings schema.
+
+    Args:
+        BaseModel (pydantic.BaseModel): Pydantic base model instance.
+    """
+
+    pool_connections: PositiveInt = 10
+    pool_maxsize: PositiveInt = 10
+    keep_alive: bool = True
+    compression: bool = True
+    timeout: PositiveInt = 300
+    headers: Dict[str, str] = {}  # sent on top of the HTTP client defaults
+    max_concurrency: PositiveInt = 1
@@ -0,0 +1,21 @@
+from pathlib import Path
+from typing import Literal
+
+from pydantic import BaseModel
+
+
+VALID_SINK_FORMATS = Literal["parquet", "arrow"]
+VALID_SINK_MODES = Literal["append", "overwrite"]
+
+
+class SinkSettings(BaseModel):
+    """
+    Dataset sink (Parquet/Arrow output) settings schema.
+
+    Args:
+        BaseModel (pydantic.BaseModel): Pydantic base model instance.
+    """
+
+    path: Path
+    format: VALID_SINK_FORMATS = "parquet"
+    mode: VALID_SINK_MODES = "append"
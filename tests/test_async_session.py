@@ -0,0 +1,97 @@
+import asyncio
+import tempfile
+import unittest
+from pathlib import Path
+
+from benchmarks.offline import load_fixtures
+from benchmarks.server import StandInServer
+from src.schema.cache import CacheSettings
+from src.schema.input import Input
+from src.core.scraper import NumbeoScraper
+
+
+class TestAsyncSession(unittest.TestCase):
+    """
+    Unittest case to test the pooled asynchronous HTTP session.
+    """
+
+    def test(self):
+        """
+        Test the asynchronous session creation, reuse and closing.
+        """
+        config = Input(
+            categories="crime",
+            years=2019,
+            mode="city",
+            cities="Rome",
+        )
+
+        async def run():
+            async with NumbeoScraper(config=config) as scraper:
+                session = await scraper._get_async_session()
+
+                assert session is await scraper._get_async_session()
+                assert session.headers["Accept-Encoding"] == "gzip, deflate"
+
+            assert session.closed
+            assert scraper.async_session is None
+
+        asyncio.run(run())
+
+        # the session created by another event loop is closed and replaced
+        scraper = NumbeoScraper(config=config)
+        session = asyncio.run(scraper._get_async_session())
+
+        async def replace():
+            return await scraper._get_async_session()
+
+        new_session = asyncio.run(replace())
+
+        assert session.closed
+        assert not new_session is session
+
+        asyncio.run(scraper.aclose())
+
+        # the session is closed after `scrap_async` when it isn't used
+        # with `async with`
+        with StandInServer(pages=load_fixtures()) as server:
+            scraper = NumbeoScraper(
+                config=Input(
+                    categories="crime",
+                    years=2024,
+                    mode="city",
+                    cities="Amsterdam",
+                ),
+                base_url=server.url,
+            )
+            dataframes = asyncio.run(scraper.scrap_async())
+            scraper.close()
+
+        assert len(dataframes) == 1
+        assert scraper.async_session is None
+
+        # the response cache is used (in worker threads) by `scrap_async`
+        with tempfile.TemporaryDirectory() as folder:
+            with StandInServer(pages=load_fixtures()) as server:
+                for cache_policy in ["use", "offline"]:
+                    with NumbeoScraper(
+                        config=Input(
+                            categories="crime",
+                            years=2024,
+                            mode="city",
+                            cities="Amsterdam",
+                        ),
+                        cache_settings=CacheSettings(path=Path(folder)),
+                        base_url=server.url,
+                    ) as scraper:
+                        cached_dataframes = asyncio.run(
+                            scraper.scrap_async(cache_policy=cache_policy)
+                        )
+
+                    assert cached_dataframes[0][1].equals(dataframes[0][1])
+
+            assert server.stats["200"] == 1
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,55 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from src.core.cache import ResponseCache
+from src.schema.cache import CacheSettings
+
+
+class TestCache(unittest.TestCase):
+    """
+    Unittest case to test the on-disk response cache.
+    """
+
+    def test(self):
+        """
+        Test the cache keys, storage and LRU eviction.
+        """
+        with tempfile.TemporaryDirectory() as folder:
+            cache = ResponseCache(
+                CacheSettings(
+                    path=Path(folder),
+                    ttl=60,
+                    max_size=1200,
+                    compression_level=0,
+                )
+            )
+
+            url = "https://www.numbeo.com/crime/rankings_by_country.jsp?title=2019&region=150"
+            same_url = "HTTPS://WWW.NUMBEO.COM/crime/rankings_by_country.jsp?region=150&title=2019"
+
+            assert cache.make_key(url) == cache.make_key(same_url)
+            assert cache.get(url) is None
+
+            cache.put(url, "a" * 500, etag='"abc"')
+            cached_response = cache.get(same_url)
+
+            assert cached_response.text == "a" * 500
+            assert cached_response.etag == '"abc"'
+            assert cache.is_fresh(cached_response)
+
+            # the first page is the most recently used one,
+            # so the second page is evicted
+            cache.put(f"{url}&x=1", "b" * 500)
+            cache.get(url)
+            cache.put(f"{url}&x=2", "c" * 500)
+
+            assert not cache.get(url) is None
+            assert cache.get(f"{url}&x=1") is None
+            assert not cache.get(f"{url}&x=2") is None
+
+            cache.close()
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,80 @@
+import datetime
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+from src.core.cache import (
+    ResponseCache,
+    is_closed_period,
+    is_closed_period_url,
+    period_closed_at,
+)
+from src.schema.cache import CacheSettings
+
+
+class TestCachePeriods(unittest.TestCase):
+    """
+    Unittest case to test the caching policy of closed periods.
+    """
+
+    def test(self):
+        """
+        Test that only the ranking pages of closed periods never expire.
+        """
+        base_url = "https://www.numbeo.com/crime/rankings_by_country.jsp"
+        current = str(datetime.date.today().year + 1)
+
+        # the open period is derived from the current date
+        assert is_closed_period("2024", datetime.date(2024, 8, 1))
+        assert not is_closed_period("2024-mid", datetime.date(2024, 8, 1))
+        assert not is_closed_period("2024", datetime.date(2024, 7, 15))
+        assert is_closed_period("2023-mid", datetime.date(2024, 2, 1))
+        assert not is_closed_period("2023-mid", datetime.date(2024, 1, 15))
+        assert not is_closed_period("latest", datetime.date(2024, 8, 1))
+
+        assert is_closed_period_url(f"{base_url}?title=2015")
+        assert is_closed_period_url(f"{base_url}?title=2019-mid&region=150")
+        assert not is_closed_period_url(f"{base_url}?title={current}")
+        assert not is_closed_period_url("https://www.numbeo.com/crime/in/Rome")
+
+        with tempfile.TemporaryDirectory() as folder:
+            cache = ResponseCache(CacheSettings(path=Path(folder), ttl=1))
+
+            cache.put(f"{base_url}?title=2015", "closed")
+            cache.put(f"{base_url}?title={current}", "current")
+            time.sleep(1.1)
+
+            assert cache.is_fresh(cache.get(f"{base_url}?title=2015"))
+            assert not cache.is_fresh(cache.get(f"{base_url}?title={current}"))
+
+            cache.touch(f"{base_url}?title={current}")
+
+            assert cache.is_fresh(cache.get(f"{base_url}?title={current}"))
+
+            cache.close()
+
+        # a page fetched while its period was open is revalidated once
+        # after the period is closed, and never again after that
+        with tempfile.TemporaryDirectory() as folder:
+            cache = ResponseCache(CacheSettings(path=Path(folder), ttl=3600))
+            url = f"{base_url}?title={current}-mid"
+            closed_at = period_closed_at(url)
+
+            cache.put(url, "open")
+            response = cache.get(url)
+
+            assert cache.is_fresh(response)
+            assert cache.is_cached(url)
+            assert not cache.is_fresh(response, now=closed_at + 1)
+            assert not cache.is_cached(url, now=closed_at + 1)
+
+            revalidated = response._replace(fetched_at=closed_at + 1)
+
+            assert cache.is_fresh(revalidated, now=closed_at + 10 * 3600 * 24 * 365)
+
+            cache.close()
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,54 @@
+import unittest
+
+import pandas as pd
+
+from src.core.convert import SharedCategories
+
+
+class TestCategoricalOutput(unittest.TestCase):
+    """
+    Unittest case to test the label columns shared categories.
+    """
+
+    def test(self):
+        """
+        Test that the pages share the same categories.
+        """
+        shared_categories = SharedCategories()
+        first_page = shared_categories.encode(
+            pd.DataFrame(
+                {
+                    "Header": ["Restaurants", "Markets"],
+                    "Category": ["Meal", "Milk"],
+                    "Value": ["15.00", "1.20"],
+                    "City": ["Rome", "Rome"],
+                }
+            )
+        )
+        second_page = shared_categories.encode(
+            pd.DataFrame(
+                {
+                    "Header": ["Restaurants", "Restaurants"],
+                    "Category": ["Meal", None],
+                    "Value": ["18.00", "2.10"],
+                    "City": ["Milan", "Milan"],
+                }
+            )
+        )
+
+        assert first_page["Value"].dtype == object
+        assert first_page["City"].cat.categories.tolist() == ["Rome"]
+        assert second_page["City"].cat.categories.tolist() == ["Rome", "Milan"]
+        assert second_page["Category"].isna().tolist() == [False, True]
+
+        first_page = shared_categories.align(first_page)
+        dataframe = pd.concat([first_page, second_page], ignore_index=True)
+
+        assert first_page["City"].cat.categories is second_page["City"].cat.categories
+        assert isinstance(dataframe["Header"].dtype, pd.CategoricalDtype)
+        assert dataframe["City"].tolist() == ["Rome", "Rome", "Milan", "Milan"]
+        assert dataframe["Header"].cat.codes.tolist() == [0, 1, 0, 0]
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
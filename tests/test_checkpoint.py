@@ -0,0 +1,84 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from src.schema.cache import CacheSettings
+from src.schema.checkpoint import CheckpointSettings
+from src.schema.input import Input
+from src.core.checkpoint import CheckpointJournal, make_run_id
+from src.core.scraper import BASE_URL, NumbeoScraper
+
+
+class TestCheckpoint(unittest.TestCase):
+    """
+    Unittest case to test resuming a run from the checkpoint journal.
+    """
+
+    def test(self):
+        """
+        Test that the completed pages are read from the journal.
+        """
+        full_url = "https://www.numbeo.com/crime/rankings_by_country.jsp?title=2019"
+        data = {
+            "Rank": ["", ""],
+            "Country": ["Brazil", "Italy"],
+            "Crime Index": ["67.9", "44.8"],
+        }
+        config = Input(
+            categories="crime",
+            years=2019,
+            mode="country",
+            regions="Europe",
+        )
+        run_id = make_run_id(config, BASE_URL)
+
+        assert run_id == make_run_id(config.model_copy(), BASE_URL)
+        assert run_id != make_run_id(config, "http://127.0.0.1:8000")
+
+        with tempfile.TemporaryDirectory() as folder:
+            checkpoint_settings = CheckpointSettings(path=Path(folder))
+            journal = CheckpointJournal(checkpoint_settings)
+            journal.record_failure(run_id, full_url)
+
+            assert journal.status(run_id, full_url) == "failed"
+
+            journal.record_done(run_id, full_url, data)
+
+            assert journal.get(run_id, full_url).data == data
+            assert journal.count(run_id) == {"done": 1}
+            journal.close()
+
+            # the page is never requested, since it was completed (and
+            # when the journal is cleared, the page isn't in the cache)
+            with NumbeoScraper(
+                config=config,
+                cache_settings=CacheSettings(path=Path(folder)),
+                checkpoint_settings=checkpoint_settings,
+            ) as scraper:
+                dataframes = scraper.scrap(cache_policy="offline")
+
+                assert scraper.journal.is_finished(run_id)
+
+                # the run finished, so running it again doesn't reuse its data
+                scraper.scrap(cache_policy="offline")
+
+                assert scraper.journal.count(run_id) == {"failed": 1}
+
+                with self.assertRaises(AssertionError):
+                    list(scraper.iter_scrap(checkpoint_policy="invalid"))
+
+                scraper.scrap(cache_policy="offline", checkpoint_policy="restart")
+
+                assert scraper.journal.count(run_id) == {"failed": 1}
+
+        dataframe = dataframes[0][1]
+
+        assert dataframe["Country"].tolist() == ["Italy"]
+        assert dataframe["Region"].tolist() == ["Europe"]
+
+        with self.assertRaises(AssertionError):
+            list(NumbeoScraper(config=config).iter_scrap(checkpoint_policy="failed"))
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,81 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from src.schema.cache import CacheSettings
+from src.schema.input import Input
+from src.core.scraper import NumbeoScraper
+
+
+class TestCityRankings(unittest.TestCase):
+    """
+    Unittest case to test the 'city-rankings' mode (using only cached pages).
+    """
+
+    def test(self):
+        """
+        Test that a single page is used per year and that the cities are kept.
+        """
+        page = (
+            "<table id='t2'><thead><tr><th>Rank</th><th>City</th>"
+            + "<th>Crime Index</th><th>Safety Index</th></tr></thead><tbody>"
+            + "<tr><td></td><td>Sao Paulo, Brazil</td><td>67.9</td><td>32.1</td></tr>"
+            + "<tr><td></td><td>Rome, Italy</td><td>44.8</td><td>55.2</td></tr>"
+            + "<tr><td></td><td>Rome, GA, United States</td><td>40.2</td>"
+            + "<td>59.8</td></tr>"
+            + "<tr><td></td><td>Amsterdam, Netherlands</td><td>33.1</td>"
+            + "<td>66.9</td></tr>"
+            + "</tbody></table>"
+        )
+        config = Input(
+            categories="crime",
+            years=[2019, "2020-mid"],
+            mode="city-rankings",
+            cities=["sao paulo", "Rome, Italy"],
+        )
+
+        with tempfile.TemporaryDirectory() as folder:
+            cache_settings = CacheSettings(path=Path(folder))
+
+            with NumbeoScraper(config=config, cache_settings=cache_settings) as scraper:
+                request_plan = scraper.plan()
+
+                for full_url in request_plan.urls:
+                    scraper._get_cache().put(full_url, page)
+
+                dataframes = scraper.scrap(cache_policy="offline")
+
+        assert request_plan.urls == [
+            "https://www.numbeo.com/crime/rankings.jsp?title=2019",
+            "https://www.numbeo.com/crime/rankings.jsp?title=2020-mid",
+        ]
+
+        data_name, dataframe = dataframes[0]
+
+        assert data_name == "crime_city-rankings"
+        assert dataframe.columns.tolist() == [
+            "Rank",
+            "City",
+            "Country",
+            "Crime Index",
+            "Safety Index",
+            "Year",
+        ]
+        assert dataframe["City"].tolist() == ["Sao Paulo", "Rome"] * 2
+        assert dataframe["Country"].tolist() == ["Brazil", "Italy"] * 2
+        assert dataframe["Rank"].tolist() == ["1", "2"] * 2
+        assert dataframe["Year"].tolist() == [2019, 2019, "2020-mid", "2020-mid"]
+
+        with self.assertRaises(AssertionError):
+            NumbeoScraper(
+                config=Input(
+                    categories="historical-data",
+                    years=2019,
+                    mode="city-rankings",
+                    historical_items="Banana (1kg)",
+                )
+            )
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
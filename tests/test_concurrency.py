@@ -0,0 +1,76 @@
+import tempfile
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from src.schema.cache import CacheSettings
+from src.schema.checkpoint import CheckpointSettings
+from src.schema.input import Input
+from src.schema.session import SessionSettings
+from src.core.scraper import NumbeoScraper
+
+
+class TestConcurrency(unittest.TestCase):
+    """
+    Unittest case to test the pages requested by the concurrent mode.
+    """
+
+    def test(self):
+        """
+        Test the pages URL implied by the config.
+        """
+        config = Input(
+            categories=["cost-of-living", "crime"],
+            years=2019,
+            mode="city",
+            currency="EUR",
+            cities=["Amsterdam", "sao paulo"],
+        )
+
+        scraper = NumbeoScraper(
+            config=config,
+            session_settings=SessionSettings(max_concurrency=4),
+        )
+
+        urls = [unit.url for unit in scraper._plan_units()]
+
+        assert urls == [
+            "https://www.numbeo.com/cost-of-living/in/Amsterdam?displayCurrency=EUR",
+            "https://www.numbeo.com/cost-of-living/in/Sao-Paulo?displayCurrency=EUR",
+            "https://www.numbeo.com/crime/in/Amsterdam",
+            "https://www.numbeo.com/crime/in/Sao-Paulo",
+        ]
+        assert scraper._get_session().get_adapter(urls[0])._pool_maxsize == 10
+
+        # the threads of the first concurrent batch share the same resources
+        with tempfile.TemporaryDirectory() as folder:
+            scraper = NumbeoScraper(
+                config=config,
+                cache_settings=CacheSettings(path=Path(folder) / "cache"),
+                checkpoint_settings=CheckpointSettings(
+                    path=Path(folder) / "checkpoint"
+                ),
+            )
+            barrier = threading.Barrier(8)
+
+            def get_resources(_):
+                barrier.wait()
+                return (
+                    scraper._get_session(),
+                    scraper._get_cache(),
+                    scraper._get_journal(),
+                )
+
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                resources = list(executor.map(get_resources, range(8)))
+
+            assert len(set(map(id, [session for session, _, _ in resources]))) == 1
+            assert len(set(map(id, [cache for _, cache, _ in resources]))) == 1
+            assert len(set(map(id, [journal for _, _, journal in resources]))) == 1
+
+            scraper.close()
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
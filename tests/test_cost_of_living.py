@@ -25,6 +25,7 @@ class TestCostOfLiving(unittest.TestCase):
             "Restaurant Price Index",
             "Local Purchasing Power Index",
             "Year",
+            "Region",
         ]
 
         config = Input(
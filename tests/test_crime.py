@@ -21,6 +21,7 @@ class TestCostOfLiving(unittest.TestCase):
             "Crime Index",
             "Safety Index",
             "Year",
+            "Region",
         ]
 
         config = Input(
@@ -0,0 +1,78 @@
+import unittest
+
+import pandas as pd
+
+from src.core.currency import (
+    convert_city_data,
+    convert_historical_records,
+    currency_template,
+    exchange_rate,
+    yearly_exchange_rates,
+)
+
+
+class TestCurrency(unittest.TestCase):
+    """
+    Unittest case to test the local conversion to other currencies.
+    """
+
+    def test(self):
+        """
+        Test that the exchange rates are derived from the same values shown in
+        two currencies and that only the amounts of money are converted.
+        """
+        categories = ["Meal", "Cappuccino", "Unemployment"]
+        base_means = pd.Series(["10.00\xa0€", "2.00\xa0€", "?"], index=categories)
+        means = pd.Series(["11.00\xa0$", "2.20\xa0$", "?"], index=categories)
+
+        rate = exchange_rate(base_means, means)
+        template = currency_template(means)
+
+        assert round(rate, 6) == 1.1
+        assert template == "{}\xa0$"
+        assert exchange_rate(base_means, pd.Series(["?"], index=["Meal"])) is None
+        assert currency_template(pd.Series(["?", "12.5"])) is None
+
+        converted_data = convert_city_data(
+            {
+                "Header": ["Restaurants", "Restaurants", "Salaries"],
+                "Category": ["Meal", "Cappuccino", "Mortgage Interest Rate"],
+                "Mean": ["1,000.00\xa0€", "?", "3.50"],
+                "Range": ["900.00-1,500.00", "", "3.00-4.00"],
+            },
+            rate=rate,
+            template=template,
+        )
+
+        assert converted_data["Category"][0] == "Meal"
+        assert converted_data["Mean"] == ["1,100.00\xa0$", "?", "3.50"]
+        assert converted_data["Range"] == ["990.00-1,650.00", "", "3.00-4.00"]
+
+        # the exchange rate changes from year to year
+        rates = yearly_exchange_rates(
+            {"Year": ["2019", "2020"], "Banana (1kg)": ["2.00", "4.00"]},
+            {"Year": ["2019", "2020"], "Banana (1kg)": ["12.00", "20.00"]},
+        )
+
+        assert rates == {2019: 6.0, 2020: 5.0}
+
+        converted_records = convert_historical_records(
+            {
+                "Position": [0, 0, 0],
+                "Year": [2019, 2020, 2021],
+                "Item": [
+                    "Banana (1kg)",
+                    "Banana (1kg)",
+                    "Mortgage Interest Rate in Percentages (%)",
+                ],
+                "Value": ["1.00", "1,000.00", "3.50"],
+            },
+            rates=rates,
+        )
+
+        assert converted_records["Year"] == [2019, 2020, 2021]
+        assert converted_records["Value"] == ["6.00", "5,000.00", "3.50"]
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
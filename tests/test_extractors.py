@@ -0,0 +1,98 @@
+import pickle
+import unittest
+
+from src.schema.input import Input
+from src.core.extractors import (
+    extract_cost_of_living_city,
+    extract_country_ranking,
+    extract_historical_data,
+    extract_others_city,
+    extract_pollution_city,
+    extract_quality_of_life_city,
+    extract_traffic_city,
+)
+from src.core.scraper import NumbeoScraper
+
+
+class TestExtractors(unittest.TestCase):
+    """
+    Unittest case to test the extractors used by the pipelined mode.
+    """
+
+    def test(self):
+        """
+        Test that each category uses the right extractor and that the
+        extractors can be sent to the worker processes.
+        """
+        scraper = NumbeoScraper(
+            config=Input(
+                categories=["crime", "historical-data"],
+                years=2019,
+                mode="country",
+                countries="Italy",
+                currency="EUR",
+                historical_items="Banana (1kg)",
+            )
+        )
+
+        country_extractor = scraper._category_extractor("crime")
+        historical_extractor = scraper._category_extractor("historical-data")
+
+        # the countries and years filters are passed to the extractors
+        assert country_extractor.func is extract_country_ranking
+        assert country_extractor.keywords == {
+            "countries": frozenset(["Italy"]),
+            "rank_by_region": False,
+        }
+        assert historical_extractor.func is extract_historical_data
+        assert historical_extractor.keywords == {"years": frozenset([2019])}
+        assert pickle.loads(pickle.dumps(country_extractor)).func is (
+            extract_country_ranking
+        )
+
+        page = (
+            "<table id='t2'><thead><tr><th>Rank</th><th>Country</th>"
+            + "<th>Crime Index</th></tr></thead><tbody>"
+            + "<tr><td></td><td>Brazil</td><td>67.9</td></tr>"
+            + "<tr><td></td><td>Italy</td><td>44.8</td></tr>"
+            + "<tr><td></td><td>Spain</td><td>33.1</td></tr>"
+            + "</tbody></table>"
+        )
+
+        assert country_extractor(page=page) == {
+            "Rank": ["2"],
+            "Country": ["Italy"],
+            "Crime Index": ["44.8"],
+        }
+        assert extract_country_ranking(
+            page=page,
+            countries=["Spain"],
+            rank_by_region=True,
+        ) == {"Rank": ["2"], "Country": ["Spain"], "Crime Index": ["33.1"]}
+
+        scraper = NumbeoScraper(
+            config=Input(
+                categories="crime",
+                years=2019,
+                mode="city",
+                cities="Rome",
+                currency="EUR",
+            )
+        )
+        extractors = {
+            "cost-of-living": extract_cost_of_living_city,
+            "property-investment": extract_cost_of_living_city,
+            "quality-of-life": extract_quality_of_life_city,
+            "traffic": extract_traffic_city,
+            "pollution": extract_pollution_city,
+            "crime": extract_others_city,
+            "health-care": extract_others_city,
+        }
+
+        for category, extractor in extractors.items():
+            assert scraper._category_extractor(category) is extractor
+            assert pickle.loads(pickle.dumps(extractor)) is extractor
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
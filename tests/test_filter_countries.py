@@ -25,6 +25,7 @@ class TestFilterCountries(unittest.TestCase):
             "Restaurant Price Index",
             "Local Purchasing Power Index",
             "Year",
+            "Region",
         ]
         selected_countries = [
             "Netherlands",
@@ -0,0 +1,59 @@
+import unittest
+
+from benchmarks.offline import FixtureScraper, load_fixtures
+from src.schema.input import Input
+
+
+class TestFixtures(unittest.TestCase):
+    """
+    Unittest case to test the scraper offline, using the benchmarks page corpus.
+    """
+
+    def test(self):
+        """
+        Test that the data of all the corpus pages is extracted
+        without requesting any page.
+        """
+        pages = load_fixtures()
+
+        assert len(pages) > 0
+
+        scraper = FixtureScraper(
+            config=Input(
+                categories=["cost-of-living", "crime", "quality-of-life", "traffic"],
+                mode="city",
+                years=2024,
+                cities=["Amsterdam", "sao paulo"],
+                currency="EUR",
+            ),
+            pages=pages,
+        )
+        dataframes = dict(scraper.scrap())
+
+        assert sorted(dataframes.keys()) == [
+            "cost-of-living_city",
+            "crime_city",
+            "quality-of-life_city",
+            "traffic_city",
+        ]
+
+        for dataframe in dataframes.values():
+            assert dataframe["City"].unique().tolist() == ["Amsterdam", "Sao-Paulo"]
+
+        scraper = FixtureScraper(
+            config=Input(
+                categories="pollution",
+                mode="country",
+                years=[2023, 2024],
+                regions="Europe",
+            ),
+            pages=pages,
+        )
+        dataframe = dict(scraper.scrap())["pollution_country"]
+
+        assert dataframe["Year"].unique().tolist() == [2023, 2024]
+        assert dataframe["Region"].unique().tolist() == ["Europe"]
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
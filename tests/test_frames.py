@@ -0,0 +1,80 @@
+import unittest
+
+import pandas as pd
+
+from src.core.frames import RowBuilder, concat_frames, pivot_records
+
+
+class TestFrames(unittest.TestCase):
+    """
+    Unittest case to test the columnar row builder.
+    """
+
+    def test(self):
+        """
+        Test that the rows are accumulated and the dataframe is created once.
+        """
+        builder = RowBuilder(columns=["Header", "Category", "Value"])
+
+        assert len(builder) == 0
+        assert builder.to_dataframe().columns.tolist() == [
+            "Header",
+            "Category",
+            "Value",
+        ]
+
+        builder.append(["Index", "Crime Index", "45.10"])
+        builder.extend(
+            {
+                "Header": ["Crime", "Crime"],
+                "Category": ["Level of crime", "Problem people using drugs"],
+                "Value": ["50.00", "61.20"],
+            }
+        )
+        builder.extend(None)  # the extractors return None when they fail
+
+        assert len(builder) == 3
+
+        dataframe = builder.to_dataframe()
+
+        assert dataframe.shape == (3, 3)
+        assert dataframe["Category"].tolist() == [
+            "Crime Index",
+            "Level of crime",
+            "Problem people using drugs",
+        ]
+
+        with self.assertRaises(ValueError):
+            builder.append(["Index", "Safety Index"])
+
+        with self.assertRaises(ValueError):
+            builder.extend({"Header": ["Crime"], "Category": [], "Value": []})
+
+        dataframes = concat_frames([dataframe, dataframe])
+
+        assert dataframes.shape == (6, 3)
+        assert dataframes.index.tolist() == list(range(6))
+        assert concat_frames([]).equals(pd.DataFrame())
+
+        # long-format records (the second country has no 'Banana' price)
+        wide = pivot_records(
+            {
+                "Position": [1, 0, 0, 0, 1],
+                "Year": [2020, 2020, 2019, 2020, 2020],
+                "Item": ["Jeans", "Jeans", "Jeans", "Banana", "Jeans"],
+                "Value": ["60.00", "55.10", "48.75", "1.90", "99.00"],
+            },
+            index=["Position", "Year"],
+            column="Item",
+            value="Value",
+        )
+
+        assert wide.columns.tolist() == ["Position", "Year", "Jeans", "Banana"]
+        assert wide["Position"].tolist() == [0, 0, 1]
+        assert wide["Year"].tolist() == [2019, 2020, 2020]
+        assert wide["Jeans"].tolist() == ["48.75", "55.10", "60.00"]
+        assert wide["Banana"].isna().tolist() == [True, False, True]
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
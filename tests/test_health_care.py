@@ -21,6 +21,7 @@ class TestHealthCare(unittest.TestCase):
             "Health Care Index",
             "Health CareExp. Index",
             "Year",
+            "Region",
         ]
 
         config = Input(
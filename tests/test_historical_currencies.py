@@ -0,0 +1,81 @@
+import unittest
+
+from benchmarks.server import StandInServer
+from src.core.scraper import NumbeoScraper
+from src.schema.input import Input
+
+
+def historical_page(item, prices):
+    """
+    Creates a historical data page of an item with the given prices per year.
+    """
+    body = "".join(
+        f'<tr><td>{year}</td><td style="text-align: right">{price}</td></tr>'
+        for year, price in prices.items()
+    )
+    return (
+        "<html><body>"
+        + f'<table id="t2"><thead><tr><th>Year</th><th>{item}</th></tr></thead>'
+        + f"<tbody>{body}</tbody></table></body></html>"
+    )
+
+
+class TestHistoricalCurrencies(unittest.TestCase):
+    """
+    Unittest case to test the conversion of the historical data to the other
+    currencies when the countries have different years.
+    """
+
+    def test(self):
+        """
+        Test that the exchange rates of the years that are only in the pages
+        of later countries are derived from those pages.
+        """
+        item = "Banana (1kg)"
+        url = "/cost-of-living/historical-data-country?itemId=118"
+        pages = {
+            # the first country doesn't have the 2021 data
+            f"{url}&country=Brazil&currency=EUR": historical_page(
+                item, {2019: "1.00", 2020: "2.00"}
+            ),
+            f"{url}&country=Brazil&currency=USD": historical_page(
+                item, {2019: "2.00", 2020: "4.00"}
+            ),
+            f"{url}&country=Japan&currency=EUR": historical_page(
+                item, {2019: "3.00", 2020: "4.00", 2021: "5.00"}
+            ),
+            f"{url}&country=Japan&currency=USD": historical_page(
+                item, {2019: "6.00", 2020: "8.00", 2021: "15.00"}
+            ),
+        }
+
+        with StandInServer(pages=pages) as server:
+            with NumbeoScraper(
+                config=Input(
+                    categories="historical-data",
+                    years=[2019, 2020, 2021],
+                    mode="country",
+                    countries=["Brazil", "Japan"],
+                    currency=["EUR", "USD"],
+                    historical_items=item,
+                ),
+                base_url=server.url,
+            ) as scraper:
+                dataframe = scraper.scrap()[0][1]
+
+            assert scraper.historical_exchange_rates["USD"] == {
+                2019: 2.0,
+                2020: 2.0,
+                2021: 3.0,
+            }
+
+        japan = dataframe[
+            (dataframe["Country"] == "Japan") & (dataframe["Currency Code"] == "USD")
+        ]
+
+        assert japan[item].astype(float).tolist() == [6.0, 8.0, 15.0]
+        assert server.stats["200"] == 4
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
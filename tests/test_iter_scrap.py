@@ -0,0 +1,63 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+import pandas as pd
+
+from src.schema.cache import CacheSettings
+from src.schema.input import Input
+from src.core.cache import ResponseCache
+from src.core.scraper import NumbeoScraper
+
+
+class TestIterScrap(unittest.TestCase):
+    """
+    Unittest case to test the streaming scraping (using only cached pages).
+    """
+
+    def test(self):
+        """
+        Test that the data of each page is yielded separately.
+        """
+        base_url = "https://www.numbeo.com/crime/rankings_by_country.jsp"
+        page = (
+            "<table id='t2'><thead><tr><th>Rank</th><th>Country</th>"
+            + "<th>Crime Index</th></tr></thead><tbody>"
+            + "<tr><td></td><td>Brazil</td><td>67.9</td></tr>"
+            + "<tr><td></td><td>Italy</td><td>44.8</td></tr>"
+            + "<tr><td></td><td>Spain</td><td>33.1</td></tr>"
+            + "</tbody></table>"
+        )
+
+        with tempfile.TemporaryDirectory() as folder:
+            cache_settings = CacheSettings(path=Path(folder))
+            cache = ResponseCache(cache_settings)
+            cache.put(f"{base_url}?title=2019", page)
+            cache.put(f"{base_url}?title=2020", page)
+            cache.close()
+
+            config = Input(
+                categories="crime",
+                years=[2019, 2020],
+                mode="country",
+                regions="Europe",
+            )
+
+            with NumbeoScraper(config=config, cache_settings=cache_settings) as scraper:
+                pages = list(scraper.iter_scrap(cache_policy="offline"))
+
+        assert [(category, mode, key) for category, mode, key, _ in pages] == [
+            ("crime", "country", (2019,)),
+            ("crime", "country", (2020,)),
+        ]
+
+        dataframe = pages[0][3]
+
+        assert isinstance(dataframe, pd.DataFrame)
+        assert dataframe["Country"].tolist() == ["Italy", "Spain"]
+        assert dataframe["Rank"].tolist() == ["1", "2"]
+        assert dataframe["Region"].tolist() == ["Europe", "Europe"]
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
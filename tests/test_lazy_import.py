@@ -0,0 +1,40 @@
+import subprocess
+import sys
+import unittest
+
+from src.core.utils import LazyModule, lazy_import
+
+
+class TestLazyImport(unittest.TestCase):
+    """
+    Unittest case to test that the heavy dependencies are imported lazily.
+    """
+
+    def test(self):
+        """
+        Test that importing the scraper doesn't import the heavy dependencies
+        and that they're imported when they're first used.
+        """
+        code = (
+            "import sys\n"
+            "import src.core.scraper\n"
+            "heavy = ['aiohttp', 'bs4', 'numpy', 'pandas', 'requests']\n"
+            "print([name for name in heavy if name in sys.modules])\n"
+        )
+        output = subprocess.run(
+            [sys.executable, "-c", code],
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
+
+        assert output.strip() == "[]"
+
+        module = LazyModule("json")
+
+        assert module.dumps({"a": 1}) == '{"a": 1}'
+        assert lazy_import("sys") is sys
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,54 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from loguru import logger
+
+from src.core.log import configure_logging
+from src.schema.log import LoggingSettings
+
+
+class TestLogging(unittest.TestCase):
+    """
+    Unittest case to test the explicit logging setup.
+    """
+
+    def test(self):
+        """
+        Test that the logging level, sink and sampling are set up
+        only when `configure_logging` is called.
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            log_path = Path(directory)
+
+            # importing the settings doesn't create any log file
+            assert list(log_path.iterdir()) == []
+
+            sink_id = configure_logging(
+                LoggingSettings(
+                    LOG_LEVEL="INFO",
+                    LOG_PATH=log_path,
+                    LOG_SAMPLING=3,
+                )
+            )
+
+            for page in range(6):
+                logger.info(f"Found 10 data rows for page {page}.\n")
+
+            logger.debug("Not logged.\n")
+            logger.warning("Always logged.\n")
+            logger.remove(sink_id)
+
+            lines = (log_path / "loguru.log").read_text().splitlines()
+            lines = [line for line in lines if line.strip() != ""]
+
+            assert len(lines) == 3
+            assert "page 0" in lines[0] and "page 3" in lines[1]
+            assert "Always logged" in lines[2]
+
+        # restoring the default sink
+        configure_logging()
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
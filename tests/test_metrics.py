@@ -0,0 +1,89 @@
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from benchmarks.offline import load_fixtures
+from benchmarks.server import StandInServer
+from src.core.metrics import Histogram
+from src.core.scraper import NumbeoScraper
+from src.schema.input import Input
+from src.schema.metrics import MetricsSettings
+
+
+class TestMetrics(unittest.TestCase):
+    """
+    Unittest case to test the per-stage timing metrics.
+    """
+
+    def test(self):
+        """
+        Test that the time spent in each stage of each page is recorded,
+        aggregated per category and mode, and exported.
+        """
+        histogram = Histogram([0.1, 1.0])
+
+        for value in [0.05, 0.1, 0.5, 2.0]:
+            histogram.observe(value)
+
+        assert histogram.cumulative_counts() == {"0.1": 2, "1.0": 3, "+Inf": 4}
+        assert histogram.count == 4
+
+        observed = []
+
+        with tempfile.TemporaryDirectory() as folder:
+            path = Path(folder) / "metrics.prom"
+
+            with StandInServer(pages=load_fixtures()) as server:
+                with NumbeoScraper(
+                    config=Input(
+                        categories=["crime", "traffic"],
+                        mode="city",
+                        years=2024,
+                        cities=["Amsterdam", "Tokyo"],
+                    ),
+                    metrics_settings=MetricsSettings(path=path),
+                    base_url=server.url,
+                ) as scraper:
+                    scraper.metrics.add_hook(
+                        lambda metric, *args: observed.append(metric)
+                    )
+                    scraper.scrap()
+
+            metrics = scraper.metrics.to_dict()
+            pages = metrics["pages"]
+
+            assert len(pages) == 4
+
+            for url, page in pages.items():
+                assert page["mode"] == "city"
+                assert page["category"] == url.split("/")[3]
+
+                for stage in ["ttfb", "download", "bytes", "parse", "extract", "frame"]:
+                    assert page[stage] >= 0
+
+            counts = {
+                (histogram["metric"], histogram["category"]): histogram["count"]
+                for histogram in metrics["histograms"]
+            }
+
+            assert counts[("ttfb", "crime")] == 2
+            assert counts[("parse", "traffic")] == 2
+            assert set(observed) >= {"ttfb", "download", "bytes", "parse", "extract"}
+
+            # the Prometheus text file is written after the run
+            text = path.read_text(encoding="utf-8")
+
+            assert "# TYPE numbeo_scraper_ttfb_seconds histogram" in text
+            assert (
+                'numbeo_scraper_parse_seconds_count{category="crime",mode="city"} 2'
+                in text
+            )
+
+            json_path = scraper.metrics.export(Path(folder) / "metrics.json", "json")
+
+            assert json.loads(json_path.read_text(encoding="utf-8")) == metrics
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,62 @@
+import unittest
+
+from src.schema.input import Input
+from src.schema.parser import ParserSettings
+from src.core.extractors import extract_country_ranking
+from src.core.parser import RANKING_TABLE, is_backend_available, parse_page
+from src.core.scraper import NumbeoScraper
+
+
+class TestParser(unittest.TestCase):
+    """
+    Unittest case to test the HTML parser backends and targeted parsing.
+    """
+
+    def test(self):
+        """
+        Test that only the relevant parts of the page are parsed.
+        """
+        page = (
+            "<html><body><div><a class='discreet_link'>Menu</a></div>"
+            + "<table id='t2'><thead><tr><th>Rank</th><th>Country</th></tr></thead>"
+            + "<tbody><tr><td></td><td>Italy</td></tr></tbody></table>"
+            + "</body></html>"
+        )
+
+        assert is_backend_available("html.parser")
+        assert not is_backend_available("WRONG_BACKEND")
+
+        numbeo_html_data = parse_page(page, parse_only=RANKING_TABLE)
+
+        assert numbeo_html_data.find("a") is None
+        assert (
+            numbeo_html_data.find("table", attrs={"id": "t2"}).find_all("td")[1].text
+            == "Italy"
+        )
+
+        assert parse_page(page).find("a") is not None
+
+        for parse_only in [True, False]:
+            assert extract_country_ranking(page, parse_only=parse_only) == {
+                "Rank": ["1"],
+                "Country": ["Italy"],
+            }
+
+        config = Input(
+            categories="crime",
+            years=2019,
+            mode="country",
+        )
+
+        with self.assertRaises(AssertionError):
+            NumbeoScraper(
+                config=config,
+                parser_settings=ParserSettings.model_construct(
+                    backend="WRONG_BACKEND",
+                    parse_only=True,
+                ),
+            )
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,133 @@
+import multiprocessing
+import unittest
+from functools import partial
+
+import pandas as pd
+from benchmarks.offline import FixtureScraper, load_fixtures
+from benchmarks.server import StandInServer
+from src.core.scraper import NumbeoScraper
+from src.schema.input import Input
+from src.schema.parser import ParserSettings
+
+
+def extract_in_main_process(extractor, **kwargs):
+    """
+    Extracts the data of a page, failing when it runs in a worker process.
+    """
+    if not multiprocessing.parent_process() is None:
+        raise RuntimeError("The worker process failed.")
+
+    return extractor(**kwargs)
+
+
+class FailingWorkersScraper(NumbeoScraper):
+    """
+    Scraper whose extractors always fail in the worker processes.
+    """
+
+    def _category_extractor(self, category):
+        extractor = super()._category_extractor(category)
+        return partial(extract_in_main_process, extractor)
+
+
+class BrokenPoolScraper(NumbeoScraper):
+    """
+    Scraper whose pool of processes can't extract any page.
+    """
+
+    def _get_parsers(self):
+        parsers = super()._get_parsers()
+        parsers.shutdown()
+        return parsers
+
+
+class CountingPoolScraper(NumbeoScraper):
+    """
+    Scraper that counts how many pools of processes were started.
+    """
+
+    pools = 0
+
+    def _get_parsers(self):
+        if self._parsers is None:
+            CountingPoolScraper.pools += 1
+
+        return super()._get_parsers()
+
+
+class TestPipeline(unittest.TestCase):
+    """
+    Unittest case to test the pipelined mode when the worker processes fail.
+    """
+
+    def test(self):
+        """
+        Test that the pages whose extraction failed in a worker process are
+        extracted in the main process without being requested again.
+        """
+        pages = load_fixtures()
+        config = Input(
+            categories="crime",
+            mode="city",
+            years=2024,
+            cities=["Amsterdam", "Tokyo"],
+        )
+        expected = dict(FixtureScraper(config=config, pages=pages).scrap())
+
+        with StandInServer(pages=pages) as server:
+            with FailingWorkersScraper(
+                config=config,
+                parser_settings=ParserSettings(workers=2),
+                base_url=server.url,
+            ) as scraper:
+                dataframes = dict(scraper.scrap())
+
+        pd.testing.assert_frame_equal(
+            dataframes["crime_city"],
+            expected["crime_city"],
+        )
+
+        # each page was requested once
+        assert server.stats["200"] == 2
+        assert len(server.requested_paths) == 2
+
+        # when the pool is broken, the pages are extracted in the main process
+        # (more pages than the pending pages limit, so the fetchers don't hang)
+        config = Input(
+            categories=["crime", "traffic"],
+            mode="city",
+            years=2024,
+            cities=["Amsterdam", "Tokyo"],
+        )
+        expected = dict(FixtureScraper(config=config, pages=pages).scrap())
+
+        with StandInServer(pages=pages) as server:
+            with BrokenPoolScraper(
+                config=config,
+                parser_settings=ParserSettings(workers=1),
+                base_url=server.url,
+            ) as scraper:
+                dataframes = dict(scraper.scrap())
+
+        for name, dataframe in expected.items():
+            pd.testing.assert_frame_equal(dataframes[name], dataframe)
+
+        assert server.stats["200"] == 4
+
+        # the same pool is used by all the categories of a run
+        with StandInServer(pages=pages) as server:
+            with CountingPoolScraper(
+                config=config,
+                parser_settings=ParserSettings(workers=2),
+                base_url=server.url,
+            ) as scraper:
+                results = list(scraper.iter_scrap())
+
+                assert scraper._parsers is None
+
+        assert len(results) == 4
+        assert CountingPoolScraper.pools == 1
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
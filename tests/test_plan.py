@@ -0,0 +1,58 @@
+import unittest
+
+from src.schema.input import Input
+from src.schema.session import SessionSettings
+from src.core.scraper import NumbeoScraper
+
+
+class TestPlan(unittest.TestCase):
+    """
+    Unittest case to test the request plan (dry-run).
+    """
+
+    def test(self):
+        """
+        Test the deduplicated pages, filters and estimated time.
+        """
+        config = Input(
+            categories=["crime", "crime", "health-care"],
+            years=[2019, 2020, 2019],
+            mode="country",
+            countries=["Italy", "Brazil"],
+        )
+
+        scraper = NumbeoScraper(
+            config=config,
+            session_settings=SessionSettings(max_concurrency=2),
+        )
+        request_plan = scraper.plan(latency=0.5)
+
+        assert [(unit.category, unit.key) for unit in request_plan.units] == [
+            ("crime", (2019,)),
+            ("crime", (2020,)),
+            ("health-care", (2019,)),
+            ("health-care", (2020,)),
+        ]
+        assert request_plan.request_count == 4
+        assert request_plan.estimated_time == 1.0
+        assert request_plan.filters == {
+            "crime": {"Country": ["Italy", "Brazil"]},
+            "health-care": {"Country": ["Italy", "Brazil"]},
+        }
+
+        config = Input(
+            categories="traffic",
+            years=2019,
+            mode="city",
+            cities=["Sao Paulo", "sao paulo", "Rome"],
+        )
+        request_plan = NumbeoScraper(config=config).plan()
+
+        assert request_plan.urls == [
+            "https://www.numbeo.com/traffic/in/Sao-Paulo",
+            "https://www.numbeo.com/traffic/in/Rome",
+        ]
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -21,6 +21,7 @@ class TestPollution(unittest.TestCase):
             "Pollution Index",
             "Exp Pollution Index",
             "Year",
+            "Region",
         ]
 
         config = Input(
@@ -26,6 +26,7 @@ class TestPropertyInvestment(unittest.TestCase):
             "Mortgage As A Percentage Of Income",
             "Affordability Index",
             "Year",
+            "Region",
         ]
 
         config = Input(
@@ -28,6 +28,7 @@ class TestQualityOfLife(unittest.TestCase):
             "Pollution Index",
             "Climate Index",
             "Year",
+            "Region",
         ]
 
         config = Input(
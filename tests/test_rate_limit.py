@@ -0,0 +1,56 @@
+import unittest
+
+from src.core.rate_limit import RateLimiter, parse_retry_after
+from src.schema.rate_limit import RateLimitSettings
+
+
+class TestRateLimit(unittest.TestCase):
+    """
+    Unittest case to test the adaptive rate limiter.
+    """
+
+    def test(self):
+        """
+        Test the AIMD control, the 'Retry-After' header and the backoff.
+        """
+        settings = RateLimitSettings(
+            rate=4.0,
+            min_rate=1.0,
+            max_rate=5.0,
+            rate_increase=0.5,
+            rate_decrease=0.5,
+            backoff_factor=1.0,
+            max_backoff=10.0,
+        )
+        rate_limiter = RateLimiter(settings=settings, max_concurrency=8)
+
+        rate_limiter.acquire()
+        assert rate_limiter.in_flight == 1
+
+        # multiplicative decrease when throttled
+        rate_limiter.release(429, "2")
+        assert rate_limiter.in_flight == 0
+        assert rate_limiter.rate == 2.0
+        assert rate_limiter.concurrency == 4
+        assert rate_limiter._try_acquire() > 1.0  # paused by 'Retry-After'
+
+        # additive increase while the requests succeed
+        for _ in range(4):
+            rate_limiter.in_flight += 1
+            rate_limiter.release(200)
+
+        assert rate_limiter.rate == 4.0
+        assert rate_limiter.concurrency == 5
+
+        assert parse_retry_after("10") == 10.0
+        assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+        assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 -0000") == 0.0
+        assert parse_retry_after("Wed, 21 Oct 2099 07:28:00 -0000") > 0.0
+        assert parse_retry_after("invalid") is None
+        assert 1.0 <= rate_limiter.backoff(1) <= 2.0
+        assert 4.0 <= rate_limiter.backoff(3) <= 5.0
+        assert rate_limiter.backoff(10) == 10.0
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
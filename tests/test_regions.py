@@ -0,0 +1,47 @@
+import unittest
+from typing import get_args
+
+from src.schema.input import Input, VALID_COUNTRIES
+from src.core.scraper import NumbeoScraper
+from src.core.utils import (
+    COUNTRIES_REGIONS_MAPPING,
+    REGIONS_COUNTRIES,
+    REGIONS_MAPPING,
+)
+
+
+class TestRegions(unittest.TestCase):
+    """
+    Unittest case to test the countries regions mapping.
+    """
+
+    def test(self):
+        """
+        Test the mapping and that the regions do not add any request.
+        """
+        assert sorted(REGIONS_COUNTRIES.keys()) == sorted(REGIONS_MAPPING.keys())
+        assert sorted(COUNTRIES_REGIONS_MAPPING.keys()) == sorted(
+            get_args(VALID_COUNTRIES)
+        )
+        assert COUNTRIES_REGIONS_MAPPING["Brazil"] == "America"
+        assert COUNTRIES_REGIONS_MAPPING["Italy"] == "Europe"
+
+        config = Input(
+            categories="crime",
+            years=[2019, 2020],
+            mode="country",
+            regions=["Europe", "Africa"],
+        )
+        request_plan = NumbeoScraper(config=config).plan()
+
+        assert request_plan.urls == [
+            "https://www.numbeo.com/crime/rankings_by_country.jsp?title=2019",
+            "https://www.numbeo.com/crime/rankings_by_country.jsp?title=2020",
+        ]
+        assert request_plan.filters == {
+            "crime": {"Region": ["Europe", "Africa"]},
+        }
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,89 @@
+import unittest
+
+import pandas as pd
+from benchmarks.offline import FixtureScraper, load_fixtures
+from benchmarks.server import ServerSettings, StandInServer
+from src.core.scraper import NumbeoScraper
+from src.schema.input import Input
+from src.schema.rate_limit import RateLimitSettings
+from src.schema.session import SessionSettings
+
+
+class TestServer(unittest.TestCase):
+    """
+    Unittest case to test the scraper against the local stand-in server.
+    """
+
+    def test(self):
+        """
+        Test that the pages scraped from the stand-in server are the same as
+        the corpus pages, and that the injected failures are retried.
+        """
+        pages = load_fixtures()
+        config = Input(
+            categories=["crime", "traffic"],
+            mode="city",
+            years=2024,
+            cities=["Amsterdam", "Tokyo"],
+            currency="EUR",
+        )
+        expected = dict(FixtureScraper(config=config, pages=pages).scrap())
+
+        with StandInServer(pages=pages) as server:
+            with NumbeoScraper(config=config, base_url=server.url) as scraper:
+                dataframes = dict(scraper.scrap())
+
+        assert sorted(dataframes.keys()) == sorted(expected.keys())
+
+        for key, dataframe in dataframes.items():
+            pd.testing.assert_frame_equal(dataframe, expected[key])
+
+        assert server.stats["200"] == 4
+        assert server.requested_paths == server.served_paths
+
+        # every request is throttled, so no page is served
+        settings = ServerSettings(throttle_rate=1.0)
+
+        with StandInServer(settings=settings, pages=pages) as server:
+            with NumbeoScraper(config=config, base_url=server.url) as scraper:
+                dataframes = dict(scraper.scrap())
+
+        for dataframe in dataframes.values():
+            assert dataframe.empty
+        assert server.stats["429"] == 4
+        assert len(server.served_paths) == 0
+
+        # half of the requests fail, but they are retried until they succeed
+        settings = ServerSettings(throttle_rate=0.25, error_rate=0.25, seed=42)
+        rate_limit_settings = RateLimitSettings(
+            rate=100.0,
+            max_rate=100.0,
+            max_retries=20,
+            backoff_factor=0.01,
+            max_backoff=0.05,
+        )
+
+        with StandInServer(settings=settings, pages=pages) as server:
+            with NumbeoScraper(
+                config=config,
+                session_settings=SessionSettings(max_concurrency=4),
+                rate_limit_settings=rate_limit_settings,
+                base_url=server.url,
+            ) as scraper:
+                dataframes = dict(scraper.scrap())
+
+        assert sorted(dataframes.keys()) == sorted(expected.keys())
+
+        for key, dataframe in dataframes.items():
+            pd.testing.assert_frame_equal(dataframe, expected[key])
+
+        assert server.stats["200"] == 4
+        assert (
+            sum(count for status, count in server.stats.items() if status[0] in "45")
+            > 0
+        )
+        assert server.requested_paths == server.served_paths
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
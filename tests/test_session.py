@@ -0,0 +1,57 @@
+import unittest
+
+from src.schema.input import Input
+from src.schema.session import SessionSettings
+from src.core.scraper import NumbeoScraper
+
+
+class TestSession(unittest.TestCase):
+    """
+    Unittest case to test the pooled HTTP session.
+    """
+
+    def test(self):
+        """
+        Test the session creation, reuse and closing.
+        """
+        config = Input(
+            categories="cost-of-living",
+            years=2019,
+            mode="country",
+        )
+
+        session_settings = SessionSettings(
+            pool_connections=4,
+            pool_maxsize=8,
+            keep_alive=False,
+            compression=False,
+        )
+
+        with NumbeoScraper(
+            config=config,
+            session_settings=session_settings,
+        ) as scraper:
+            session = scraper._get_session()
+
+            assert session is scraper._get_session()
+            assert session.get_adapter("https://www.numbeo.com")._pool_maxsize == 8
+            assert session.headers["Connection"] == "close"
+            assert session.headers["Accept-Encoding"] == "identity"
+
+        assert scraper.session is None
+
+        # the requests default 'User-Agent' is kept unless it's set
+        with NumbeoScraper(config=config) as scraper:
+            user_agent = scraper._get_session().headers["User-Agent"]
+
+            assert user_agent.startswith("python-requests/")
+
+        with NumbeoScraper(
+            config=config,
+            session_settings=SessionSettings(headers={"User-Agent": "custom"}),
+        ) as scraper:
+            assert scraper._get_session().headers["User-Agent"] == "custom"
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,72 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+import pandas as pd
+
+from src.schema.sink import SinkSettings
+from src.core.sink import DatasetSink
+
+
+class TestSink(unittest.TestCase):
+    """
+    Unittest case to test the partitioned dataset sink.
+    """
+
+    def test(self):
+        """
+        Test that the data is appended to its partitions and read back.
+        """
+        pages = [
+            (
+                "crime",
+                "country",
+                (year,),
+                pd.DataFrame(
+                    {
+                        "Rank": ["1", "2"],
+                        "Country": ["Italy", "Spain"],
+                        "Crime Index": ["44.8", None],
+                        "Year": [year, year],
+                    }
+                ),
+            )
+            for year in [2019, 2020]
+        ]
+
+        for format in ["parquet", "arrow"]:
+            with tempfile.TemporaryDirectory() as folder:
+                sink = DatasetSink(SinkSettings(path=Path(folder), format=format))
+                paths = sink.write_pages(pages)
+
+                assert len(paths) == 2
+                assert paths[0].parent == (
+                    Path(folder) / "category=crime" / "mode=country" / "Year=2019"
+                )
+
+                # appending the same data again and reading a single partition
+                sink.write_pages(pages)
+                dataframe = sink.read("crime", "country", values=[2020])
+
+                assert dataframe.columns.tolist() == [
+                    "Rank",
+                    "Country",
+                    "Crime Index",
+                    "Year",
+                ]
+                assert dataframe["Year"].tolist() == [2020] * 4
+                assert dataframe["Crime Index"].isna().sum() == 2
+
+                sink = DatasetSink(
+                    SinkSettings(path=Path(folder), format=format, mode="overwrite")
+                )
+                sink.write_dataframes(
+                    [("crime_country", pd.concat([page[3] for page in pages]))]
+                )
+
+                assert sink.read("crime", "country").shape == (4, 4)
+                assert sink.read("traffic", "country").empty
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -24,6 +24,7 @@ class TestTraffic(unittest.TestCase):
             "Inefficiency Index",
             "CO2 Emission Index",
             "Year",
+            "Region",
         ]
 
         config = Input(
@@ -0,0 +1,65 @@
+import unittest
+
+import pandas as pd
+
+from src.core.convert import to_typed_frame
+
+
+class TestTypedOutput(unittest.TestCase):
+    """
+    Unittest case to test the conversion of the values to numbers.
+    """
+
+    def test(self):
+        """
+        Test that the values, ranges and ranks are converted to numbers.
+        """
+        dataframe = pd.DataFrame(
+            {
+                "Header": ["Restaurants", "Restaurants", "Restaurants"],
+                "Category": ["Meal", "Cappuccino", "Water"],
+                "Mean": ["1,234.56\xa0€", "3.10 €", "?"],
+                "Range": ["900.00-1,500.00", "2.50-4.00", ""],
+                "City": ["Rome", "Rome", "Rome"],
+            }
+        )
+        typed_dataframe = to_typed_frame(dataframe, float_dtype="float32")
+
+        assert typed_dataframe.columns.tolist() == [
+            "Header",
+            "Category",
+            "Mean",
+            "Currency",
+            "Range Low",
+            "Range High",
+            "City",
+        ]
+        assert typed_dataframe["Mean"].dtype == "float32"
+        assert typed_dataframe["Mean"].tolist()[:2] == (
+            pd.Series([1234.56, 3.10], dtype="float32").tolist()
+        )
+        assert typed_dataframe["Mean"].isna().tolist() == [False, False, True]
+        assert typed_dataframe["Currency"].tolist()[:2] == ["€", "€"]
+        assert pd.isna(typed_dataframe["Currency"].iloc[2])
+        assert typed_dataframe["Range Low"].tolist()[:2] == [900.0, 2.5]
+        assert typed_dataframe["Range High"].tolist()[:2] == [1500.0, 4.0]
+
+        dataframe = pd.DataFrame(
+            {
+                "Rank": ["1", "2"],
+                "Country": ["Italy", "Spain"],
+                "Crime Index": ["44.80", "33.10"],
+                "Year": ["2020-mid", "2020-mid"],
+            }
+        )
+        typed_dataframe = to_typed_frame(dataframe)
+
+        assert typed_dataframe["Rank"].dtype == "Int64"
+        assert typed_dataframe["Rank"].tolist() == [1, 2]
+        assert typed_dataframe["Crime Index"].tolist() == [44.8, 33.1]
+        assert typed_dataframe["Year"].tolist() == ["2020-mid", "2020-mid"]
+        assert to_typed_frame(pd.DataFrame()).empty
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)